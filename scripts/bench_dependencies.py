@@ -0,0 +1,105 @@
+"""Benchmark overhead dependency per request: graph per request vs singleton.
+
+`per_request` meniru susunan lama `src/deps`: dependency sync (dijalankan di
+threadpool) yang membangun HttpRequestService, ResponseHandlerFactory,
+DigiposAuthService dan DGCommandServices baru tiap request. `singleton` memakai
+`get_digipos_command_service` sekarang (lookup async ke `app.state.services`).
+
+Route benchmark tidak memanggil upstream, jadi selisihnya murni biaya DI.
+Jalankan dari root repo:
+
+    python scripts/bench_dependencies.py [jumlah_request]
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path[:0] = [str(ROOT), str(ROOT / "src")]
+
+import httpx  # noqa: E402
+from fastapi import Depends, FastAPI, Request, Response  # noqa: E402
+from src.core.client.base_manager import HttpClientManager  # noqa: E402
+from src.core.config.cfg_api_clients import DigiposConfig  # noqa: E402
+from src.core.config.settings import AppSettings  # noqa: E402
+from src.deps.container import build_digipos_services, build_services  # noqa: E402
+from src.deps.dep_digipos import get_digipos_command_service  # noqa: E402
+from src.servicess.digipos.command_service import DGCommandServices  # noqa: E402
+
+from servicess.client.response import ResponseHandlerFactory  # noqa: E402
+
+CONFIG = DigiposConfig(
+    name="digipos",
+    base_url="http://digipos.invalid",
+    accounts=[{"username": "bench", "password": "x", "pin": "1"}],
+    warmup={"connections": 0},
+    health={"enabled": False},
+)
+
+
+# --- susunan lama: rantai dependency sync, object baru per request ---
+def _settings(request: Request) -> AppSettings:
+    return request.app.state.settings
+
+
+def _manager(request: Request) -> HttpClientManager:
+    return request.app.state.api_manager
+
+
+def _config(settings: AppSettings = Depends(_settings)) -> DigiposConfig:
+    return settings.digipos
+
+
+def _response_handler() -> ResponseHandlerFactory:
+    return ResponseHandlerFactory()
+
+
+def _command_service(
+    config: DigiposConfig = Depends(_config),
+    response_handler: ResponseHandlerFactory = Depends(_response_handler),
+    manager: HttpClientManager = Depends(_manager),
+) -> DGCommandServices:
+    return build_digipos_services(config, manager, response_handler).command
+
+
+def build_app(manager: HttpClientManager) -> FastAPI:
+    """App dengan dua route identik, beda hanya cara resolve service."""
+    app = FastAPI()
+    app.state.settings = SimpleNamespace(digipos=CONFIG)
+    app.state.api_manager = manager
+    app.state.services = build_services(app.state.settings, manager)
+
+    @app.get("/per_request", dependencies=[Depends(_command_service)])
+    async def per_request():
+        return Response()
+
+    @app.get("/singleton", dependencies=[Depends(get_digipos_command_service)])
+    async def singleton():
+        return Response()
+
+    return app
+
+
+async def main(number: int = 5_000) -> None:
+    """Print waktu per request (µs) untuk tiap varian."""
+    manager = HttpClientManager()
+    manager.setup_client(CONFIG)
+    app = build_app(manager)
+    transport = httpx.ASGITransport(app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://t") as client:
+        for path in ("/per_request", "/singleton"):
+            for _ in range(200):  # warm-up
+                await client.get(path)
+            start = time.perf_counter()
+            for _ in range(number):
+                await client.get(path)
+            per_request_us = (time.perf_counter() - start) / number * 1e6
+            print(f"{path:<14} {per_request_us:8.1f} µs/request")  # noqa: T201
+    await manager.stop_all()
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000))
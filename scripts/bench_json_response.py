@@ -0,0 +1,76 @@
+"""Benchmark encoding response JSON: jalur FastAPI default vs FastJSONResponse.
+
+Jalankan dari root repo:
+
+    python scripts/bench_json_response.py [jumlah_iterasi]
+"""
+
+import sys
+from pathlib import Path
+from timeit import timeit
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path[:0] = [str(ROOT), str(ROOT / "src")]
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from src.custom.exceptions import HttpResponseError  # noqa: E402
+from src.custom.responses import JSON_ENCODER, FastJSONResponse  # noqa: E402
+
+from servicess.client.depre_cated_response_model import (  # noqa: E402
+    ApiErrorParsing,
+    ApiResponseOUT,
+    CleanAndParseStatus,
+)
+from servicess.digipos.sch_digipos import DGResBalance  # noqa: E402
+
+BALANCE = ApiResponseOUT[DGResBalance](
+    status_code=200,
+    url="digipos.example",
+    path="/balance",
+    debug=False,
+    meta={"with_meta": False, "stale": False, "age_s": 1.2},
+    parse=CleanAndParseStatus.SUCCESS,
+    data=DGResBalance(
+        ngrs={"saldo": "1500000", "bonus": "25000", "status": "ACTIVE"},
+        linkaja="350000",
+        finpay="120000",
+    ),
+    description=None,
+)
+ERROR = HttpResponseError(
+    message="Bad status: 502",
+    context={"endpoint": "balance", "status_code": 502, "body": "x" * 200},
+).to_dict()
+
+# route /balance: response_model di-validate ulang lalu dump_json (FastAPI >=0.1xx)
+_ROUTE_MODEL = TypeAdapter(ApiResponseOUT[DGResBalance | ApiErrorParsing] | str)
+
+CASES = {
+    "balance | jsonable_encoder + JSONResponse": lambda: JSONResponse(
+        jsonable_encoder(BALANCE)
+    ),
+    "balance | response_model validate + dump_json": lambda: _ROUTE_MODEL.dump_json(
+        _ROUTE_MODEL.validate_python(BALANCE)
+    ),
+    "balance | jsonable_encoder + FastJSONResponse": lambda: FastJSONResponse(
+        jsonable_encoder(BALANCE)
+    ),
+    "balance | FastJSONResponse(model)": lambda: FastJSONResponse(BALANCE),
+    "error   | JSONResponse(to_dict())": lambda: JSONResponse(ERROR),
+    "error   | FastJSONResponse(to_dict())": lambda: FastJSONResponse(ERROR),
+}
+
+
+def main(number: int = 20_000) -> None:
+    """Print waktu per call (µs) untuk tiap jalur encoding."""
+    print(f"encoder={JSON_ENCODER} iterasi={number}")  # noqa: T201
+    for name, case in CASES.items():
+        case()  # warm-up
+        per_call_us = timeit(case, number=number) / number * 1e6
+        print(f"{name:<48} {per_call_us:8.2f} µs")  # noqa: T201
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20_000)
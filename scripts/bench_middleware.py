@@ -0,0 +1,100 @@
+"""Benchmark overhead LoggingMiddleware per request.
+
+Membandingkan app tanpa middleware, versi lama (BaseHTTPMiddleware, dua INFO
+per request) dan LoggingMiddleware pure ASGI dengan beberapa sample rate.
+Log ditulis ke sink serialize (JSON) yang dibuang, mirip sink file di
+logging.yaml tanpa biaya I/O disk. Jalankan dari root repo:
+
+    python scripts/bench_middleware.py [jumlah_request]
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path[:0] = [str(ROOT), str(ROOT / "src")]
+
+import httpx  # noqa: E402
+from fastapi import FastAPI, Request, Response  # noqa: E402
+from loguru import logger  # noqa: E402
+from src.core.config.settings import AccessLogSettings  # noqa: E402
+from src.custom.middlewares import LoggingMiddleware  # noqa: E402
+from starlette.middleware.base import (  # noqa: E402
+    BaseHTTPMiddleware,
+    RequestResponseEndpoint,
+)
+
+
+class LegacyLoggingMiddleware(BaseHTTPMiddleware):
+    """Salinan LoggingMiddleware sebelum ditulis ulang sebagai pure ASGI."""
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint):
+        start_time = time.perf_counter()
+        logger.bind(
+            path=request.url.path,
+            method=request.method,
+            client=request.client.host if request.client else "unknown",
+            query_params=dict(request.query_params),
+        ).info("Incoming request")
+        response = await call_next(request)
+        process_time = time.perf_counter() - start_time
+        logger.bind(
+            status_code=response.status_code,
+            path=request.url.path,
+            process_time=process_time,
+        ).info("Response sent")
+        response.headers["X-Process-Time"] = str(process_time)
+        return response
+
+
+def build_app(middleware: type | None = None, **options) -> FastAPI:
+    """App dengan satu route kosong; hanya middleware yang berbeda."""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return Response(b"pong")
+
+    if middleware is not None:
+        app.add_middleware(middleware, **options)
+    return app
+
+
+VARIANTS = {
+    "no middleware": build_app(),
+    "BaseHTTPMiddleware (lama)": build_app(LegacyLoggingMiddleware),
+    "pure ASGI, sample 100%": build_app(LoggingMiddleware),
+    "pure ASGI, sample 10%": build_app(
+        LoggingMiddleware, config=AccessLogSettings(sample_rate=0.1)
+    ),
+    "pure ASGI, sample 0%": build_app(
+        LoggingMiddleware, config=AccessLogSettings(sample_rate=0)
+    ),
+}
+
+
+async def main(number: int = 5_000) -> None:
+    """Print waktu per request (µs) dan selisih terhadap tanpa middleware."""
+    logger.remove()
+    logger.add(lambda _: None, level="INFO", serialize=True)
+    baseline = None
+    for name, app in VARIANTS.items():
+        transport = httpx.ASGITransport(app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://t") as c:
+            for _ in range(200):  # warm-up
+                await c.get("/ping?username=bench")
+            start = time.perf_counter()
+            for _ in range(number):
+                await c.get("/ping?username=bench")
+        per_request_us = (time.perf_counter() - start) / number * 1e6
+        baseline = baseline or per_request_us
+        print(  # noqa: T201
+            f"{name:<28} {per_request_us:8.1f} µs/request "
+            f"(+{per_request_us - baseline:6.1f} µs)"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000))
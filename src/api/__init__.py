@@ -1,9 +1,11 @@
 # from src.api.v1.dev import router as router_dev
 from api.v1.dgp_account import router as router_digipos
 from api.v1.dev import router as router_dev
+from api.v1.health import router as router_health
 
 
 def register_api_v1(app):
     app.include_router(router_digipos)
     app.include_router(router_dev)
+    app.include_router(router_health)
     return app
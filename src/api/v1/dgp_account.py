@@ -1,19 +1,25 @@
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from deps.dep_digipos import (
     DepDigiposCommandService,
+    digipos_deadline,
 )
 from servicess.client.depre_cated_response_model import ApiResponseOUT
 from servicess.digipos.sch_digipos import (
+    DGReqBalanceBatch,
     DGReqSimStatus,
     DGReqUsername,
     DGReqUsnOtp,
     DGReqUsnPass,
     DGResBalance,
 )
-from servicess.parser.parser_utils import ApiErrorParsing, dict_to_plaintext
+from servicess.parser.parser_utils import ApiErrorParsing
+from servicess.parser.plaintext import plaintext
+from src.custom.negotiation import DepResponseFormat, negotiator
+from src.custom.responses import json_dumps
 from src.tag import Tags as Tag
 
 router = APIRouter(
@@ -25,30 +31,34 @@ router = APIRouter(
     path="/login",
     summary="Forward login command to Digipos API",
     tags=[Tag.digipos_account],
+    dependencies=[digipos_deadline("login")],
 )
 async def get_login(
     query: Annotated[DGReqUsnPass, Depends()],
     service: DepDigiposCommandService,
+    fmt: DepResponseFormat,
 ):
     """Get login ke digipos Account API."""
     response_model = await service.login(query)
 
-    return response_model
+    return negotiator.render(response_model, fmt)
 
 
 @router.get(
     path="/verify_otp",
     summary="Forward verify OTP command to Digipos API",
     tags=[Tag.digipos_account],
+    dependencies=[digipos_deadline("verify_otp")],
 )
 async def get_verify_otp(
     query: Annotated[DGReqUsnOtp, Depends()],
     service: DepDigiposCommandService,
+    fmt: DepResponseFormat,
 ):
     """Get verify OTP ke digipos Account API."""
     response_model = await service.verify_otp(query)
 
-    return response_model
+    return negotiator.render(response_model, fmt)
 
 
 @router.get(
@@ -56,114 +66,148 @@ async def get_verify_otp(
     summary="Forward Balance command to Digipos API",
     response_model=ApiResponseOUT[DGResBalance | ApiErrorParsing] | str,
     tags=[Tag.digipos_account],
+    dependencies=[digipos_deadline("balance")],
 )
 async def get_balance(
     query: Annotated[
         DGReqUsername, Query()
     ],  # Anggap query sekarang punya field 'text'
     service: DepDigiposCommandService,
+    fmt: DepResponseFormat,
 ):
     """Forward `get` balance ke Account Digipos API.
 
-    Kontrol output: data murni (tanpa metadata) jika query.text=True.
+    Kontrol output: plaintext Otomax jika query.text=True. Tanpa pilihan format
+    dari client, plaintext dikirim sebagai JSON string (bentuk lama);
+    `text/plain` mentah hanya jika diminta lewat `?format=text` / Accept.
     """
     response_model = await service.balance(query)
 
-    text_source = response_model.model_dump()
-    text_response = dict_to_plaintext(text_source)
-
-    # 2. Kontrol output API berdasarkan parameter 'text'
     if query.text:
-        return text_response
+        return negotiator.render(plaintext.render(response_model), fmt)
+    return negotiator.render(response_model, fmt)
+
+
+@router.post(
+    "/balance/batch",
+    summary="Balance banyak akun sekaligus, di-stream sebagai NDJSON",
+    response_class=StreamingResponse,
+    tags=[Tag.digipos_account],
+)
+async def post_balance_batch(
+    body: DGReqBalanceBatch,
+    service: DepDigiposCommandService,
+):
+    """Satu baris JSON per akun, dikirim begitu akun tersebut selesai.
+
+    Error per akun ditulis inline (`ok: false`) tanpa menghentikan batch.
+    """
+    items = service.balance_batch(body)
+
+    async def _ndjson():
+        async for item in items:
+            yield json_dumps(item) + b"\n"
 
-    return response_model
+    return StreamingResponse(_ndjson(), media_type="application/x-ndjson")
 
 
 @router.get(
     path="/profile",
     summary="Forward profile command to Digipos API",
     tags=[Tag.digipos_account],
+    dependencies=[digipos_deadline("profile")],
 )
 async def get_profile(
     query: Annotated[DGReqUsername, Depends()],
     service: DepDigiposCommandService,
+    fmt: DepResponseFormat,
 ):
     """Ambil profile dari Digipos API."""
     response_model = await service.profile(query)
 
-    return response_model
+    return negotiator.render(response_model, fmt)
 
 
 @router.get(
     path="/list_va",
     summary="Forward list_va command to Digipos API",
     tags=[Tag.digipos_account],
+    dependencies=[digipos_deadline("list_va")],
 )
 async def get_list_va(
     query: Annotated[DGReqUsername, Depends()],
     service: DepDigiposCommandService,
+    fmt: DepResponseFormat,
 ):
     """Ambil list_va dari Digipos API."""
     response_model = await service.list_va(query)
 
-    return response_model
+    return negotiator.render(response_model, fmt)
 
 
 @router.get(
     path="/reward",
     summary="Forward reward command to Digipos API",
     tags=[Tag.digipos_account],
+    dependencies=[digipos_deadline("reward")],
 )
 async def get_reward(
     query: Annotated[DGReqUsername, Depends()],
     service: DepDigiposCommandService,
+    fmt: DepResponseFormat,
 ):
     """Ambil reward dari Digipos API."""
     response_model = await service.reward(query)
 
-    return response_model
+    return negotiator.render(response_model, fmt)
 
 
 @router.get(
     path="/banner",
     summary="Forward banner command to Digipos API",
     tags=[Tag.digipos_account],
+    dependencies=[digipos_deadline("banner")],
 )
 async def get_banner(
     query: Annotated[DGReqUsername, Depends()],
     service: DepDigiposCommandService,
+    fmt: DepResponseFormat,
 ):
     """Ambil banner dari Digipos API."""
     response_model = await service.banner(query)
 
-    return response_model
+    return negotiator.render(response_model, fmt)
 
 
 @router.get(
     path="/logout",
     summary="Forward logout command to Digipos API",
     tags=[Tag.digipos_account],
+    dependencies=[digipos_deadline("logout")],
 )
 async def get_logout(
     query: Annotated[DGReqUsername, Depends()],
     service: DepDigiposCommandService,
+    fmt: DepResponseFormat,
 ):
     """Logout dari Digipos API."""
     response_model = await service.logout(query)
 
-    return response_model
+    return negotiator.render(response_model, fmt)
 
 
 @router.get(
     path="/sim_status",
     summary="Forward sim_status command to Digipos API",
     tags=[Tag.digipos_utils],
+    dependencies=[digipos_deadline("sim_status")],
 )
 async def get_sim_status(
     query: Annotated[DGReqSimStatus, Depends()],
     service: DepDigiposCommandService,
+    fmt: DepResponseFormat,
 ):
     """Ambil sim_status dari Digipos API."""
     response_model = await service.sim_status(query)
 
-    return response_model
+    return negotiator.render(response_model, fmt)
@@ -0,0 +1,178 @@
+"""Fast lane: raw ASGI handler untuk endpoint Digipos paling sering dipanggil.
+
+Route FastAPI biasa membayar dependency resolution + validasi ulang
+`response_model` tiap request. Handler di sini memanggil `DGCommandServices`
+langsung: query di-validate dengan validator pydantic yang sudah di-compile,
+format output di-negotiate sekali, lalu bytes hasil encoder ditulis langsung
+ke `send`.
+
+Route fast lane di-insert di depan router, jadi route FastAPI dengan path yang
+sama tetap ada untuk OpenAPI (docs tidak berubah) tapi tidak lagi dilayani.
+Perilaku (deadline, format, error handler, 422) sama dengan route aslinya.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Annotated
+from urllib.parse import parse_qsl
+
+from fastapi import FastAPI
+from fastapi.exceptions import RequestValidationError
+from loguru import logger
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from starlette.routing import Route
+from starlette.types import Receive, Scope, Send
+
+from api.v1.dgp_account import router
+from servicess.digipos.sch_digipos import DGReqSimStatus, DGReqUsername
+from servicess.parser.plaintext import plaintext
+from src.core.client.deadline import (
+    DEADLINE_HEADER,
+    DEADLINE_QUERY,
+    reset_deadline,
+    set_deadline,
+)
+from src.custom.negotiation import (
+    MEDIA_TYPES,
+    ResponseFormat,
+    negotiator,
+    resolve_format,
+)
+from src.deps.container import get_services
+
+log = logger.bind(service="Fast Lane")
+
+_HEADER_TIMEOUT = DEADLINE_HEADER.lower().encode()
+_TIMEOUT = TypeAdapter(Annotated[float, Field(gt=0)])
+
+# header statis per format, di-encode sekali
+_HEADERS: dict[ResponseFormat, list[tuple[bytes, bytes]]] = {
+    fmt: [
+        (b"content-type", f"{media}; charset=utf-8".encode())
+        if media.startswith("text/")
+        else (b"content-type", media.encode()),
+        (b"vary", b"Accept"),
+    ]
+    for fmt, media in MEDIA_TYPES.items()
+}
+
+
+class _LaneParams(BaseModel):
+    """Query milik route (di luar model request): deadline & format."""
+
+    deadline: float | None = Field(default=None, gt=0, alias=DEADLINE_QUERY)
+    # divalidasi resolve_format (406), sama seperti route aslinya
+    format: str | None = None
+
+
+def _errors(exc: ValidationError, source: str) -> list[dict]:
+    return [
+        {**error, "loc": (source, *error["loc"])}
+        for error in exc.errors(include_url=False)
+    ]
+
+
+@dataclass(frozen=True, slots=True)
+class FastLane:
+    """Raw ASGI handler untuk satu method `DGCommandServices`."""
+
+    command: str
+    request_model: type[BaseModel]
+    text_output: bool = False
+
+    @property
+    def path(self) -> str:
+        return f"{router.prefix}/{self.command}"
+
+    def _parse(
+        self, query: dict[str, str], timeout: bytes | None
+    ) -> tuple[BaseModel, _LaneParams, float | None]:
+        errors: list[dict] = []
+        data = params = header_timeout = None
+        try:
+            data = self.request_model.__pydantic_validator__.validate_python(query)
+        except ValidationError as exc:
+            errors += _errors(exc, "query")
+        try:
+            params = _LaneParams.__pydantic_validator__.validate_python(query)
+        except ValidationError as exc:
+            errors += _errors(exc, "query")
+        if timeout is not None:
+            try:
+                header_timeout = _TIMEOUT.validate_python(timeout.decode("latin-1"))
+            except ValidationError as exc:
+                errors += [
+                    {**error, "loc": ("header", DEADLINE_HEADER)}
+                    for error in exc.errors(include_url=False)
+                ]
+        if errors:
+            raise RequestValidationError(errors)
+        return data, params, header_timeout
+
+    async def __call__(self, scope: Scope, _receive: Receive, send: Send) -> None:
+        accept = legacy_format = timeout = None
+        for name, value in scope["headers"]:
+            if name == b"accept":
+                accept = value
+            elif name == b"x-response-format":
+                legacy_format = value
+            elif name == _HEADER_TIMEOUT:
+                timeout = value
+
+        query = dict(parse_qsl(scope["query_string"].decode("latin-1")))
+        data, params, header_timeout = self._parse(query, timeout)
+        fmt = resolve_format(
+            params.format or (legacy_format and legacy_format.decode("latin-1")),
+            accept.decode("latin-1") if accept else "",
+        )
+        fmt = fmt or ResponseFormat.JSON
+
+        app = scope["app"]
+        deadline = (
+            header_timeout
+            or params.deadline
+            or app.state.settings.digipos.endpoints.deadline_for(self.command)
+        )
+        service = get_services(app).digipos.command
+        token = set_deadline(deadline)
+        try:
+            result = await getattr(service, self.command)(data)
+        finally:
+            reset_deadline(token)
+
+        if self.text_output and getattr(data, "text", False):
+            # sama dengan route: plaintext Otomax, dibungkus format terpilih
+            result = plaintext.render(result)
+        body = negotiator.encoder(result, fmt)(result)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-length", str(len(body)).encode()),
+                    *_HEADERS[fmt],
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+FAST_LANES: dict[str, FastLane] = {
+    "balance": FastLane("balance", DGReqUsername, text_output=True),
+    "sim_status": FastLane("sim_status", DGReqSimStatus),
+}
+
+
+def mount_fast_lane(app: FastAPI, commands: Iterable[str]) -> FastAPI:
+    """Pasang handler fast lane di depan route FastAPI dengan path yang sama."""
+    for command in commands:
+        lane = FAST_LANES.get(command)
+        if lane is None:
+            raise ValueError(
+                f"Fast lane '{command}' tidak tersedia, pilih dari {list(FAST_LANES)}"
+            )
+        app.router.routes.insert(
+            0, Route(lane.path, lane, methods=["GET"], include_in_schema=False)
+        )
+        log.info(f"Fast lane aktif untuk {lane.path}")
+    return app
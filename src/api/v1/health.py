@@ -0,0 +1,26 @@
+from fastapi import APIRouter
+
+from deps.dep_factory import DepApiManager
+from src.custom.responses import FastJSONResponse
+from src.tag import Tags as Tag
+
+router = APIRouter(prefix="/health", tags=[Tag.health])
+
+
+@router.get(path="/live", summary="Liveness probe")
+async def get_live():
+    """Proses hidup; tidak menyentuh upstream."""
+    return {"status": "ok"}
+
+
+@router.get(path="/ready", summary="Readiness probe dari state health check")
+async def get_ready(manager: DepApiManager):
+    """Dibaca dari cache HealthChecker — tidak ada request ke upstream."""
+    ready = manager.is_ready()
+    return FastJSONResponse(
+        content={
+            "status": "ready" if ready else "not_ready",
+            "clients": manager.health_snapshot(),
+        },
+        status_code=200 if ready else 503,
+    )
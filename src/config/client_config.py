@@ -1,4 +1,6 @@
-from pydantic import BaseModel, Field, HttpUrl
+from typing import Any
+
+from pydantic import BaseModel, Field, HttpUrl, field_validator
 
 default_headers = {
     "User-Agent": "MKIT-Trimmer-API/1.0",
@@ -9,8 +11,110 @@ default_headers = {
 class ClientRetry(BaseModel):
     total: int = 5
     backoff_factor: float = 0.5
-    status_forcelist: list[int] = [429, 500, 502, 503, 504]
+    # 429 tidak di-retry di transport: ditangani rate limiter per akun
+    status_forcelist: list[int] = [500, 502, 503, 504]
     allowed_methods: list[str] = ["GET", "POST"]
+    backoff_jitter: float = Field(default=1.0, ge=0, le=1)
+    respect_retry_after: bool = True
+    max_backoff_wait: float = 10.0
+    budget_ratio: float = Field(
+        default=0.1, description="retry maksimal ~ratio x jumlah request sukses"
+    )
+    budget_max_tokens: float = Field(
+        default=10.0, description="burst retry yang boleh sebelum budget habis"
+    )
+
+
+class ClientTimeout(BaseModel):
+    connect: float = 5.0
+    read: float = 10.0
+    write: float = 10.0
+    pool: float = 5.0
+    adaptive: bool = Field(
+        default=False, description="read timeout dari rolling p99 latency per endpoint"
+    )
+    adaptive_quantile: float = Field(default=0.99, gt=0, le=1)
+    adaptive_multiplier: float = Field(
+        default=2.0, description="read timeout adaptif = quantile latency x multiplier"
+    )
+    adaptive_min_s: float = Field(
+        default=0.5, description="batas bawah read timeout adaptif"
+    )
+    window_size: int = 200
+    min_samples: int = 20
+
+
+class EndpointTimeout(BaseModel):
+    """Override timeout per endpoint; field None = pakai timeout client."""
+
+    connect: float | None = None
+    read: float | None = None
+    write: float | None = None
+    pool: float | None = None
+
+
+class ClientBalancer(BaseModel):
+    ewma_alpha: float = Field(
+        default=0.3, gt=0, le=1, description="bobot sample terbaru pada EWMA latency"
+    )
+    eject_after_failures: int = Field(
+        default=5, description="gagal berturut-turut sebelum host di-eject"
+    )
+    eject_duration_s: float = 30.0
+    max_eject_duration_s: float = Field(
+        default=300.0, description="durasi eject digandakan tiap probe gagal"
+    )
+
+
+class ClientHealth(BaseModel):
+    enabled: bool = Field(default=False, description="opt-in: probe background")
+    interval_s: float = 15.0
+    timeout_s: float = 2.0
+    method: str = "HEAD"
+    path: str = "/"
+    ewma_alpha: float = Field(default=0.3, gt=0, le=1)
+    failure_threshold: int = Field(
+        default=3, description="probe gagal berturut-turut sebelum dianggap down"
+    )
+    success_threshold: int = Field(
+        default=1, description="probe sukses berturut-turut sebelum kembali up"
+    )
+    critical: bool = Field(
+        default=False, description="client down → /health/ready mengembalikan 503"
+    )
+
+
+class ClientRateLimit(BaseModel):
+    enabled: bool = Field(default=False, description="opt-in: bucket per akun")
+    default_rate_per_s: float = Field(
+        default=5.0, description="refill token per detik per (akun, endpoint)"
+    )
+    rate_per_s: dict[str, float] = Field(
+        default={}, description="override refill rate per endpoint/command"
+    )
+    burst: float = 10.0
+    max_queue: int = 50
+    queue_timeout_s: float = Field(
+        default=5.0, description="request yang harus menunggu lebih lama ditolak"
+    )
+    min_rate_per_s: float = 0.1
+    max_block_s: float = Field(
+        default=60.0, description="batas blok dari Retry-After / RateLimit-Reset"
+    )
+    backoff_ratio: float = Field(default=0.5, description="pengali rate saat 429")
+    recovery_ratio: float = Field(
+        default=0.1, description="rate naik ratio x rate konfigurasi per sukses"
+    )
+
+
+class ClientStream(BaseModel):
+    max_body_bytes: int | None = Field(
+        default=5 * 1024 * 1024,
+        description="body streamed lebih besar dari ini di-abort, None = tanpa batas",
+    )
+    head_bytes: int = Field(
+        default=500, description="awal body mentah yang disimpan untuk context error"
+    )
 
 
 class ClientLimits(BaseModel):
@@ -19,12 +123,93 @@ class ClientLimits(BaseModel):
     keepalive_expiry: int = 300
 
 
+class ClientBreaker(BaseModel):
+    enabled: bool = Field(
+        default=False, description="opt-in: fail fast saat upstream down"
+    )
+    window_size: int = 20
+    min_calls: int = 10
+    failure_rate_threshold: float = 0.5
+    slow_call_threshold_s: float = 5.0
+    slow_call_rate_threshold: float = 0.8
+    open_duration_s: float = 30.0
+    half_open_max_calls: int = 3
+
+
+class ClientHedge(BaseModel):
+    enabled: bool = False
+    quantile: float = 0.95
+    window_size: int = 200
+    min_samples: int = 20
+    min_delay_s: float = 0.05
+    budget_percent: float = Field(
+        default=10.0, description="maksimum extra upstream load dari hedging (%)"
+    )
+
+
+class ClientConcurrency(BaseModel):
+    enabled: bool = True
+    initial_limit: int = 20
+    min_limit: int = 1
+    target_latency_s: float = Field(
+        default=1.0, description="latency di bawah ini → limit naik additive"
+    )
+    backoff_ratio: float = Field(
+        default=0.7, description="faktor pengali limit saat timeout/429/5xx"
+    )
+    max_queue: int = 200
+    queue_timeout_s: float = 5.0
+
+
+class ClientWarmup(BaseModel):
+    connections: int = Field(
+        default=0,
+        description="keep-alive connection yang dibuka saat startup (0 = mati)",
+    )
+    method: str = "HEAD"
+    path: str = "/"
+
+
+class ClientCache(BaseModel):
+    enabled: bool = True
+    max_bytes: int = 8 * 1024 * 1024
+    stale_while_revalidate: float = Field(
+        default=0, description="detik setelah TTL: sajikan stale + refresh background"
+    )
+    stale_if_error: float = Field(
+        default=0, description="detik setelah TTL: sajikan stale jika upstream gagal"
+    )
+
+
 class ClientBaseConfig(BaseModel):
     name: str
     base_url: HttpUrl
+    base_urls: list[HttpUrl] = Field(
+        default=[], description="host tambahan; request di-balance antar semua host"
+    )
     headers: dict[str, str] = Field(default_headers)
-    timeout: int = 10
+    timeout: ClientTimeout = Field(default_factory=ClientTimeout)
     http2: bool = Field(default=False)
     debug: bool = Field(default=False)
+    coalesce: bool = Field(
+        default=False, description="single-flight untuk GET identik yang bersamaan"
+    )
     retry: ClientRetry = Field(default_factory=ClientRetry)
     limits: ClientLimits = Field(default_factory=ClientLimits)
+    balancer: ClientBalancer = Field(default_factory=ClientBalancer)
+    cache: ClientCache = Field(default_factory=ClientCache)
+    breaker: ClientBreaker = Field(default_factory=ClientBreaker)
+    hedge: ClientHedge = Field(default_factory=ClientHedge)
+    warmup: ClientWarmup = Field(default_factory=ClientWarmup)
+    health: ClientHealth = Field(default_factory=ClientHealth)
+    concurrency: ClientConcurrency = Field(default_factory=ClientConcurrency)
+    rate_limit: ClientRateLimit = Field(default_factory=ClientRateLimit)
+    stream: ClientStream = Field(default_factory=ClientStream)
+
+    @field_validator("timeout", mode="before")
+    @classmethod
+    def _flat_timeout(cls, value: Any) -> Any:
+        """Kompatibel dengan config lama: `timeout = 10` berlaku untuk semua fase."""
+        if isinstance(value, int | float):
+            return {"connect": value, "read": value, "write": value, "pool": value}
+        return value
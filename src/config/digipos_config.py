@@ -1,6 +1,12 @@
-from pydantic import BaseModel, Field
+from typing import Self
 
-from src.config.client_config import ClientBaseConfig
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+
+from src.config.client_config import (
+    ClientBaseConfig,
+    ClientTimeout,
+    EndpointTimeout,
+)
 
 
 class DigiposEndpoints(BaseModel):
@@ -13,10 +19,111 @@ class DigiposEndpoints(BaseModel):
     reward: str = Field(default="reward_summary")
     banner: str = Field(default="banner")
     sim_status: str = Field(default="sim_status")
+    cache_ttl: dict[str, float] = Field(
+        default={
+            "balance": 5,
+            "profile": 60,
+            "list_va": 60,
+            "reward": 300,
+            "banner": 900,
+        },
+        description="TTL (detik) response cache per command, 0/absent = tanpa cache",
+    )
 
+    idempotent: set[str] = Field(
+        default={"balance", "profile", "list_va", "reward", "banner", "sim_status"},
+        description="command read-only yang aman di-hedge",
+    )
 
-class DigiposConfig(ClientBaseConfig):
+    deadline_s: dict[str, float] = Field(
+        default={"login": 30, "verify_otp": 30, "balance": 10},
+        description="deadline default (detik) per command jika caller tidak kirim",
+    )
+    default_deadline_s: float = 20.0
+
+    timeouts: dict[str, EndpointTimeout] = Field(
+        default={
+            "login": EndpointTimeout(read=30),
+            "verify_otp": EndpointTimeout(read=30),
+            "balance": EndpointTimeout(connect=2, read=5),
+        },
+        description="override connect/read/write/pool timeout per command",
+    )
+
+    stream: dict[str, list[str]] = Field(
+        default={"profile": [], "list_va": []},
+        description="command yang body-nya di-decode streaming → field/path "
+        "bertitik yang diambil, mis. `data.items` ([] = semua)",
+    )
+
+    def ttl_for(self, command: str) -> float:
+        return self.cache_ttl.get(command, 0)
+
+    def deadline_for(self, command: str) -> float:
+        return self.deadline_s.get(command, self.default_deadline_s)
+
+
+class DigiposAccount(BaseModel):
     username: str
     password: str
     pin: str
+    max_concurrency: int | None = Field(
+        default=None, description="override `account_max_concurrency` untuk akun ini"
+    )
+    cache_namespace: str | None = Field(
+        default=None, description="namespace cache akun, default = username"
+    )
+
+    @property
+    def namespace(self) -> str:
+        return self.cache_namespace or self.username
+
+
+class DigiposConfig(ClientBaseConfig):
+    # akun tunggal (format lama) — digabung ke `accounts` saat validasi
+    username: str | None = None
+    password: str | None = None
+    pin: str | None = None
+    accounts: list[DigiposAccount] = Field(default=[])
+    account_max_concurrency: int = Field(
+        default=5, description="default in-flight request per akun (outlet)"
+    )
+    batch_max_concurrency: int = Field(
+        default=10, ge=1, description="fan-out maksimal /balance/batch"
+    )
+    batch_max_items: int = Field(default=200, ge=1)
     endpoints: DigiposEndpoints = Field(default_factory=DigiposEndpoints)
+    _accounts_by_username: dict[str, DigiposAccount] = PrivateAttr(default_factory=dict)
+
+    @model_validator(mode="after")
+    def _index_accounts(self) -> Self:
+        """Gabung akun format lama ke `accounts` lalu bangun index username."""
+        if self.username is not None:
+            legacy = DigiposAccount(
+                username=self.username,
+                password=self.password or "",
+                pin=self.pin or "",
+            )
+            if all(acc.username != legacy.username for acc in self.accounts):
+                self.accounts = [legacy, *self.accounts]
+        index: dict[str, DigiposAccount] = {}
+        for account in self.accounts:
+            if account.username in index:
+                raise ValueError(f"Duplicate Digipos account '{account.username}'")
+            index[account.username] = account
+        self._accounts_by_username = index
+        return self
+
+    def account(self, username: str) -> DigiposAccount | None:
+        """Lookup akun O(1) berdasarkan username."""
+        return self._accounts_by_username.get(username)
+
+    def concurrency_for(self, account: DigiposAccount) -> int:
+        return account.max_concurrency or self.account_max_concurrency
+
+    def timeout_for(self, command: str) -> ClientTimeout:
+        """Timeout client yang di-override oleh `endpoints.timeouts[command]`."""
+        override = self.endpoints.timeouts.get(command)
+        if override is None:
+            return self.timeout
+        return self.timeout.model_copy(update=override.model_dump(exclude_none=True))
@@ -0,0 +1,195 @@
+"""Load balancing & failover antar beberapa base URL untuk satu client.
+
+Host dipilih berdasarkan skor `ewma_latency x (outstanding + 1)` — host yang
+cepat dan tidak sedang sibuk menang. Host yang gagal berturut-turut di-eject
+selama `eject_duration_s`; setelah itu request berikutnya langsung dipakai
+sebagai probe (tanpa melihat skor): sukses → host kembali aktif dengan EWMA
+baru, gagal → eject lagi dengan durasi dua kali lipat.
+
+Layer ini dipasang di bawah retry, jadi retry otomatis bisa pindah host.
+"""
+
+from dataclasses import dataclass, field
+from enum import StrEnum
+from time import monotonic, perf_counter
+from typing import Any
+
+import httpx
+from loguru import logger
+
+from src.core.config.cfg_api_clients import ClientBalancer
+
+
+class HostState(StrEnum):
+    UP = "up"
+    EJECTED = "ejected"
+    PROBING = "probing"
+
+
+@dataclass
+class UpstreamHost:
+    base: str
+    state: HostState = HostState.UP
+    ewma_s: float = 0.0
+    outstanding: int = 0
+    requests: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    ejections: int = 0
+    ejected_until: float = 0.0
+    eject_duration_s: float = 0.0
+    url: httpx.URL = field(init=False, repr=False)
+    origin: tuple[str, str, int | None] = field(init=False, repr=False)
+    prefix: bytes = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.url = httpx.URL(self.base)
+        self.origin = (self.url.scheme, self.url.host, self.url.port)
+        self.prefix = self.url.raw_path.rstrip(b"/")
+
+    def matches(self, url: httpx.URL) -> bool:
+        """Origin (scheme, host, port) sama dan path berada di bawah prefix base."""
+        if (url.scheme, url.host, url.port) != self.origin:
+            return False
+        path = url.raw_path
+        return path.startswith(self.prefix) and path[len(self.prefix) :][:1] in {
+            b"",
+            b"/",
+            b"?",
+        }
+
+    def score(self) -> float:
+        # host yang belum punya sample tetap terbagi rata lewat outstanding
+        return max(self.ewma_s, 1e-3) * (self.outstanding + 1)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "state": self.state.value,
+            "ewma_ms": round(self.ewma_s * 1000, 2),
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "ejections": self.ejections,
+        }
+
+
+class BalancerTransport(httpx.AsyncBaseTransport):
+    """Rewrite origin request ke host terpilih, catat latency & outcome per host."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        bases: list[str],
+        settings: ClientBalancer,
+        name: str = "client",
+    ) -> None:
+        self.transport = transport
+        self.settings = settings
+        self.hosts = [UpstreamHost(base.rstrip("/")) for base in dict.fromkeys(bases)]
+        self.log = logger.bind(service="BalancerTransport", client_name=name)
+
+    def _available(self, host: UpstreamHost, now: float) -> bool:
+        if host.state == HostState.UP:
+            return True
+        if now < host.ejected_until:
+            return False
+        # satu request berikutnya menjadi probe; probe yang tidak pernah selesai
+        # (mis. cancelled) diulang setelah durasi eject yang sama
+        host.state = HostState.PROBING
+        host.ejected_until = now + host.eject_duration_s
+        return True
+
+    def pick(self) -> UpstreamHost:
+        now = monotonic()
+        candidates = [host for host in self.hosts if self._available(host, now)]
+        if not candidates:
+            # semua host ter-eject: pakai yang paling cepat kembali (panic mode)
+            return min(self.hosts, key=lambda host: host.ejected_until)
+        for host in candidates:
+            # eject baru selesai: request ini jadi probe, skor EWMA lama diabaikan
+            if host.state == HostState.PROBING:
+                return host
+        return min(candidates, key=UpstreamHost.score)
+
+    def _rewrite(self, request: httpx.Request, host: UpstreamHost) -> None:
+        """Ganti origin (+ prefix path) request ke host terpilih."""
+        url = request.url
+        # prefix terpanjang menang jika beberapa base berbagi origin
+        matched = [current for current in self.hosts if current.matches(url)]
+        if not matched:
+            return
+        current = max(matched, key=lambda candidate: len(candidate.prefix))
+        if current is host:
+            return
+        request.url = url.copy_with(
+            scheme=host.url.scheme,
+            host=host.url.host,
+            port=host.url.port,
+            raw_path=host.prefix + url.raw_path[len(current.prefix) :],
+        )
+        request.headers["Host"] = request.url.netloc.decode("ascii")
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = self.pick()
+        self._rewrite(request, host)
+        host.requests += 1
+        host.outstanding += 1
+        start = perf_counter()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except Exception:
+            self._record(host, False, perf_counter() - start)
+            raise
+        else:
+            self._record(host, response.status_code < 500, perf_counter() - start)
+            return response
+        finally:
+            host.outstanding -= 1
+
+    def _record(self, host: UpstreamHost, success: bool, elapsed_s: float) -> None:
+        alpha = self.settings.ewma_alpha
+        if host.ewma_s == 0.0:
+            host.ewma_s = elapsed_s
+        else:
+            host.ewma_s = alpha * elapsed_s + (1 - alpha) * host.ewma_s
+
+        if success:
+            host.consecutive_failures = 0
+            if host.state != HostState.UP:
+                self.log.info(f"Host {host.base} re-admitted")
+                host.state = HostState.UP
+                host.eject_duration_s = 0.0
+                # EWMA dari masa gagal tidak berlaku lagi, mulai dari latency probe
+                host.ewma_s = elapsed_s
+            return
+
+        host.failures += 1
+        host.consecutive_failures += 1
+        if (
+            host.state == HostState.PROBING
+            or host.consecutive_failures >= self.settings.eject_after_failures
+        ):
+            self._eject(host)
+
+    def _eject(self, host: UpstreamHost) -> None:
+        settings = self.settings
+        if host.eject_duration_s:
+            host.eject_duration_s = min(
+                host.eject_duration_s * 2, settings.max_eject_duration_s
+            )
+        else:
+            host.eject_duration_s = settings.eject_duration_s
+        host.state = HostState.EJECTED
+        host.ejected_until = monotonic() + host.eject_duration_s
+        host.ejections += 1
+        self.log.warning(
+            f"Host {host.base} ejected for {host.eject_duration_s:.1f}s "
+            f"after {host.consecutive_failures} consecutive failures"
+        )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {host.base: host.snapshot() for host in self.hosts}
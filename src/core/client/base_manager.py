@@ -1,22 +1,84 @@
+import asyncio
+from collections.abc import Sequence
+from time import perf_counter
+from typing import Any
+
 from httpx import AsyncClient
+from httpx_retries import Retry
 from loguru import logger
 
+from src.core.client.base_factory import HttpClientFactory
+from src.core.client.breaker import CircuitBreaker
+from src.core.client.cache import ResponseCache
+from src.core.client.coalesce import RequestCoalescer
+from src.core.client.health import HealthChecker
+from src.core.client.hedging import RequestHedger
+from src.core.client.limiter import AdaptiveLimiter
+from src.core.client.ratelimit import AccountRateLimiter
+from src.core.client.timeouts import AdaptiveTimeout
+from src.core.client.transport import TransportStack, get_transport_stack
+from src.core.config.cfg_api_clients import ApiBaseConfig
+
 
 class HttpClientManager:
     """Registry & lifecycle manager untuk semua AsyncClient."""
 
     def __init__(self) -> None:
         self._clients: dict[str, AsyncClient] = {}
+        self._configs: dict[str, ApiBaseConfig] = {}
+        self._coalescers: dict[str, RequestCoalescer] = {}
+        self._caches: dict[str, ResponseCache] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._hedgers: dict[str, RequestHedger] = {}
+        self._limiters: dict[str, AdaptiveLimiter] = {}
+        self._account_limiters: dict[tuple[str, str], AdaptiveLimiter] = {}
+        self._rate_limiters: dict[str, AccountRateLimiter] = {}
+        self._timeouts: dict[str, AdaptiveTimeout] = {}
+        self._health: dict[str, HealthChecker] = {}
+        self._health_tasks: dict[str, asyncio.Task[None]] = {}
         self.log = logger.bind(service="ApiClientManager")
 
-    def register_client(self, name: str, client: AsyncClient) -> None:
+    def register_client(
+        self, name: str, client: AsyncClient, config: ApiBaseConfig | None = None
+    ) -> None:
         """Register 1 client siap pakai."""
         if name in self._clients:
             self.log.warning(f"Client '{name}' sudah terdaftar — dilewati.")
             return
         self._clients[name] = client
+        if config is not None:
+            self._build_components(name, client, config)
         self.log.debug(f"Client '{name}' registered successfully.")
 
+    def _build_components(
+        self, name: str, client: AsyncClient, config: ApiBaseConfig
+    ) -> None:
+        """Bangun komponen resiliency per client sesuai flag di config."""
+        self._configs[name] = config
+        if config.coalesce:
+            self._coalescers[name] = RequestCoalescer(name)
+        if config.cache.enabled:
+            self._caches[name] = ResponseCache(
+                name,
+                config.cache.max_bytes,
+                stale_while_revalidate=config.cache.stale_while_revalidate,
+                stale_if_error=config.cache.stale_if_error,
+            )
+        if config.breaker.enabled:
+            self._breakers[name] = CircuitBreaker(name, config.breaker)
+        if config.hedge.enabled:
+            self._hedgers[name] = RequestHedger(name, config.hedge)
+        if config.concurrency.enabled:
+            self._limiters[name] = AdaptiveLimiter(
+                name, config.concurrency, config.limits.max_connections
+            )
+        if config.timeout.adaptive:
+            self._timeouts[name] = AdaptiveTimeout(name, config.timeout)
+        if config.rate_limit.enabled:
+            self._rate_limiters[name] = AccountRateLimiter(name, config.rate_limit)
+        if config.health.enabled:
+            self._health[name] = HealthChecker(name, client, config.health)
+
     def get_client(self, name: str) -> AsyncClient:
         """Ambil client berdasarkan nama."""
         if name not in self._clients:
@@ -24,15 +86,231 @@ class HttpClientManager:
             raise ValueError(f"Client '{name}' belum diinisialisasi")
         return self._clients[name]
 
-    async def start_all(self):
-        """Opsional: start tasks per client, jika perlu."""
+    def get_coalescer(self, name: str) -> RequestCoalescer | None:
+        """Coalescer milik client, None jika `coalesce` tidak diaktifkan."""
+        return self._coalescers.get(name)
+
+    def coalesce_stats(self) -> dict[str, Any]:
+        """Hit/merge counter coalescing per client."""
+        return {name: c.stats.snapshot() for name, c in self._coalescers.items()}
+
+    def get_cache(self, name: str) -> ResponseCache | None:
+        """Response cache milik client, None jika cache dimatikan."""
+        return self._caches.get(name)
+
+    def get_breaker(self, name: str) -> CircuitBreaker | None:
+        """Circuit breaker milik client, None jika breaker dimatikan."""
+        return self._breakers.get(name)
+
+    def breaker_states(self) -> dict[str, Any]:
+        """State breaker per client untuk health/metrics endpoint."""
+        return {name: b.snapshot() for name, b in self._breakers.items()}
+
+    def get_hedger(self, name: str) -> RequestHedger | None:
+        """Hedger milik client, None jika hedging tidak diaktifkan."""
+        return self._hedgers.get(name)
+
+    def hedge_stats(self) -> dict[str, Any]:
+        return {name: h.snapshot() for name, h in self._hedgers.items()}
+
+    def get_limiter(self, name: str) -> AdaptiveLimiter | None:
+        """Adaptive concurrency limiter milik client."""
+        return self._limiters.get(name)
+
+    def limiter_stats(self) -> dict[str, Any]:
+        """Limit saat ini, queue depth dan queue wait per client."""
+        return {name: lim.snapshot() for name, lim in self._limiters.items()}
+
+    def get_account_limiter(
+        self, name: str, account: str, max_limit: int
+    ) -> AdaptiveLimiter | None:
+        """Limiter per akun di atas pool client yang sama (dibuat lazy).
+
+        Satu akun yang sibuk hanya menghabiskan slot miliknya sendiri, bukan
+        slot akun lain. None jika concurrency limiting dimatikan.
+        """
+        config = self._configs.get(name)
+        if config is None or not config.concurrency.enabled:
+            return None
+        key = (name, account)
+        limiter = self._account_limiters.get(key)
+        if limiter is None:
+            limiter = self._account_limiters[key] = AdaptiveLimiter(
+                f"{name}:{account}", config.concurrency, max_limit
+            )
+        return limiter
+
+    def account_limiter_stats(self, name: str) -> dict[str, Any]:
+        """Limit & queue per akun untuk satu client."""
+        return {
+            account: lim.snapshot()
+            for (client, account), lim in self._account_limiters.items()
+            if client == name
+        }
+
+    def get_rate_limiter(self, name: str) -> AccountRateLimiter | None:
+        """Token bucket per (akun, endpoint) milik client."""
+        return self._rate_limiters.get(name)
+
+    def rate_limit_stats(self) -> dict[str, Any]:
+        """Rate, token dan queue wait per bucket untuk tiap client."""
+        return {name: rl.snapshot() for name, rl in self._rate_limiters.items()}
+
+    def get_timeouts(self, name: str) -> AdaptiveTimeout | None:
+        """Adaptive read timeout milik client, None jika mode adaptif mati."""
+        return self._timeouts.get(name)
+
+    def timeout_stats(self) -> dict[str, Any]:
+        """Read timeout efektif per endpoint untuk tiap client adaptif."""
+        return {name: t.snapshot() for name, t in self._timeouts.items()}
+
+    def start_health_checks(self) -> None:
+        """Jalankan background probe untuk client yang belum punya task."""
+        for name, checker in self._health.items():
+            task = self._health_tasks.get(name)
+            if task is None or task.done():
+                self._health_tasks[name] = asyncio.create_task(
+                    checker.run(), name=f"health:{name}"
+                )
+
+    async def stop_health_checks(self) -> None:
+        tasks = list(self._health_tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._health_tasks.clear()
+
+    def health_snapshot(self) -> dict[str, Any]:
+        """State health cache per client (tanpa memicu request upstream)."""
+        return {name: checker.snapshot() for name, checker in self._health.items()}
+
+    def is_ready(self) -> bool:
+        """Ready jika semua client `critical` terakhir dicek up."""
+        return all(
+            checker.state.up is True
+            for checker in self._health.values()
+            if checker.settings.critical
+        )
+
+    def get_transport(self, name: str) -> TransportStack | None:
+        """Ambil TransportStack milik client (None jika bukan dari builder)."""
+        return get_transport_stack(self.get_client(name))
+
+    def host_stats(self, name: str) -> dict[str, Any] | None:
+        """Stats per host (EWMA latency, outstanding, eject state) milik client."""
+        stack = self.get_transport(name)
+        return stack.host_info() if stack else None
+
+    def pool_info(self) -> dict[str, Any]:
+        """Konfigurasi pool efektif + metrics transport untuk semua client."""
+        info: dict[str, Any] = {}
+        for name, client in self._clients.items():
+            stack = get_transport_stack(client)
+            info[name] = stack.info() if stack else None
+        return info
+
+    def setup_client(self, config: ApiBaseConfig) -> AsyncClient:
+        """Buat client dari config lalu register (idempotent per nama)."""
+        if config.name in self._clients:
+            return self._clients[config.name]
+        client = HttpClientFactory.create_client(config)
+        self.register_client(config.name, client, config)
+        return client
+
+    async def warmup(self, name: str) -> None:
+        """Buka N keep-alive connection lewat pooled client yang sebenarnya."""
+        config = self._configs.get(name)
+        if config is None or config.warmup.connections <= 0:
+            return
+        client = self._clients[name]
+        warm = config.warmup
+        count = min(warm.connections, config.limits.max_keepalive_connections)
+        # retry dimatikan: warm-up tidak boleh menunggu backoff RetryTransport
+        no_retry = Retry(total=0)
+
+        start = perf_counter()
+        results = await asyncio.gather(
+            *(
+                client.request(warm.method, warm.path, extensions={"retry": no_retry})
+                for _ in range(count)
+            ),
+            return_exceptions=True,
+        )
+        elapsed_ms = (perf_counter() - start) * 1000
+        failed = [r for r in results if isinstance(r, BaseException)]
+        stack = get_transport_stack(client)
+        opened = stack.pool_info()["connections"] if stack else count - len(failed)
+
+        log = self.log.bind(client_name=name, warmup_ms=round(elapsed_ms, 2))
+        if failed:
+            log.warning(
+                f"Warm-up '{name}' partial | opened={opened}/{count} | "
+                f"{elapsed_ms:.1f} ms | error={failed[0]!r}"
+            )
+        else:
+            log.info(
+                f"Warm-up '{name}' | opened={opened}/{count} | {elapsed_ms:.1f} ms"
+            )
+
+    async def start_all(
+        self,
+        configs: Sequence[ApiBaseConfig] = (),
+        deadline_s: float | None = None,
+    ):
+        """Setup semua client, warm-up paralel, lalu mulai health check.
+
+        Error setup (config/factory) di-log lalu di-raise: aplikasi tidak boleh
+        start tanpa client. Hanya warm-up yang boleh gagal atau melewati
+        deadline; startup tidak diblok oleh upstream yang lambat.
+        """
         self.log.info("Starting all registered clients...")
-        self.log.success(f"Clients started: {list(self._clients.keys())}")
+        # config yang diberikan + client yang sudah di-register sebelumnya
+        pending = {config.name: config for config in configs}
+        for name, config in self._configs.items():
+            pending.setdefault(name, config)
+        start = perf_counter()
+        for name, config in pending.items():
+            try:
+                self.setup_client(config)
+            except Exception:
+                self.log.exception(f"Setup client '{name}' gagal")
+                raise
+
+        try:
+            async with asyncio.timeout(deadline_s):
+                results = await asyncio.gather(
+                    *(self.warmup(name) for name in pending),
+                    return_exceptions=True,
+                )
+        except TimeoutError:
+            self.log.warning(
+                f"Startup deadline {deadline_s}s exceeded, warm-up dibatalkan"
+            )
+        else:
+            for name, result in zip(pending, results, strict=True):
+                if isinstance(result, BaseException):
+                    self.log.warning(f"Warm-up '{name}' gagal: {result!r}")
+        self.start_health_checks()
+        self.log.success(
+            f"Clients started: {list(self._clients.keys())} "
+            f"in {(perf_counter() - start) * 1000:.1f} ms"
+        )
 
     async def stop_all(self):
         """Tutup semua koneksi dan clear registry."""
         self.log.info("Closing all clients...")
+        await self.stop_health_checks()
         for client in self._clients.values():
             await client.aclose()
         self._clients.clear()
+        self._configs.clear()
+        self._coalescers.clear()
+        self._caches.clear()
+        self._breakers.clear()
+        self._hedgers.clear()
+        self._limiters.clear()
+        self._account_limiters.clear()
+        self._rate_limiters.clear()
+        self._timeouts.clear()
+        self._health.clear()
         self.log.success("All HTTP clients closed successfully.")
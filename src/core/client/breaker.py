@@ -0,0 +1,114 @@
+"""Circuit breaker per upstream client.
+
+closed    → semua request lewat, outcome dicatat di sliding window.
+open      → request langsung ditolak (fail fast) sampai `open_duration_s` lewat.
+half-open → beberapa probe request dibolehkan; sukses semua → closed, gagal → open.
+"""
+
+from collections import deque
+from enum import StrEnum
+from time import monotonic
+from typing import Any
+
+from loguru import logger
+
+from src.core.config.cfg_api_clients import ClientBreaker
+from src.custom.exceptions import HTTPConnectionError
+
+
+class BreakerState(StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, settings: ClientBreaker | None = None) -> None:
+        self.name = name
+        self.settings = settings or ClientBreaker()
+        self.state = BreakerState.CLOSED
+        self._window: deque[tuple[bool, bool]] = deque(maxlen=self.settings.window_size)
+        self._state_since = 0.0
+        self._half_open_calls = 0
+        self._half_open_successes = 0
+        self.rejected = 0
+        self.log = logger.bind(service="CircuitBreaker", client_name=name)
+
+    def _transition(self, state: BreakerState) -> None:
+        if state == self.state:
+            return
+        self.log.warning(f"Circuit '{self.name}' {self.state} → {state}")
+        self.state = state
+        self._window.clear()
+        self._half_open_calls = 0
+        self._half_open_successes = 0
+        self._state_since = monotonic()
+
+    def before_call(self, endpoint: str) -> None:
+        """Raise HTTPConnectionError jika circuit sedang open."""
+        if self.state == BreakerState.OPEN:
+            if monotonic() - self._state_since >= self.settings.open_duration_s:
+                self._transition(BreakerState.HALF_OPEN)
+            else:
+                self._reject(endpoint)
+
+        if self.state == BreakerState.HALF_OPEN:
+            if self._half_open_calls >= self.settings.half_open_max_calls:
+                # probe yang tidak pernah di-record (mis. cancelled) jangan
+                # mengunci breaker selamanya di half-open
+                if monotonic() - self._state_since < self.settings.open_duration_s:
+                    self._reject(endpoint)
+                self._half_open_calls = self._half_open_successes = 0
+                self._state_since = monotonic()
+            self._half_open_calls += 1
+
+    def _reject(self, endpoint: str) -> None:
+        self.rejected += 1
+        retry_in = self.settings.open_duration_s - (monotonic() - self._state_since)
+        raise HTTPConnectionError(
+            message=f"Circuit open for '{self.name}'",
+            context={
+                "endpoint": endpoint,
+                "circuit": self.state.value,
+                "retry_in_s": round(max(retry_in, 0.0), 2),
+            },
+        )
+
+    def record(self, success: bool, elapsed_s: float) -> None:
+        slow = elapsed_s >= self.settings.slow_call_threshold_s
+
+        if self.state == BreakerState.HALF_OPEN:
+            if not success or slow:
+                self._transition(BreakerState.OPEN)
+                return
+            self._half_open_successes += 1
+            if self._half_open_successes >= self.settings.half_open_max_calls:
+                self._transition(BreakerState.CLOSED)
+            return
+
+        self._window.append((success, slow))
+        if self.state == BreakerState.CLOSED and self._should_open():
+            self._transition(BreakerState.OPEN)
+
+    def _should_open(self) -> bool:
+        calls = len(self._window)
+        if calls < self.settings.min_calls:
+            return False
+        failure_rate = sum(1 for ok, _ in self._window if not ok) / calls
+        slow_rate = sum(1 for _, slow in self._window if slow) / calls
+        return (
+            failure_rate >= self.settings.failure_rate_threshold
+            or slow_rate >= self.settings.slow_call_rate_threshold
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        calls = len(self._window)
+        failures = sum(1 for ok, _ in self._window if not ok)
+        slow = sum(1 for _, is_slow in self._window if is_slow)
+        return {
+            "state": self.state.value,
+            "calls_in_window": calls,
+            "failure_rate": failures / calls if calls else 0.0,
+            "slow_call_rate": slow / calls if calls else 0.0,
+            "rejected": self.rejected,
+        }
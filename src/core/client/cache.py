@@ -0,0 +1,299 @@
+"""In-process TTL response cache dengan LRU eviction berbasis byte budget.
+
+Key dikelompokkan per namespace (mis. username akun) supaya satu akun bisa
+di-invalidate sekaligus tanpa menyentuh akun lain.
+
+Entry yang sudah expired masih disimpan selama window stale:
+- stale-while-revalidate: entry stale langsung dikembalikan, refresh jalan di
+  background task.
+- stale-if-error: jika upstream gagal, entry stale dipakai sebagai fallback.
+"""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass, field
+from enum import StrEnum
+from time import monotonic
+from typing import Any
+
+from loguru import logger
+from pydantic_core import PydanticSerializationError, to_json
+
+from src.custom.exceptions import HTTPConnectionError, HttpResponseError
+
+
+@dataclass
+class CacheEntry:
+    value: Any
+    size: int
+    stored_at: float
+    expires_at: float
+    stale_until: float
+
+    @property
+    def age_s(self) -> float:
+        return monotonic() - self.stored_at
+
+    @property
+    def is_fresh(self) -> bool:
+        return monotonic() < self.expires_at
+
+
+class CacheState(StrEnum):
+    MISS = "MISS"
+    FRESH = "FRESH"
+    STALE = "STALE"
+    STALE_IF_ERROR = "STALE_IF_ERROR"
+
+
+@dataclass
+class CacheResult:
+    value: Any
+    state: CacheState
+    entry: CacheEntry | None = None
+
+    @property
+    def is_stale(self) -> bool:
+        return self.state in {CacheState.STALE, CacheState.STALE_IF_ERROR}
+
+    def meta(self) -> dict[str, Any]:
+        """Flag staleness untuk `meta` response (selalu dikirim, bukan hanya debug)."""
+        return {
+            "stale": self.is_stale,
+            "cache_state": self.state.value,
+            "age_s": round(self.entry.age_s, 3) if self.entry else 0.0,
+        }
+
+
+@dataclass
+class EndpointCacheStats:
+    hits: int = 0
+    misses: int = 0
+    stale_hits: int = 0
+    stale_if_error: int = 0
+    refreshes: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        served = self.hits + self.stale_hits
+        total = served + self.misses
+        return served / total if total else 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["hit_ratio"] = self.hit_ratio
+        return data
+
+
+@dataclass
+class CacheStats:
+    evictions: int = 0
+    invalidations: int = 0
+    endpoints: dict[str, EndpointCacheStats] = field(default_factory=dict)
+
+    def endpoint(self, name: str) -> EndpointCacheStats:
+        stats = self.endpoints.get(name)
+        if stats is None:
+            stats = self.endpoints[name] = EndpointCacheStats()
+        return stats
+
+
+def estimate_size(value: Any) -> int:
+    """Perkiraan ukuran (bytes) payload; model pydantic di-serialize field-nya."""
+    raw_data = getattr(value, "raw_data", value)
+    try:
+        return len(to_json(raw_data, fallback=str))
+    except (TypeError, ValueError, PydanticSerializationError):
+        return len(repr(raw_data).encode())
+
+
+class ResponseCache:
+    """TTL cache per (namespace, endpoint), LRU eviction saat melewati `max_bytes`."""
+
+    def __init__(
+        self,
+        name: str,
+        max_bytes: int,
+        stale_while_revalidate: float = 0,
+        stale_if_error: float = 0,
+    ) -> None:
+        self.name = name
+        self.max_bytes = max_bytes
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
+        self.stats = CacheStats()
+        self._entries: OrderedDict[tuple[str, str], CacheEntry] = OrderedDict()
+        self._namespaces: dict[str, set[tuple[str, str]]] = {}
+        self._refreshing: dict[tuple[str, str], asyncio.Task[None]] = {}
+        # naik tiap invalidate; hasil loader yang mulai sebelumnya tidak disimpan
+        self._generations: dict[str, int] = {}
+        self._bytes = 0
+        self.log = logger.bind(service="ResponseCache", client_name=name)
+
+    def _lookup(self, namespace: str, endpoint: str) -> CacheEntry | None:
+        """Entry fresh atau stale (masih dalam window); entry lewat window dibuang."""
+        key = (namespace, endpoint)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.stale_until <= monotonic():
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return entry
+
+    def get(self, namespace: str, endpoint: str) -> CacheEntry | None:
+        """Ambil entry yang masih fresh saja."""
+        entry = self._lookup(namespace, endpoint)
+        stats = self.stats.endpoint(endpoint)
+        if entry is None or not entry.is_fresh:
+            stats.misses += 1
+            return None
+        stats.hits += 1
+        return entry
+
+    def set(self, namespace: str, endpoint: str, value: Any, ttl: float) -> None:
+        """Simpan value; response error (body gagal di-parse) tidak di-cache."""
+        if ttl <= 0:
+            return
+        if getattr(value, "is_error", False):
+            self.log.debug(f"Skip cache {endpoint}: response error tidak di-cache")
+            return
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            self.log.debug(f"Skip cache {endpoint}: {size}B > budget {self.max_bytes}B")
+            return
+
+        key = (namespace, endpoint)
+        if key in self._entries:
+            self._remove(key)
+        now = monotonic()
+        stale_window = max(self.stale_while_revalidate, self.stale_if_error)
+        self._entries[key] = CacheEntry(
+            value, size, now, now + ttl, now + ttl + stale_window
+        )
+        self._namespaces.setdefault(namespace, set()).add(key)
+        self._bytes += size
+        self._evict()
+
+    def _set_if_current(
+        self, namespace: str, endpoint: str, value: Any, ttl: float, generation: int
+    ) -> None:
+        """`set` hanya jika namespace tidak di-invalidate selama loader berjalan."""
+        if self._generations.get(namespace, 0) != generation:
+            self.log.debug(f"Skip cache {endpoint}: '{namespace}' di-invalidate")
+            return
+        self.set(namespace, endpoint, value, ttl)
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        endpoint: str,
+        ttl: float,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> CacheResult:
+        """Fresh → cache, stale (SWR) → cache + background refresh, else loader.
+
+        Jika loader gagal dan masih ada entry dalam window stale-if-error,
+        entry tersebut dikembalikan alih-alih melempar error.
+        """
+        stats = self.stats.endpoint(endpoint)
+        entry = self._lookup(namespace, endpoint) if ttl > 0 else None
+        now = monotonic()
+
+        if entry is not None and entry.is_fresh:
+            stats.hits += 1
+            return CacheResult(entry.value, CacheState.FRESH, entry)
+
+        if entry is not None and now < entry.expires_at + self.stale_while_revalidate:
+            stats.stale_hits += 1
+            self._schedule_refresh(namespace, endpoint, ttl, loader)
+            return CacheResult(entry.value, CacheState.STALE, entry)
+
+        stats.misses += 1
+        generation = self._generations.get(namespace, 0)
+        try:
+            value = await loader()
+        except (HTTPConnectionError, HttpResponseError) as exc:
+            if entry is not None and now < entry.expires_at + self.stale_if_error:
+                stats.stale_if_error += 1
+                self.log.warning(
+                    f"Upstream error, serving stale {endpoint} "
+                    f"(age={entry.age_s:.1f}s): {exc.message}"
+                )
+                return CacheResult(entry.value, CacheState.STALE_IF_ERROR, entry)
+            raise
+        self._set_if_current(namespace, endpoint, value, ttl, generation)
+        return CacheResult(value, CacheState.MISS)
+
+    def _schedule_refresh(
+        self,
+        namespace: str,
+        endpoint: str,
+        ttl: float,
+        loader: Callable[[], Awaitable[Any]],
+    ) -> None:
+        """Satu background refresh per key; error cukup di-log."""
+        key = (namespace, endpoint)
+        if key in self._refreshing:
+            return
+        generation = self._generations.get(namespace, 0)
+
+        async def _refresh() -> None:
+            try:
+                value = await loader()
+            except Exception as exc:
+                self.log.warning(f"Background refresh {endpoint} gagal: {exc}")
+            else:
+                self._set_if_current(namespace, endpoint, value, ttl, generation)
+                self.stats.endpoint(endpoint).refreshes += 1
+            finally:
+                self._refreshing.pop(key, None)
+
+        self._refreshing[key] = asyncio.create_task(_refresh())
+
+    def invalidate(self, namespace: str) -> int:
+        """Buang semua entry milik satu namespace (akun), termasuk load yang berjalan."""
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+        keys = self._namespaces.pop(namespace, set())
+        for key in [k for k in self._refreshing if k[0] == namespace]:
+            self._refreshing.pop(key).cancel()
+        for key in keys:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry.size
+        if keys:
+            self.stats.invalidations += 1
+            self.log.debug(f"Invalidated {len(keys)} entries for '{namespace}'")
+        return len(keys)
+
+    def _remove(self, key: tuple[str, str]) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+        keys = self._namespaces.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._namespaces[key[0]]
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes and self._entries:
+            key = next(iter(self._entries))
+            self._remove(key)
+            self.stats.evictions += 1
+
+    def info(self, endpoint: str | None = None) -> dict[str, Any]:
+        """State cache untuk debug meta; `endpoint` membatasi stats ke satu endpoint."""
+        endpoints = self.stats.endpoints
+        if endpoint is not None:
+            endpoints = {endpoint: self.stats.endpoint(endpoint)}
+        return {
+            "entries": len(self._entries),
+            "refreshing": len(self._refreshing),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "evictions": self.stats.evictions,
+            "invalidations": self.stats.invalidations,
+            "endpoints": {name: s.snapshot() for name, s in endpoints.items()},
+        }
@@ -0,0 +1,91 @@
+"""Single-flight request coalescing.
+
+Request identik yang datang bersamaan (client, endpoint, params yang sama)
+cukup memicu satu upstream call; caller lain menumpang hasil yang sama.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import httpx
+from loguru import logger
+
+# param yang hanya mempengaruhi format output, bukan hasil upstream
+DEFAULT_IGNORED_PARAMS: frozenset[str] = frozenset({"debug", "text"})
+
+
+@dataclass
+class CoalesceStats:
+    """Counter untuk mengukur berapa upstream call yang dihemat."""
+
+    requests: int = 0
+    upstream: int = 0
+    merged: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.merged / self.requests if self.requests else 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["hit_ratio"] = self.hit_ratio
+        return data
+
+
+class RequestCoalescer:
+    """Share satu in-flight upstream future untuk request identik."""
+
+    def __init__(
+        self,
+        name: str,
+        ignored_params: frozenset[str] = DEFAULT_IGNORED_PARAMS,
+    ) -> None:
+        self.name = name
+        self.ignored_params = ignored_params
+        self.stats = CoalesceStats()
+        self._inflight: dict[Hashable, asyncio.Task[httpx.Response]] = {}
+        self.log = logger.bind(service="RequestCoalescer", client_name=name)
+
+    def make_key(
+        self, method: str, endpoint: str, params: Mapping[str, Any] | None
+    ) -> Hashable:
+        normalized = tuple(
+            sorted(
+                (key, str(value))
+                for key, value in (params or {}).items()
+                if key not in self.ignored_params
+            )
+        )
+        return (self.name, method.upper(), endpoint, normalized)
+
+    async def run(
+        self,
+        key: Hashable,
+        call: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Jalankan `call` sekali per key; caller bersamaan menunggu task yang sama."""
+        self.stats.requests += 1
+        task = self._inflight.get(key)
+        if task is None:
+            self.stats.upstream += 1
+            task = asyncio.ensure_future(call())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._release(key, t))
+        else:
+            self.stats.merged += 1
+            self.log.debug(f"Coalesced request -> {key}")
+
+        # shield: cancel di satu caller tidak boleh membatalkan caller lain
+        return await asyncio.shield(task)
+
+    def _release(self, key: Hashable, task: asyncio.Task[httpx.Response]) -> None:
+        self._inflight.pop(key, None)
+        # tandai exception sudah "dibaca"; caller yang menunggu tetap menerima-nya
+        if not task.cancelled():
+            task.exception()
+
+    @property
+    def inflight(self) -> int:
+        return len(self._inflight)
@@ -0,0 +1,54 @@
+"""Deadline request inbound yang dipropagasi sampai ke call upstream.
+
+Deadline disimpan sebagai waktu absolut (`monotonic`) di contextvar, sehingga
+ikut ter-copy ke task turunan (hedging, coalescing) tanpa perlu di-thread
+lewat argumen. Tanpa deadline (`None`) semua helper di sini menjadi no-op.
+"""
+
+from contextvars import ContextVar, Token
+from time import monotonic
+
+from src.custom.exceptions import DeadlineExceededError
+
+DEADLINE_HEADER = "X-Request-Timeout"
+DEADLINE_QUERY = "deadline"
+
+_deadline: ContextVar[float | None] = ContextVar("request_deadline", default=None)
+
+
+def set_deadline(timeout_s: float) -> Token[float | None]:
+    """Set deadline `timeout_s` detik dari sekarang; simpan token untuk reset."""
+    return _deadline.set(monotonic() + timeout_s)
+
+
+def reset_deadline(token: Token[float | None]) -> None:
+    """Kembalikan deadline ke nilai sebelum `set_deadline`."""
+    _deadline.reset(token)
+
+
+def remaining() -> float | None:
+    """Sisa waktu (detik) sebelum deadline, None jika tidak ada deadline."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - monotonic()
+
+
+def ensure_time_left(endpoint: str) -> float | None:
+    """Fail fast sebelum I/O upstream jika deadline sudah lewat."""
+    left = remaining()
+    if left is not None and left <= 0:
+        raise DeadlineExceededError(
+            context={"endpoint": endpoint, "overdue_s": round(-left, 3)}
+        )
+    return left
+
+
+def shrink_timeouts(
+    timeouts: dict[str, float | None], left: float
+) -> dict[str, float | None]:
+    """Potong connect/read/write/pool timeout supaya tidak melewati deadline."""
+    return {
+        name: left if value is None else min(value, left)
+        for name, value in timeouts.items()
+    }
@@ -0,0 +1,113 @@
+"""Background health check per upstream client.
+
+Probe dikirim lewat pooled client yang sama (keep-alive, tanpa retry) dengan
+interval tetap. Hasilnya disimpan sebagai state (up/down + EWMA latency) yang
+dibaca oleh `/health/*` — probe load balancer tidak pernah memicu traffic
+ke upstream.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from time import perf_counter
+from typing import Any
+
+from httpx import AsyncClient
+from httpx_retries import Retry
+from loguru import logger
+
+from src.core.config.cfg_api_clients import ClientHealth
+
+
+@dataclass
+class HealthState:
+    up: bool | None = None  # None = belum pernah dicek
+    ewma_s: float = 0.0
+    checks: int = 0
+    consecutive_failures: int = 0
+    consecutive_successes: int = 0
+    last_checked: datetime | None = None
+    last_error: str | None = None
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "status": {True: "up", False: "down", None: "unknown"}[self.up],
+            "ewma_ms": round(self.ewma_s * 1000, 2),
+            "checks": self.checks,
+            "consecutive_failures": self.consecutive_failures,
+            "last_checked": self.last_checked.isoformat()
+            if self.last_checked
+            else None,
+            "last_error": self.last_error,
+        }
+
+
+class HealthChecker:
+    def __init__(self, name: str, client: AsyncClient, settings: ClientHealth) -> None:
+        self.name = name
+        self.client = client
+        self.settings = settings
+        self.state = HealthState()
+        self._no_retry = Retry(total=0)
+        self.log = logger.bind(service="HealthChecker", client_name=name)
+
+    async def check(self) -> bool:
+        """Satu probe; status < 500 dianggap sehat."""
+        settings = self.settings
+        start = perf_counter()
+        error: str | None = None
+        try:
+            response = await self.client.request(
+                settings.method,
+                settings.path,
+                timeout=settings.timeout_s,
+                extensions={"retry": self._no_retry},
+            )
+            if response.status_code >= 500:
+                error = f"status {response.status_code}"
+        except Exception as exc:
+            error = repr(exc)
+        self._record(error, perf_counter() - start)
+        return error is None
+
+    def _record(self, error: str | None, elapsed_s: float) -> None:
+        state, settings = self.state, self.settings
+        state.checks += 1
+        state.last_checked = datetime.now(UTC)
+        state.last_error = error
+        if state.ewma_s == 0.0:
+            state.ewma_s = elapsed_s
+        else:
+            alpha = settings.ewma_alpha
+            state.ewma_s = alpha * elapsed_s + (1 - alpha) * state.ewma_s
+
+        if error is None:
+            state.consecutive_failures = 0
+            state.consecutive_successes += 1
+            healthy = state.consecutive_successes >= settings.success_threshold
+            if state.up is not True and healthy:
+                self._set_up(True)
+        else:
+            state.consecutive_successes = 0
+            state.consecutive_failures += 1
+            unhealthy = state.consecutive_failures >= settings.failure_threshold
+            # state awal (unknown) langsung down pada kegagalan pertama
+            if state.up is None or (state.up and unhealthy):
+                self._set_up(False)
+
+    def _set_up(self, up: bool) -> None:
+        if self.state.up is not None:
+            log = self.log.info if up else self.log.warning
+            log(
+                f"Upstream '{self.name}' {'UP' if up else 'DOWN'}: {self.state.last_error}"
+            )
+        self.state.up = up
+
+    async def run(self) -> None:
+        """Loop probe sampai task di-cancel (stop_all)."""
+        while True:
+            await self.check()
+            await asyncio.sleep(self.settings.interval_s)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {"critical": self.settings.critical, **self.state.snapshot()}
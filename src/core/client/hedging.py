@@ -0,0 +1,181 @@
+"""Latency-adaptive hedged requests untuk endpoint idempotent.
+
+Jika response belum datang setelah p95 latency endpoint (rolling, in-process),
+request kedua dikirim; response sukses (< 500) pertama menang dan sisanya
+di-cancel. Latency hanya dicatat dari response sukses.
+Extra load dibatasi hedge budget (token bucket) per client.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from time import perf_counter
+from typing import Any
+
+import httpx
+from loguru import logger
+
+from src.core.config.cfg_api_clients import ClientHedge
+
+
+class LatencyTracker:
+    """Rolling window latency per endpoint dengan quantile yang di-cache."""
+
+    def __init__(self, window_size: int, quantile: float) -> None:
+        self.quantile = quantile
+        self._samples: deque[float] = deque(maxlen=window_size)
+        self._cached: float | None = None
+        self._dirty = 0
+
+    def observe(self, elapsed_s: float) -> None:
+        self._samples.append(elapsed_s)
+        self._dirty += 1
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def value(self) -> float | None:
+        if not self._samples:
+            return None
+        # sort ulang tiap 10 sample baru saja, bukan tiap request
+        if self._cached is None or self._dirty >= 10:
+            ordered = sorted(self._samples)
+            index = min(int(len(ordered) * self.quantile), len(ordered) - 1)
+            self._cached = ordered[index]
+            self._dirty = 0
+        return self._cached
+
+
+@dataclass
+class HedgeStats:
+    requests: int = 0
+    hedged: int = 0
+    hedge_wins: int = 0
+    budget_exhausted: int = 0
+
+    def snapshot(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["hedge_rate"] = self.hedged / self.requests if self.requests else 0.0
+        return data
+
+
+class HedgeBudget:
+    """Token bucket: tiap request menambah `ratio` token, tiap hedge memakai 1."""
+
+    def __init__(self, percent: float, max_tokens: float = 10.0) -> None:
+        self.ratio = percent / 100
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+
+    def deposit(self) -> None:
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_acquire(self) -> bool:
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+
+async def _close_all(responses: list[httpx.Response]) -> None:
+    for response in responses:
+        await response.aclose()
+
+
+class RequestHedger:
+    def __init__(self, name: str, settings: ClientHedge) -> None:
+        self.name = name
+        self.settings = settings
+        self.budget = HedgeBudget(settings.budget_percent)
+        self.stats = HedgeStats()
+        self._latency: dict[str, LatencyTracker] = {}
+        self.log = logger.bind(service="RequestHedger", client_name=name)
+
+    def tracker(self, endpoint: str) -> LatencyTracker:
+        tracker = self._latency.get(endpoint)
+        if tracker is None:
+            tracker = self._latency[endpoint] = LatencyTracker(
+                self.settings.window_size, self.settings.quantile
+            )
+        return tracker
+
+    def delay_for(self, endpoint: str) -> float | None:
+        """Delay sebelum hedge; None jika sample belum cukup."""
+        tracker = self.tracker(endpoint)
+        if len(tracker) < self.settings.min_samples:
+            return None
+        return max(tracker.value() or 0.0, self.settings.min_delay_s)
+
+    async def _hedge_after(
+        self,
+        endpoint: str,
+        delay: float,
+        pending: set[asyncio.Future[httpx.Response]],
+        call: Callable[[], Awaitable[httpx.Response]],
+    ) -> None:
+        """Kirim request kedua jika primary belum selesai setelah `delay`."""
+        done, _ = await asyncio.wait(pending, timeout=delay)
+        if done:
+            return
+        if self.budget.try_acquire():
+            self.stats.hedged += 1
+            self.log.debug(f"Hedging {endpoint} after {delay:.3f}s")
+            pending.add(asyncio.ensure_future(call()))
+        else:
+            self.stats.budget_exhausted += 1
+
+    async def run(
+        self, endpoint: str, call: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        self.stats.requests += 1
+        self.budget.deposit()
+        start = perf_counter()
+        delay = self.delay_for(endpoint)
+
+        primary = asyncio.ensure_future(call())
+        pending: set[asyncio.Future[httpx.Response]] = {primary}
+        first_error: BaseException | None = None
+        # 5xx dikembalikan httpx (tidak di-raise) → dihitung gagal, bukan pemenang
+        failed: list[httpx.Response] = []
+        try:
+            if delay is not None:
+                await self._hedge_after(endpoint, delay, pending, call)
+
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    exc = task.exception()
+                    if exc is not None:
+                        first_error = first_error or exc
+                        continue
+                    response = task.result()
+                    if response.status_code >= 500:
+                        failed.append(response)
+                        continue
+                    if task is not primary:
+                        self.stats.hedge_wins += 1
+                    self.tracker(endpoint).observe(perf_counter() - start)
+                    await _close_all(failed)
+                    return response
+        finally:
+            for task in pending:
+                task.cancel()
+
+        # semua attempt gagal: response 5xx lebih informatif daripada exception
+        if failed:
+            await _close_all(failed[1:])
+            return failed[0]
+        assert first_error is not None
+        raise first_error
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            **self.stats.snapshot(),
+            "budget_tokens": round(self.budget.tokens, 2),
+            "p_latency_s": {
+                endpoint: tracker.value() for endpoint, tracker in self._latency.items()
+            },
+        }
@@ -0,0 +1,281 @@
+"""Decode JSON dari response stream tanpa buffer body penuh.
+
+Mode default httpx membaca seluruh body ke memory (`resp.content`), lalu
+`json()` membangun object Python di atasnya — dua salinan besar per request.
+Di sini body dibaca per chunk lewat `client.send(..., stream=True)`:
+
+- ukuran body dibatasi (`Content-Length` dicek dulu, lalu byte yang diterima),
+  response yang terlalu besar di-abort sebelum selesai dibaca;
+- object di-decode per member, termasuk object nested (mis. `data` milik
+  Digipos); member di luar `fields` (path bertitik, `data.items`) dibuang
+  setelah di-parse, jadi payload besar tidak tinggal utuh sebagai string.
+
+Array dan top-level selain object (list/primitive) tetap di-buffer utuh lalu
+di-decode sekali.
+"""
+
+import codecs
+import json
+import re
+from collections.abc import Collection
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from src.custom.exceptions import ResponseTooLargeError
+
+_WS = re.compile(r"[ \t\n\r]*")
+# tanpa seleksi path, object hanya di-decode per member sampai level ini
+# (top-level + envelope `data`); lebih dalam di-decode sekali oleh raw_decode
+_MEMBER_DEPTH = 2
+
+
+class _IncompleteError(Exception):
+    """Buffer belum berisi satu member utuh — tunggu chunk berikutnya."""
+
+
+type _Selection = dict[str, "_Selection"] | None
+
+
+def parse_fields(fields: Collection[str] | None) -> _Selection:
+    """`["status", "data.items"]` → `{"status": None, "data": {"items": None}}`.
+
+    None = ambil semua; path yang lebih pendek menang (`data` > `data.items`).
+    """
+    if not fields:
+        return None
+    tree: dict[str, _Selection] = {}
+    for path in sorted(fields, key=lambda field: field.count(".")):
+        node = tree
+        *parents, leaf = path.split(".")
+        for key in parents:
+            child = node.setdefault(key, {})
+            if child is None:
+                break
+            node = child
+        else:
+            node[leaf] = None
+    return tree
+
+
+@dataclass(slots=True)
+class _Frame:
+    """Object yang sedang di-decode; `result` None = member-nya dibuang."""
+
+    result: dict[str, Any] | None
+    select: _Selection
+    members: int = 0
+
+    def child(self, key: str) -> "_Frame":
+        if self.result is None:
+            return _Frame(None, None)
+        if self.select is None:
+            return _Frame({}, None)
+        if key in self.select:
+            return _Frame({}, self.select[key])
+        return _Frame(None, None)
+
+    def keeps(self, key: str) -> bool:
+        return self.result is not None and (self.select is None or key in self.select)
+
+
+class StreamingJSONDecoder:
+    """Incremental decoder untuk top-level JSON object.
+
+    `feed()` menerima bytes (boleh terpotong di tengah karakter UTF-8),
+    `close()` mengembalikan hasil. Object di-decode per member lewat stack
+    `_Frame`: sepanjang path `fields` (`a.b`) dan sampai `_MEMBER_DEPTH`, jadi
+    yang perlu utuh di buffer hanya satu member; member di luar `fields`
+    langsung dibuang.
+    Parse ulang atas member yang belum lengkap hanya dilakukan setelah buffer
+    tumbuh 2x, sehingga total kerja tetap linear.
+    """
+
+    def __init__(self, fields: Collection[str] | None = None) -> None:
+        self.fields = parse_fields(fields)
+        self.result: dict[str, Any] = {}
+        self._json = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buf = ""
+        self._pending: list[str] = []
+        self._pending_len = 0
+        self._retry_at = 0
+        self._stack: list[_Frame] = []
+        self._expect = "key"  # key | delim (setelah value selesai)
+        self._state = "start"  # start → member → done | whole
+
+    def feed(self, chunk: bytes) -> None:
+        text = self._utf8.decode(chunk)
+        if not text:
+            return
+        self._pending.append(text)
+        self._pending_len += len(text)
+        if self._state == "whole":
+            return
+        if len(self._buf) + self._pending_len >= self._retry_at:
+            self._parse(final=False)
+
+    def close(self) -> Any:
+        tail = self._utf8.decode(b"", final=True)
+        if tail:
+            self._pending.append(tail)
+        self._parse(final=True)
+        if self._state == "whole":
+            return json.loads(self._buf)
+        if self._state != "done":
+            raise json.JSONDecodeError("Unexpected end of JSON", self._buf, 0)
+        if self._buf.strip():
+            raise json.JSONDecodeError("Extra data", self._buf, 0)
+        return self.result
+
+    def _flush(self) -> None:
+        if self._pending:
+            self._buf += "".join(self._pending)
+            self._pending.clear()
+            self._pending_len = 0
+
+    def _parse(self, final: bool) -> None:
+        self._flush()
+        pos = 0
+        if self._state == "start":
+            pos = _WS.match(self._buf).end()
+            if pos == len(self._buf):
+                return
+            if self._buf[pos] != "{":
+                self._state = "whole"
+                return
+            pos += 1
+            self._stack.append(_Frame(self.result, self.fields))
+            self._state = "member"
+
+        while self._state == "member":
+            try:
+                pos = self._step(pos)
+            except (_IncompleteError, json.JSONDecodeError):
+                if final:
+                    raise json.JSONDecodeError(
+                        "Invalid JSON object", self._buf, pos
+                    ) from None
+                break
+        # compact sekali per parse, bukan per member
+        self._buf = self._buf[pos:]
+        self._retry_at = 2 * len(self._buf)
+
+    def _step(self, start: int) -> int:
+        """Satu langkah atomik: member baru, atau delimiter setelah value."""
+        buf = self._buf
+        frame = self._stack[-1]
+        pos = self._skip(buf, start)
+        if self._expect == "delim":
+            if buf[pos] == ",":
+                self._expect = "key"
+                return pos + 1
+            if buf[pos] == "}":
+                return self._close(pos)
+            raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos)
+
+        if buf[pos] == "}" and not frame.members:
+            return self._close(pos)
+        if buf[pos] != '"':
+            raise json.JSONDecodeError("Expecting property name", buf, pos)
+        key, pos = self._json.raw_decode(buf, pos)
+        pos = self._skip(buf, pos)
+        if buf[pos] != ":":
+            raise json.JSONDecodeError("Expecting ':' delimiter", buf, pos)
+        pos = self._skip(buf, pos + 1)
+        child = frame.child(key) if buf[pos] == "{" else None
+        if child is not None and (
+            isinstance(child.select, dict) or len(self._stack) < _MEMBER_DEPTH
+        ):
+            # object: turun satu level, member-nya di-decode satu per satu
+            if child.result is not None:
+                frame.result[key] = child.result
+            frame.members += 1
+            self._stack.append(child)
+            return pos + 1
+        value, end = self._json.raw_decode(buf, pos)
+        # harus ada karakter setelah value: angka di ujung buffer bisa terpotong
+        self._skip(buf, end)
+        frame.members += 1
+        if frame.keeps(key):
+            frame.result[key] = value
+        self._expect = "delim"
+        return end
+
+    def _close(self, pos: int) -> int:
+        self._stack.pop()
+        if not self._stack:
+            self._state = "done"
+        self._expect = "delim"
+        return pos + 1
+
+    @staticmethod
+    def _skip(buf: str, pos: int) -> int:
+        pos = _WS.match(buf, pos).end()
+        if pos >= len(buf):
+            raise _IncompleteError
+        return pos
+
+
+class JSONStreamReader:
+    """Baca body streamed response sebagai JSON; hasil disimpan di instance.
+
+    JSON invalid tidak di-raise (sama seperti parser non-stream): `error` diisi
+    dan `head` berisi awal body mentah untuk context. Body yang melewati
+    `max_bytes` di-raise sebagai `ResponseTooLargeError`.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int | None = None,
+        fields: Collection[str] | None = None,
+        head_bytes: int = 500,
+    ) -> None:
+        self.max_bytes = max_bytes
+        self.fields = fields
+        self.head_bytes = head_bytes
+        self.value: Any = None
+        self.error: str | None = None
+        self.head = ""
+        self.size = 0
+
+    def _check_size(self, response: httpx.Response, size: int) -> None:
+        if self.max_bytes is not None and size > self.max_bytes:
+            raise ResponseTooLargeError(
+                context={
+                    "url": str(response.url.copy_with(query=None)),
+                    "size": size,
+                    "max_bytes": self.max_bytes,
+                },
+            )
+
+    async def read(self, response: httpx.Response) -> None:
+        """Decode body; berhenti membaca begitu limit terlewati."""
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self._check_size(response, int(length))
+
+        decoder = StreamingJSONDecoder(self.fields)
+        head = bytearray()
+        try:
+            async for chunk in response.aiter_bytes():
+                self.size += len(chunk)
+                self._check_size(response, self.size)
+                if len(head) < self.head_bytes:
+                    head += chunk[: self.head_bytes - len(head)]
+                decoder.feed(chunk)
+            self.value = decoder.close()
+        except ValueError as exc:  # JSONDecodeError / UnicodeDecodeError
+            self.error = str(exc)
+        finally:
+            self.head = head.decode(errors="replace")
+
+    async def read_head(self, response: httpx.Response) -> None:
+        """Untuk response error: cukup ambil awal body sebagai context."""
+        head = bytearray()
+        async for chunk in response.aiter_bytes():
+            head += chunk
+            if len(head) >= self.head_bytes:
+                break
+        self.head = head[: self.head_bytes].decode(errors="replace")
@@ -0,0 +1,148 @@
+"""AIMD adaptive concurrency limiter per upstream client.
+
+Limit in-flight naik additive (+1 per ~`limit` request sukses) selama latency
+di bawah target, dan turun multiplicative saat timeout/429/5xx. Request yang
+melebihi limit menunggu di antrian terbatas (FIFO).
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from time import perf_counter
+from typing import Any
+
+from loguru import logger
+
+from src.core.config.cfg_api_clients import ClientConcurrency
+from src.custom.exceptions import HTTPConnectionError, HttpResponseError
+
+
+@dataclass
+class LimiterStats:
+    acquired: int = 0
+    queued: int = 0
+    rejected: int = 0
+    drops: int = 0
+    total_wait_s: float = 0.0
+    max_wait_s: float = 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["avg_wait_s"] = self.total_wait_s / self.queued if self.queued else 0.0
+        return data
+
+
+class AdaptiveLimiter:
+    def __init__(self, name: str, settings: ClientConcurrency, max_limit: int) -> None:
+        self.name = name
+        self.settings = settings
+        self.max_limit = max_limit
+        self.limit = float(min(settings.initial_limit, max_limit))
+        self.in_flight = 0
+        self.stats = LimiterStats()
+        self._waiters: deque[asyncio.Future[None]] = deque()
+        self.log = logger.bind(service="AdaptiveLimiter", client_name=name)
+
+    @property
+    def queue_depth(self) -> int:
+        return len(self._waiters)
+
+    def _has_capacity(self) -> bool:
+        return self.in_flight < int(self.limit)
+
+    async def acquire(self, endpoint: str, timeout_s: float | None = None) -> None:
+        """Ambil slot; tunggu di antrian maksimal `queue_timeout_s` / `timeout_s`."""
+        if self._has_capacity() and not self._waiters:
+            self.in_flight += 1
+            self.stats.acquired += 1
+            return
+
+        if len(self._waiters) >= self.settings.max_queue:
+            self.stats.rejected += 1
+            raise HTTPConnectionError(
+                message=f"Concurrency queue full for '{self.name}'",
+                context={"endpoint": endpoint, **self.snapshot()},
+            )
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        start = perf_counter()
+        wait_s = self.settings.queue_timeout_s
+        if timeout_s is not None:
+            wait_s = max(min(wait_s, timeout_s), 0.0)
+        try:
+            await asyncio.wait_for(waiter, wait_s)
+        except TimeoutError as exc:
+            # slot diberikan `_wake()` tepat sebelum timeout → tetap dipakai
+            if not (waiter.done() and not waiter.cancelled()):
+                self.stats.rejected += 1
+                raise HTTPConnectionError(
+                    message=f"Concurrency queue timeout for '{self.name}'",
+                    context={"endpoint": endpoint, **self.snapshot()},
+                ) from exc
+        except asyncio.CancelledError:
+            # slot sudah diberikan tapi caller batal → kembalikan
+            if waiter.done() and not waiter.cancelled():
+                self.in_flight -= 1
+                self._wake()
+            raise
+        finally:
+            if waiter in self._waiters:
+                self._waiters.remove(waiter)
+
+        waited = perf_counter() - start
+        self.stats.acquired += 1
+        self.stats.queued += 1
+        self.stats.total_wait_s += waited
+        self.stats.max_wait_s = max(self.stats.max_wait_s, waited)
+
+    def release(self, dropped: bool, elapsed_s: float) -> None:
+        """Kembalikan slot dan sesuaikan limit dari outcome request."""
+        self.in_flight -= 1
+        settings = self.settings
+        if dropped:
+            self.stats.drops += 1
+            self.limit = max(settings.min_limit, self.limit * settings.backoff_ratio)
+        elif elapsed_s <= settings.target_latency_s:
+            self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        self._wake()
+
+    @asynccontextmanager
+    async def slot(
+        self, endpoint: str, timeout_s: float | None = None
+    ) -> AsyncIterator[None]:
+        """acquire/release untuk caller di atas HttpRequestService.
+
+        Outcome dibaca dari exception: connection error / 429 / 5xx = drop.
+        """
+        await self.acquire(endpoint, timeout_s)
+        start = perf_counter()
+        dropped = False
+        try:
+            yield
+        except HTTPConnectionError:
+            dropped = True
+            raise
+        except HttpResponseError as exc:
+            status_code = exc.context.get("status_code", 0)
+            dropped = status_code == 429 or status_code >= 500
+            raise
+        finally:
+            self.release(dropped, perf_counter() - start)
+
+    def _wake(self) -> None:
+        while self._waiters and self._has_capacity():
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "limit": int(self.limit),
+            "in_flight": self.in_flight,
+            "queue_depth": self.queue_depth,
+            **self.stats.snapshot(),
+        }
@@ -1,13 +1,16 @@
 import httpx
 from loguru import logger
 
-from core.client.base_factory import HttpClientFactory
 from core.client.base_manager import HttpClientManager
 from src.core.config.cfg_api_clients import ApiBaseConfig
 
 
 async def check_url_reachable(url: str, timeout: float | None = 1.0) -> bool:
-    """Cek apakah base_url reachable tanpa ngeblok service."""
+    """Cek apakah base_url reachable tanpa ngeblok service.
+
+    One-off check dengan client baru; untuk monitoring rutin pakai
+    `HttpClientManager.health_snapshot()`.
+    """
     log = logger.bind(service="URLValidator")
     try:
         async with httpx.AsyncClient(timeout=timeout) as client:
@@ -27,10 +30,7 @@ async def setup_client(  # noqa: RUF029
 ) -> httpx.AsyncClient:
     """Setup client dari config dan register ke manager."""
     log = logger.bind(service=config.name)
-    # if not await check_url_reachable(str(config.base_url)):
-    #     raise RuntimeError(f"Base URL '{config.base_url}' tidak reachable")
-
-    client = HttpClientFactory.create_client(config)
-    manager.register_client(config.name, client)
+    # reachability dipantau HealthChecker milik manager (background, pooled)
+    client = manager.setup_client(config)
     log.success(f"Client '{config.name}' initialized with base={config.base_url}")
     return client
@@ -0,0 +1,216 @@
+"""Token bucket rate limiter per (akun, endpoint).
+
+Bucket boleh "berutang": tiap request mengambil 1 token, dan jika token
+negatif request menunggu `-tokens / rate` detik. Antrian jadi FIFO tanpa loop
+polling, dan request yang pasti menunggu terlalu lama langsung ditolak.
+
+Rate disesuaikan dari sinyal upstream:
+- `Retry-After` / 429 → bucket diblok selama durasi tersebut, rate dipotong.
+- `RateLimit-Remaining` + `RateLimit-Reset` → rate = remaining / reset. Reset
+  boleh delta detik atau epoch timestamp (umum untuk `X-RateLimit-Reset`).
+Blok dari header upstream dibatasi `max_block_s`.
+- response sukses → rate pulih bertahap ke rate konfigurasi.
+"""
+
+import asyncio
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from time import monotonic, time
+from typing import Any
+
+import httpx
+from loguru import logger
+
+from src.core.config.cfg_api_clients import ClientRateLimit
+from src.custom.exceptions import RateLimitExceededError
+
+
+def _header_float(headers: httpx.Headers, *names: str) -> float | None:
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return float(value)
+        except ValueError:
+            continue
+    return None
+
+
+def reset_seconds(value: float) -> float:
+    """`RateLimit-Reset` → detik dari sekarang; nilai epoch dikonversi ke delta."""
+    if value > time() - 1e9:
+        return max(value - time(), 0.0)
+    return value
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """`Retry-After` dalam detik atau HTTP-date → detik dari sekarang."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((when - datetime.now(UTC)).total_seconds(), 0.0)
+
+
+@dataclass
+class BucketStats:
+    requests: int = 0
+    queued: int = 0
+    rejected: int = 0
+    throttled: int = 0
+    total_wait_s: float = 0.0
+    max_wait_s: float = 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["avg_wait_s"] = self.total_wait_s / self.queued if self.queued else 0.0
+        return data
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float, settings: ClientRateLimit) -> None:
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.settings = settings
+        self.tokens = burst
+        self.updated = monotonic()
+        self.waiting = 0
+        self.stats = BucketStats()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self.updated
+        self.tokens = min(self.burst, self.tokens + elapsed * self.rate)
+        self.updated = now
+
+    def reserve(self) -> float:
+        """Ambil 1 token (boleh utang); return detik yang harus ditunggu."""
+        self._refill(monotonic())
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def refund(self) -> None:
+        self.tokens = min(self.burst, self.tokens + 1)
+
+    def block(self, seconds: float) -> None:
+        """Tidak ada token selama `seconds`; antrian setelahnya tetap ter-spasi."""
+        self._refill(monotonic())
+        self.tokens = min(self.tokens, -seconds * self.rate)
+
+    def set_rate(self, rate: float) -> None:
+        self._refill(monotonic())
+        self.rate = min(max(rate, self.settings.min_rate_per_s), self.base_rate)
+
+    def snapshot(self) -> dict[str, Any]:
+        self._refill(monotonic())
+        return {
+            "rate_per_s": round(self.rate, 3),
+            "tokens": round(self.tokens, 2),
+            "waiting": self.waiting,
+            **self.stats.snapshot(),
+        }
+
+
+class AccountRateLimiter:
+    """Bucket per (akun, endpoint) dengan antrian terbatas."""
+
+    def __init__(self, name: str, settings: ClientRateLimit) -> None:
+        self.name = name
+        self.settings = settings
+        self._buckets: dict[tuple[str, str], TokenBucket] = {}
+        self.log = logger.bind(service="AccountRateLimiter", client_name=name)
+
+    def bucket(self, account: str, endpoint: str) -> TokenBucket:
+        key = (account, endpoint)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            settings = self.settings
+            rate = settings.rate_per_s.get(endpoint, settings.default_rate_per_s)
+            bucket = self._buckets[key] = TokenBucket(rate, settings.burst, settings)
+        return bucket
+
+    async def acquire(
+        self, account: str, endpoint: str, max_wait_s: float | None = None
+    ) -> float:
+        """Tunggu giliran; return lama menunggu. Raise jika antrian penuh/terlalu lama."""
+        bucket = self.bucket(account, endpoint)
+        stats = bucket.stats
+        stats.requests += 1
+        wait = bucket.reserve()
+        if wait <= 0:
+            return 0.0
+
+        limit = self.settings.queue_timeout_s
+        if max_wait_s is not None:
+            limit = min(limit, max_wait_s)
+        if bucket.waiting >= self.settings.max_queue or wait > limit:
+            bucket.refund()
+            stats.rejected += 1
+            raise RateLimitExceededError(
+                context={
+                    "account": account,
+                    "endpoint": endpoint,
+                    "retry_in_s": round(wait, 3),
+                    "waiting": bucket.waiting,
+                },
+            )
+
+        bucket.waiting += 1
+        try:
+            await asyncio.sleep(wait)
+        except asyncio.CancelledError:
+            bucket.refund()
+            raise
+        finally:
+            bucket.waiting -= 1
+        stats.queued += 1
+        stats.total_wait_s += wait
+        stats.max_wait_s = max(stats.max_wait_s, wait)
+        return wait
+
+    def observe(
+        self, account: str, endpoint: str, status_code: int, headers: httpx.Headers
+    ) -> None:
+        """Sesuaikan bucket dari status & header rate-limit response upstream."""
+        bucket = self.bucket(account, endpoint)
+        retry_after = parse_retry_after(headers.get("Retry-After"))
+        remaining = _header_float(
+            headers, "RateLimit-Remaining", "X-RateLimit-Remaining"
+        )
+        reset = _header_float(headers, "RateLimit-Reset", "X-RateLimit-Reset")
+        if reset is not None:
+            reset = reset_seconds(reset)
+        max_block = self.settings.max_block_s
+
+        if status_code == 429:
+            bucket.stats.throttled += 1
+            bucket.set_rate(bucket.rate * self.settings.backoff_ratio)
+            block = retry_after if retry_after is not None else 1 / bucket.rate
+            block = min(block, max_block)
+            bucket.block(block)
+            self.log.warning(
+                f"Throttled {account}/{endpoint}: block {block:.1f}s, "
+                f"rate → {bucket.rate:.2f}/s"
+            )
+        elif remaining is not None and reset is not None and reset > 0:
+            if remaining <= 0:
+                bucket.block(min(reset, max_block))
+            else:
+                bucket.set_rate(remaining / reset)
+        elif bucket.rate < bucket.base_rate:
+            step = bucket.base_rate * self.settings.recovery_ratio
+            bucket.set_rate(bucket.rate + step)
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            f"{account}:{endpoint}": bucket.snapshot()
+            for (account, endpoint), bucket in self._buckets.items()
+        }
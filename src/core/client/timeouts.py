@@ -0,0 +1,66 @@
+"""Read timeout adaptif per endpoint dari rolling quantile latency.
+
+Read timeout = quantile (default p99) x multiplier, dibatasi antara
+`adaptive_min_s` dan read timeout yang dikonfigurasi. Read timeout yang
+kena ikut dicatat sebagai sample supaya timeout bisa naik lagi saat upstream
+melambat (tanpa itu window hanya berisi request cepat).
+"""
+
+from typing import Any
+
+import httpx
+from loguru import logger
+
+from src.core.client.hedging import LatencyTracker
+from src.core.config.cfg_api_clients import ClientTimeout
+
+
+class AdaptiveTimeout:
+    def __init__(self, name: str, settings: ClientTimeout) -> None:
+        self.name = name
+        self.settings = settings
+        self._latency: dict[str, LatencyTracker] = {}
+        self.timeouts = 0
+        self.log = logger.bind(service="AdaptiveTimeout", client_name=name)
+
+    def tracker(self, endpoint: str) -> LatencyTracker:
+        tracker = self._latency.get(endpoint)
+        if tracker is None:
+            tracker = self._latency[endpoint] = LatencyTracker(
+                self.settings.window_size, self.settings.adaptive_quantile
+            )
+        return tracker
+
+    def observe(self, endpoint: str, elapsed_s: float, timed_out: bool = False) -> None:
+        if timed_out:
+            self.timeouts += 1
+        self.tracker(endpoint).observe(elapsed_s)
+
+    def read_timeout(self, endpoint: str, ceiling: float | None) -> float | None:
+        """Read timeout adaptif; `ceiling` (config) jika sample belum cukup."""
+        tracker = self.tracker(endpoint)
+        if len(tracker) < self.settings.min_samples:
+            return ceiling
+        adaptive = max(
+            (tracker.value() or 0.0) * self.settings.adaptive_multiplier,
+            self.settings.adaptive_min_s,
+        )
+        return adaptive if ceiling is None else min(adaptive, ceiling)
+
+    def apply(self, endpoint: str, timeout: httpx.Timeout) -> httpx.Timeout:
+        """Timeout dengan read diganti nilai adaptif (connect/write/pool tetap)."""
+        read = self.read_timeout(endpoint, timeout.read)
+        if read == timeout.read:
+            return timeout
+        return httpx.Timeout(
+            connect=timeout.connect, read=read, write=timeout.write, pool=timeout.pool
+        )
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "read_timeouts": self.timeouts,
+            "read_timeout_s": {
+                endpoint: self.read_timeout(endpoint, self.settings.read)
+                for endpoint in self._latency
+            },
+        }
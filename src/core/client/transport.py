@@ -0,0 +1,320 @@
+"""Transport stack builder untuk AsyncClient.
+
+httpx mengabaikan `limits=` dan `http2=` pada `AsyncClient` begitu `transport=`
+custom diberikan, jadi pool harus dibangun eksplisit di layer paling bawah.
+
+Urutan layer (dalam → luar): pool → balancer (jika >1 host) → retry (budgeted)
+→ metrics.
+"""
+
+import asyncio
+from dataclasses import asdict, dataclass, field
+from time import perf_counter
+from typing import Any
+
+import httpx
+from httpx_retries import Retry
+from loguru import logger
+
+from src.config.client_config import ClientBaseConfig, ClientTimeout
+from src.core.client import deadline
+from src.core.client.balancer import BalancerTransport
+
+
+@dataclass
+class TransportMetrics:
+    """Counter sederhana per client (in-process, tanpa lock — single event loop)."""
+
+    requests: int = 0
+    in_flight: int = 0
+    errors: int = 0
+    total_latency_s: float = 0.0
+    status: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def avg_latency_s(self) -> float:
+        done = self.requests - self.in_flight
+        return self.total_latency_s / done if done else 0.0
+
+    def snapshot(self) -> dict[str, Any]:
+        data = asdict(self)
+        data["avg_latency_s"] = self.avg_latency_s
+        return data
+
+
+class MetricsTransport(httpx.AsyncBaseTransport):
+    """Layer paling luar: hitung request, status dan latency per client."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport) -> None:
+        self.transport = transport
+        self.metrics = TransportMetrics()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        metrics = self.metrics
+        metrics.requests += 1
+        metrics.in_flight += 1
+        start = perf_counter()
+        try:
+            response = await self.transport.handle_async_request(request)
+        except Exception:
+            metrics.errors += 1
+            raise
+        else:
+            code = response.status_code
+            metrics.status[code] = metrics.status.get(code, 0) + 1
+            return response
+        finally:
+            metrics.in_flight -= 1
+            metrics.total_latency_s += perf_counter() - start
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+
+class RetryBudget:
+    """Token bucket retry: tiap request sukses (< 400) deposit `ratio`, retry pakai 1.
+
+    Saat upstream brownout (banyak gagal), deposit berhenti sehingga retry
+    otomatis mereda alih-alih melipatgandakan traffic.
+    """
+
+    def __init__(self, ratio: float, max_tokens: float) -> None:
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+        self.exhausted = 0
+
+    def deposit(self) -> None:
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        if self.tokens < 1:
+            self.exhausted += 1
+            return False
+        self.tokens -= 1
+        return True
+
+
+class BudgetedRetryTransport(httpx.AsyncBaseTransport):
+    """Retry dengan policy `httpx_retries.Retry`, dibatasi `RetryBudget`.
+
+    Backoff (jitter) & `Retry-After` dihitung oleh `Retry`; retry yang backoff-nya
+    melewati deadline request di-skip. Retry per request bisa di-override lewat
+    `request.extensions["retry"]`.
+    """
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        retry: Retry,
+        budget: RetryBudget,
+    ) -> None:
+        self.transport = transport
+        self.retry = retry
+        self.budget = budget
+        self.retries: dict[str, int] = {}
+        self.deadline_skipped = 0
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        retry: Retry = request.extensions.get("retry", self.retry)
+        if not retry.is_retryable_method(request.method):
+            return await self.transport.handle_async_request(request)
+
+        endpoint = request.url.path
+        while True:
+            outcome = await self._attempt(request, retry)
+            is_response = isinstance(outcome, httpx.Response)
+            if is_response and not retry.is_retryable_status_code(outcome.status_code):
+                # hanya sukses yang mengisi budget; 429/5xx tidak
+                if outcome.status_code < 400:
+                    self.budget.deposit()
+                return outcome
+
+            next_retry = retry.increment()
+            wait = next_retry._calculate_sleep(outcome.headers if is_response else {})
+            if not self._may_retry(retry, request, wait):
+                if is_response:
+                    return outcome
+                raise outcome
+
+            if is_response:
+                await outcome.aclose()
+            self.retries[endpoint] = self.retries.get(endpoint, 0) + 1
+            retry = next_retry
+            await asyncio.sleep(wait)
+
+    async def _attempt(
+        self, request: httpx.Request, retry: Retry
+    ) -> httpx.Response | Exception:
+        """Satu attempt; exception yang bisa di-retry dikembalikan, bukan di-raise."""
+        try:
+            return await self.transport.handle_async_request(request)
+        except Exception as exc:
+            if not retry.is_retryable_exception(exc):
+                raise
+            return exc
+
+    def _may_retry(self, retry: Retry, request: httpx.Request, wait: float) -> bool:
+        return (
+            not retry.is_exhausted()
+            and self._fits_deadline(request, wait)
+            and self.budget.try_withdraw()
+        )
+
+    def _fits_deadline(self, request: httpx.Request, wait: float) -> bool:
+        """Retry hanya jika masih ada waktu setelah backoff; potong timeout attempt."""
+        left = deadline.remaining()
+        if left is None:
+            return True
+        left -= wait
+        if left <= 0:
+            self.deadline_skipped += 1
+            return False
+        timeouts = request.extensions.get("timeout")
+        if timeouts is not None:
+            request.extensions["timeout"] = deadline.shrink_timeouts(timeouts, left)
+        return True
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
+    def snapshot(self) -> dict[str, Any]:
+        return {
+            "total": self.retry.total,
+            "budget_tokens": round(self.budget.tokens, 2),
+            "budget_exhausted": self.budget.exhausted,
+            "deadline_skipped": self.deadline_skipped,
+            "retries_by_endpoint": dict(self.retries),
+        }
+
+
+class TransportStack(httpx.AsyncBaseTransport):
+    """Komposisi layer transport yang dipasang ke `AsyncClient(transport=...)`.
+
+    Menyimpan referensi ke tiap layer supaya limit pool yang dipasang dan state
+    koneksi live bisa dibaca saat runtime.
+    """
+
+    def __init__(
+        self,
+        pool: httpx.AsyncHTTPTransport,
+        retry: BudgetedRetryTransport,
+        metrics: MetricsTransport,
+        balancer: BalancerTransport | None = None,
+        limits: httpx.Limits | None = None,
+        http2: bool = False,
+    ) -> None:
+        self.pool = pool
+        self.limits = limits or httpx.Limits()
+        self.http2 = http2
+        self.retry = retry
+        self.metrics = metrics
+        self.balancer = balancer
+        self._outer: httpx.AsyncBaseTransport = metrics
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._outer.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        await self._outer.aclose()
+
+    def pool_info(self) -> dict[str, Any]:
+        """Limit yang dipasang ke pool + state koneksi live.
+
+        Hanya API publik httpcore (`connections`, `is_idle()`) yang dibaca, supaya
+        `/health` tidak rusak saat httpcore di-upgrade.
+        """
+        connections = self.pool._pool.connections
+        idle = sum(1 for conn in connections if conn.is_idle())
+        return {
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "keepalive_expiry": self.limits.keepalive_expiry,
+            "http2": self.http2,
+            "connections": len(connections),
+            "idle_connections": idle,
+            "active_connections": len(connections) - idle,
+        }
+
+    def host_info(self) -> dict[str, Any] | None:
+        """Stats per host (EWMA, outstanding, state) jika client multi-host."""
+        return self.balancer.snapshot() if self.balancer else None
+
+    def info(self) -> dict[str, Any]:
+        return {
+            "pool": self.pool_info(),
+            "retry": self.retry.snapshot(),
+            "metrics": self.metrics.metrics.snapshot(),
+            "hosts": self.host_info(),
+        }
+
+
+def build_retry(config: ClientBaseConfig) -> Retry:
+    """Retry strategy dari `ClientRetry`."""
+    return Retry(
+        total=config.retry.total,
+        backoff_factor=config.retry.backoff_factor,
+        status_forcelist=config.retry.status_forcelist,
+        allowed_methods=config.retry.allowed_methods,
+        backoff_jitter=config.retry.backoff_jitter,
+        respect_retry_after_header=config.retry.respect_retry_after,
+        max_backoff_wait=config.retry.max_backoff_wait,
+    )
+
+
+def build_timeout(timeout: ClientTimeout) -> httpx.Timeout:
+    """httpx.Timeout dari `ClientTimeout` (connect/read/write/pool)."""
+    return httpx.Timeout(
+        connect=timeout.connect,
+        read=timeout.read,
+        write=timeout.write,
+        pool=timeout.pool,
+    )
+
+
+def build_limits(config: ClientBaseConfig) -> httpx.Limits:
+    """Connection limits dari `ClientLimits`."""
+    return httpx.Limits(
+        max_keepalive_connections=config.limits.max_keepalive_connections,
+        max_connections=config.limits.max_connections,
+        keepalive_expiry=config.limits.keepalive_expiry,
+    )
+
+
+def build_transport_stack(config: ClientBaseConfig) -> TransportStack:
+    """Bangun pool → retry → metrics dari config client."""
+    limits = build_limits(config)
+    retry = build_retry(config)
+    budget = RetryBudget(config.retry.budget_ratio, config.retry.budget_max_tokens)
+
+    # retry di-handle oleh BudgetedRetryTransport, bukan oleh httpcore.
+    pool = httpx.AsyncHTTPTransport(limits=limits, http2=config.http2, retries=0)
+    # satu pool dipakai bersama; httpcore memisahkan koneksi per origin
+    balancer = None
+    inner: httpx.AsyncBaseTransport = pool
+    if config.base_urls:
+        bases = [str(config.base_url), *(str(url) for url in config.base_urls)]
+        balancer = inner = BalancerTransport(pool, bases, config.balancer, config.name)
+    retry_layer = BudgetedRetryTransport(inner, retry, budget)
+    metrics_layer = MetricsTransport(retry_layer)
+
+    logger.bind(service="TransportStack", client_name=config.name).debug(
+        f"Transport stack built | max_conn={limits.max_connections} | "
+        f"keepalive={limits.max_keepalive_connections} | http2={config.http2} | "
+        f"retry_total={retry.total} | retry_budget={budget.ratio:.0%} | "
+        f"hosts={len(balancer.hosts) if balancer else 1}"
+    )
+    return TransportStack(
+        pool=pool,
+        retry=retry_layer,
+        metrics=metrics_layer,
+        balancer=balancer,
+        limits=limits,
+        http2=config.http2,
+    )
+
+
+def get_transport_stack(client: httpx.AsyncClient) -> TransportStack | None:
+    """Ambil TransportStack dari client (None jika client dibuat tanpa builder)."""
+    transport = getattr(client, "_transport", None)
+    return transport if isinstance(transport, TransportStack) else None
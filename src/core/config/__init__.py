@@ -5,10 +5,22 @@ from src.config.settings import *
 __all__ = [
     "default_headers",
     "ClientRetry",
+    "ClientTimeout",
+    "EndpointTimeout",
     "ClientLimits",
+    "ClientBalancer",
+    "ClientCache",
+    "ClientBreaker",
+    "ClientHedge",
+    "ClientWarmup",
+    "ClientHealth",
+    "ClientConcurrency",
+    "ClientRateLimit",
+    "ClientStream",
     "ApiBaseConfig",
     "DigiposEndpoints",
     "SimStatus",
+    "DigiposAccount",
     "DigiposConfig",
     "IsimpleConfig",
     "setup_logging",
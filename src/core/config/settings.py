@@ -5,6 +5,7 @@ settings ini akan di store pada app state.settings untuk di akses pada seluruh b
 
 # ruff: noqa
 from functools import lru_cache
+from typing import Annotated
 from pathlib import Path
 
 
@@ -17,12 +18,34 @@ CONFIG_FILE = "settings.toml"
 CONFIG_PATH = BASE_DIR / CONFIG_FILE
 
 
+class AccessLogSettings(BaseModel):
+    """Sampling access log di LoggingMiddleware."""
+
+    sample_rate: float = Field(
+        default=1.0, ge=0, le=1, description="fraksi request sukses yang di-log"
+    )
+    route_sample_rate: dict[str, Annotated[float, Field(ge=0, le=1)]] = Field(
+        default={}, description="override sample_rate per path, mis. {'/health': 0}"
+    )
+    slow_ms: float = Field(
+        default=1000.0, gt=0, description="request >= ini selalu di-log (WARNING)"
+    )
+
+
 class CoreAppSettings(BaseModel):
     """Core application settings."""
 
     name: str = "mkit-otoplus-providerapi"
     version: str = "0.1.0"
     description: str = "API Gateway for Otoplus Provider Integrations"
+    startup_deadline_s: float = Field(
+        default=10.0, description="batas waktu bootstrap + warm-up semua client"
+    )
+    fast_lane: list[str] = Field(
+        default_factory=list,
+        description="command Digipos yang dilayani raw ASGI handler (balance, sim_status)",
+    )
+    access_log: AccessLogSettings = Field(default_factory=AccessLogSettings)
 
 
 class AppSettings(BaseSettings):
@@ -51,6 +51,12 @@ class HttpResponseError(AppExceptionError):
     status_code: int = 502
 
 
+class ResponseTooLargeError(HttpResponseError):
+    """Body response upstream melewati batas `stream.max_body_bytes`."""
+
+    default_message: str = "Upstream response body exceeds size limit."
+
+
 class HTTPConnectionError(AppExceptionError):
     """Error saat koneksi/timeout gagal."""
 
@@ -58,6 +64,20 @@ class HTTPConnectionError(AppExceptionError):
     status_code: int = 503
 
 
+class DeadlineExceededError(HTTPConnectionError):
+    """Deadline request inbound habis sebelum upstream selesai."""
+
+    default_message: str = "Request deadline exceeded before upstream call."
+    status_code: int = 504
+
+
+class RateLimitExceededError(AppExceptionError):
+    """Antrian rate limit akun penuh / waktu tunggu melewati batas."""
+
+    default_message: str = "Rate limit exceeded for account, try again later."
+    status_code: int = 429
+
+
 class HTTPUnsupportedMethodeError(AppExceptionError):
     """Error Karena Methode Tersebut Tidak Allowed."""
 
@@ -1,37 +1,76 @@
 """setup middleware."""
 
 import time
+from random import random
 
-from fastapi import Request
 from loguru import logger
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+from src.core.config.settings import AccessLogSettings
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware untuk log semua request + response time."""
 
-    async def dispatch(self, request: Request, call_next):
+class LoggingMiddleware:
+    """Pure ASGI middleware: satu access log per request + header X-Process-Time.
+
+    Error (exception / status >= 400) dan request lambat (>= `slow_ms`) selalu
+    di-log; request sukses di-sample sesuai `sample_rate` / `route_sample_rate`.
+    """
+
+    def __init__(self, app: ASGIApp, config: AccessLogSettings | None = None):
+        self.app = app
+        self.config = config or AccessLogSettings()
+        self.slow_s = self.config.slow_ms / 1000
+        self.log = logger.bind(service="Access Log")
+
+    def _sampled(self, path: str) -> bool:
+        rate = self.config.route_sample_rate.get(path, self.config.sample_rate)
+        return rate >= 1 or (rate > 0 and random() < rate)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         start_time = time.perf_counter()
+        status_code = 500
+
+        async def _send(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                process_time = time.perf_counter() - start_time
+                message["headers"] = [
+                    *message.get("headers", ()),
+                    (b"x-process-time", str(process_time).encode()),
+                ]
+            await send(message)
 
-        # log incoming request
-        logger.bind(
-            path=request.url.path,
-            method=request.method,
-            client=request.client.host if request.client else "unknown",
-            query_params=dict(request.query_params),
-            # headers=dict(request.headers),
-        ).info("Incoming request")
+        try:
+            await self.app(scope, receive, _send)
+        except Exception:
+            self._access_log(scope, 500, time.perf_counter() - start_time, "ERROR")
+            raise
 
-        response = await call_next(request)
         process_time = time.perf_counter() - start_time
+        if status_code >= 500:
+            level = "ERROR"
+        elif status_code >= 400 or process_time >= self.slow_s:
+            level = "WARNING"
+        elif self._sampled(scope["path"]):
+            level = "INFO"
+        else:
+            return
+        self._access_log(scope, status_code, process_time, level)
 
-        # log outgoing response
-        logger.bind(
-            status_code=response.status_code,
-            path=request.url.path,
+    def _access_log(
+        self, scope: Scope, status_code: int, process_time: float, level: str
+    ) -> None:
+        client = scope.get("client")
+        self.log.bind(
+            method=scope["method"],
+            path=scope["path"],
+            query=scope["query_string"].decode("latin-1"),
+            client=client[0] if client else "unknown",
+            status_code=status_code,
             process_time=process_time,
-        ).info("Response sent")
-
-        # optionally, bisa tambah header X-Process-Time
-        response.headers["X-Process-Time"] = str(process_time)
-        return response
+        ).log(level, "Request handled")
@@ -0,0 +1,214 @@
+"""Content negotiation untuk semua output API (route Digipos & error handler).
+
+Format dipilih dari (urutan prioritas):
+1. query `format=json|text|msgpack`
+2. header `X-Response-Format` (kompatibel dengan client lama)
+3. header `Accept` (q-value dihormati, `*/*` = tidak ada preferensi)
+4. default route (JSON)
+
+Balance `text=true` memilih isi (plaintext Otomax), bukan format: tanpa pilihan
+client isi tersebut tetap dikirim sebagai JSON string seperti sebelumnya.
+
+Encoder di-resolve sekali per (type content, format) lalu di-cache:
+- json    → `json_dumps` (serializer pydantic-core / orjson)
+- text    → form `key=value&...` Otomax (`PlaintextRenderer`)
+- msgpack → `msgpack` (opsional) dari `to_python(mode="json")` milik model
+"""
+
+from collections.abc import Callable
+from enum import StrEnum
+from typing import Annotated, Any
+
+from fastapi import Depends, Query, Request, Response
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+from servicess.parser.plaintext import plaintext
+from src.custom.exceptions import AppExceptionError
+from src.custom.responses import json_dumps
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - msgpack opsional
+    msgpack = None
+
+type Encoder = Callable[[Any], bytes]
+
+
+class ResponseFormat(StrEnum):
+    JSON = "json"
+    TEXT = "text"
+    MSGPACK = "msgpack"
+
+
+MEDIA_TYPES: dict[ResponseFormat, str] = {
+    ResponseFormat.JSON: "application/json",
+    ResponseFormat.TEXT: "text/plain",
+    ResponseFormat.MSGPACK: "application/msgpack",
+}
+
+_ACCEPT: dict[str, ResponseFormat] = {
+    "application/json": ResponseFormat.JSON,
+    "text/plain": ResponseFormat.TEXT,
+    "application/msgpack": ResponseFormat.MSGPACK,
+    "application/x-msgpack": ResponseFormat.MSGPACK,
+    "application/vnd.msgpack": ResponseFormat.MSGPACK,
+}
+
+
+class NotAcceptableError(AppExceptionError):
+    """Format output yang diminta tidak didukung di server ini."""
+
+    default_message: str = "Requested response format is not available."
+    status_code: int = 406
+
+
+def available(fmt: ResponseFormat) -> bool:
+    """Msgpack hanya tersedia jika package `msgpack` terpasang."""
+    return fmt != ResponseFormat.MSGPACK or msgpack is not None
+
+
+def _from_accept(accept: str) -> ResponseFormat | None:
+    """Format dengan q tertinggi dari header Accept; None = bebas."""
+    best: tuple[float, ResponseFormat] | None = None
+    for item in accept.split(","):
+        media, _, params = item.strip().partition(";")
+        fmt = _ACCEPT.get(media.strip().lower())
+        if fmt is None or not available(fmt):
+            continue
+        quality = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if quality > 0 and (best is None or quality > best[0]):
+            best = (quality, fmt)
+    return best[1] if best else None
+
+
+def resolve_format(explicit: str | None, accept: str) -> ResponseFormat | None:
+    """Format eksplisit (query/header lama) menang atas Accept; None = bebas."""
+    if explicit:
+        try:
+            fmt = ResponseFormat(explicit.lower())
+        except ValueError:
+            raise NotAcceptableError(
+                context={"format": explicit, "supported": list(ResponseFormat)}
+            ) from None
+        if not available(fmt):
+            raise NotAcceptableError(context={"format": fmt, "reason": "not installed"})
+        return fmt
+    return _from_accept(accept)
+
+
+def requested_format(request: Request) -> ResponseFormat | None:
+    """Format yang diminta client (query → header lama → Accept), None = bebas."""
+    return resolve_format(
+        request.query_params.get("format") or request.headers.get("X-Response-Format"),
+        request.headers.get("accept", ""),
+    )
+
+
+def response_format(
+    request: Request,
+    # str, bukan ResponseFormat: format tak dikenal → 406 dari resolve_format, bukan 422
+    _format: Annotated[
+        str | None,
+        Query(alias="format", description="json | text | msgpack (default: Accept)"),
+    ] = None,
+) -> ResponseFormat | None:
+    """Dependency route: format output yang diminta client (None = default route)."""
+    return requested_format(request)
+
+
+DepResponseFormat = Annotated[ResponseFormat | None, Depends(response_format)]
+
+
+def _text(content: Any) -> bytes:
+    if not isinstance(content, BaseModel | dict):
+        content = to_jsonable_python(content, fallback=str)
+    if isinstance(content, BaseModel | dict):
+        return plaintext.render(content).encode()
+    return str(content).encode()
+
+
+def _msgpack(content: Any) -> bytes:
+    if isinstance(content, BaseModel):
+        data = content.__pydantic_serializer__.to_python(content, mode="json")
+    else:
+        data = to_jsonable_python(content, fallback=str)
+    return msgpack.packb(data)
+
+
+_DEFAULT_ENCODERS: dict[ResponseFormat, Encoder] = {
+    ResponseFormat.JSON: json_dumps,
+    ResponseFormat.TEXT: _text,
+    ResponseFormat.MSGPACK: _msgpack,
+}
+
+
+class Negotiator:
+    """Cache encoder per (type content, format); encoder khusus per class."""
+
+    def __init__(self) -> None:
+        self._registered: dict[tuple[type, ResponseFormat], Encoder] = {}
+        self._encoders: dict[tuple[type, ResponseFormat], Encoder] = {}
+
+    def register(self, cls: type, fmt: ResponseFormat, encoder: Encoder) -> None:
+        """Encoder khusus untuk `cls` (dan subclass-nya)."""
+        self._registered[cls, fmt] = encoder
+        self._encoders.clear()
+
+    def encoder(self, content: Any, fmt: ResponseFormat) -> Encoder:
+        cls = type(content)
+        encoder = self._encoders.get((cls, fmt))
+        if encoder is None:
+            encoder = next(
+                (
+                    self._registered[base, fmt]
+                    for base in cls.__mro__
+                    if (base, fmt) in self._registered
+                ),
+                _DEFAULT_ENCODERS[fmt],
+            )
+            if fmt == ResponseFormat.TEXT and issubclass(cls, BaseModel):
+                plaintext.compile(cls)
+            self._encoders[cls, fmt] = encoder
+        return encoder
+
+    def render(
+        self,
+        content: Any,
+        fmt: ResponseFormat | None,
+        default: ResponseFormat = ResponseFormat.JSON,
+        status_code: int = 200,
+    ) -> Response:
+        """Encode content ke format terpilih (`default` jika client bebas)."""
+        fmt = fmt or default
+        return Response(
+            self.encoder(content, fmt)(content),
+            status_code=status_code,
+            media_type=MEDIA_TYPES[fmt],
+            headers={"Vary": "Accept"},
+        )
+
+
+def _error_text(exc: AppExceptionError) -> bytes:
+    # format lama handler error: "[ErrorClass] message | Context: {...}"
+    text = f"[{exc.__class__.__name__}] {exc.message}"
+    if exc.context:
+        text += f" | Context: {exc.context}"
+    return text.encode()
+
+
+negotiator = Negotiator()
+negotiator.register(
+    AppExceptionError, ResponseFormat.JSON, lambda exc: json_dumps(exc.to_dict())
+)
+negotiator.register(AppExceptionError, ResponseFormat.TEXT, _error_text)
+negotiator.register(
+    AppExceptionError, ResponseFormat.MSGPACK, lambda exc: _msgpack(exc.to_dict())
+)
@@ -0,0 +1,47 @@
+"""Response class JSON cepat untuk semua output API.
+
+Encoder dipilih sekali saat import:
+- `orjson` jika terpasang (opsional, tidak wajib di dependency);
+- fallback `pydantic_core.to_json` — selalu ada karena ikut pydantic.
+
+Model pydantic diserialisasi langsung oleh serializer Rust miliknya ke bytes,
+tanpa lewat `jsonable_encoder` → dict → `json.dumps`.
+"""
+
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json, to_jsonable_python
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson opsional
+    orjson = None
+
+JSON_ENCODER = "orjson" if orjson is not None else "pydantic-core"
+
+
+def _fallback(obj: Any) -> Any:
+    # type yang tidak dikenal (mis. object di context error) → str, bukan 500
+    return to_jsonable_python(obj, fallback=str)
+
+
+def json_dumps(content: Any) -> bytes:
+    """Encode content (model/dataclass/dict/primitive) ke JSON bytes."""
+    if isinstance(content, BaseModel):
+        return content.__pydantic_serializer__.to_json(content)
+    if orjson is not None:
+        return orjson.dumps(content, default=_fallback, option=orjson.OPT_NON_STR_KEYS)
+    return to_json(content, fallback=str)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse dengan `json_dumps` sebagai renderer.
+
+    Return instance ini langsung dari route untuk melewati `jsonable_encoder`
+    FastAPI; sebagai `default_response_class` ia hanya mengganti tahap render.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return json_dumps(content)
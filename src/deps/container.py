@@ -0,0 +1,82 @@
+"""Service graph aplikasi, dibangun sekali di lifespan dan disimpan di app.state.
+
+Semua service di sini stateless per request (state bersama ada di
+HttpClientManager: client, breaker, cache, limiter), jadi aman dipakai ulang
+oleh semua request. Route cukup resolve satu dependency async yang membaca
+`app.state.services` — tanpa threadpool, tanpa object/`logger.bind` baru.
+"""
+
+from dataclasses import dataclass
+
+from fastapi import FastAPI
+
+from servicess.client.request import HttpRequestService
+from servicess.client.response import ResponseHandlerFactory
+from src.core.client.base_manager import HttpClientManager
+from src.core.config.cfg_api_clients import DigiposConfig
+from src.core.config.settings import AppSettings
+from src.servicess.digipos.auth_service import DigiposAuthService
+from src.servicess.digipos.command_service import DGCommandServices
+
+
+@dataclass(frozen=True, slots=True)
+class DigiposServices:
+    config: DigiposConfig
+    http: HttpRequestService
+    auth: DigiposAuthService
+    command: DGCommandServices
+
+
+@dataclass(frozen=True, slots=True)
+class AppServices:
+    response_handler: ResponseHandlerFactory
+    digipos: DigiposServices
+
+
+def build_digipos_services(
+    config: DigiposConfig,
+    manager: HttpClientManager,
+    response_handler: ResponseHandlerFactory,
+) -> DigiposServices:
+    """Rakit HttpRequestService → DGCommandServices khusus Digipos."""
+    http = HttpRequestService(
+        client=manager.get_client(config.name),
+        service_name=config.name,
+        response_handler=response_handler,
+        coalescer=manager.get_coalescer(config.name),
+        breaker=manager.get_breaker(config.name),
+        hedger=manager.get_hedger(config.name),
+        limiter=manager.get_limiter(config.name),
+        timeouts=manager.get_timeouts(config.name),
+        stream=config.stream,
+    )
+    auth = DigiposAuthService(config)
+    command = DGCommandServices(
+        http,
+        auth,
+        config,
+        cache=manager.get_cache(config.name),
+        account_limiter=lambda account: manager.get_account_limiter(
+            config.name, account.username, config.concurrency_for(account)
+        ),
+        rate_limiter=manager.get_rate_limiter(config.name),
+    )
+    return DigiposServices(config=config, http=http, auth=auth, command=command)
+
+
+def build_services(settings: AppSettings, manager: HttpClientManager) -> AppServices:
+    """Bangun seluruh service graph; panggil setelah client manager start."""
+    response_handler = ResponseHandlerFactory()
+    return AppServices(
+        response_handler=response_handler,
+        digipos=build_digipos_services(settings.digipos, manager, response_handler),
+    )
+
+
+def get_services(app: FastAPI) -> AppServices:
+    """Service graph dari app.state; dibangun sekali jika lifespan belum melakukannya."""
+    services = getattr(app.state, "services", None)
+    if services is None:
+        services = build_services(app.state.settings, app.state.api_manager)
+        app.state.services = services
+    return services
@@ -17,54 +17,45 @@ FastAPI tahu bahwa itu adalah dependensi, bukan Request Body, dan akan menyembun
 
 from typing import Annotated
 
-from fastapi import Depends
+from fastapi import Depends, Request
 from httpx import AsyncClient
 
 from servicess.client.request import HttpRequestService
-from servicess.client.response import ResponseHandlerFactory
 from src.core.config.cfg_api_clients import DigiposConfig
-from src.core.config.settings import AppSettings
-from src.deps.dep_factory import (
-    client_factory,
-    get_appsettings,
-    get_response_parser_factory,
-)
+from src.deps.container import get_services
+from src.deps.dep_factory import client_factory, deadline_factory
 from src.servicess.digipos.auth_service import DigiposAuthService
 from src.servicess.digipos.command_service import DGCommandServices
 
+# Service Digipos dibangun sekali di lifespan (src/deps/container.py);
+# dependency di bawah hanya lookup async ke app.state, tanpa threadpool.
 
-def get_digipos_config(
-    settings: AppSettings = Depends(get_appsettings),
-) -> AppSettings:
-    """Ambil config Digipos dari AppSettings."""
-    return settings.digipos
 
+async def get_digipos_config(request: Request) -> DigiposConfig:
+    """Ambil config Digipos dari service graph."""
+    return get_services(request.app).digipos.config
+
+
+async def get_digipos_http_service(request: Request) -> HttpRequestService:
+    """HttpClientService khusus Digipos (singleton)."""
+    return get_services(request.app).digipos.http
 
-def get_digipos_http_service(
-    client: AsyncClient = Depends(client_factory(lambda s: s.digipos)),
-    config: DigiposConfig = Depends(get_digipos_config),
-    response_handler: ResponseHandlerFactory = Depends(get_response_parser_factory),
-):
-    """Generate HttpClientService khusus Digipos."""
-    return HttpRequestService(
-        client=client, service_name=config.name, response_handler=response_handler
-    )
 
+async def get_digipos_auth_service(request: Request) -> DigiposAuthService:
+    """DigiposAuthService dengan config default (singleton)."""
+    return get_services(request.app).digipos.auth
 
-def get_digipos_auth_service(
-    config: DigiposConfig = Depends(get_digipos_config),
-) -> DigiposAuthService:
-    """Generate DigiposAuthService dengan config default."""
-    return DigiposAuthService(config)
 
+async def get_digipos_command_service(request: Request) -> DGCommandServices:
+    """DGCommandServices (endpoint caller) siap pakai (singleton)."""
+    return get_services(request.app).digipos.command
 
-def get_digipos_command_service(
-    http_service: HttpRequestService = Depends(get_digipos_http_service),
-    auth_service: DigiposAuthService = Depends(get_digipos_auth_service),
-    config: DigiposConfig = Depends(get_digipos_config),
-):
-    """Generate DGCommandServices (endpoint caller) siap pakai."""
-    return DGCommandServices(http_service, auth_service, config)
+
+def digipos_deadline(command: str):
+    """Route dependency: deadline request dengan default per command Digipos."""
+    return Depends(
+        deadline_factory(lambda s: s.digipos.endpoints.deadline_for(command))
+    )
 
 
 # Annotated Style if needed
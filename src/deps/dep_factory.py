@@ -4,10 +4,17 @@ from typing import Annotated
 
 from src.core.client.base_manager import HttpClientManager
 from servicess.client.response import ResponseHandlerFactory
-from fastapi import Depends, Request
+from fastapi import Depends, Header, Query, Request
 from httpx import AsyncClient
 
+from src.core.client.deadline import (
+    DEADLINE_HEADER,
+    DEADLINE_QUERY,
+    reset_deadline,
+    set_deadline,
+)
 from src.core.config.settings import AppSettings
+from src.deps.container import get_services
 
 
 async def get_appsettings(request: Request) -> AppSettings:
@@ -18,7 +25,7 @@ async def get_appsettings(request: Request) -> AppSettings:
 DepAppSettings = Annotated[AppSettings, Depends(get_appsettings)]
 
 
-def get_api_manager(request: Request) -> HttpClientManager:
+async def get_api_manager(request: Request) -> HttpClientManager:
     """Ambil ApiClientManager dari app state."""
     return request.app.state.api_manager
 
@@ -39,9 +46,38 @@ def client_factory(config_getter):
     return _dep
 
 
-def get_response_parser_factory() -> ResponseHandlerFactory:
-    """Dependency provider buat ResponseParserFactory."""
-    return ResponseHandlerFactory()
+def deadline_factory(default_getter):
+    """Factory dependency deadline request: header/query caller, else default route.
+
+    Deadline di-set di contextvar selama request dan dipakai HttpRequestService
+    untuk memotong timeout & retry ke upstream.
+    """
+
+    async def _dep(
+        settings: AppSettings = Depends(get_appsettings),
+        header_timeout: float | None = Header(
+            default=None, alias=DEADLINE_HEADER, gt=0, include_in_schema=False
+        ),
+        query_timeout: float | None = Query(
+            default=None,
+            alias=DEADLINE_QUERY,
+            gt=0,
+            description=f"deadline (detik), sama dengan header {DEADLINE_HEADER}",
+        ),
+    ):
+        timeout_s = header_timeout or query_timeout or default_getter(settings)
+        token = set_deadline(timeout_s)
+        try:
+            yield timeout_s
+        finally:
+            reset_deadline(token)
+
+    return _dep
+
+
+async def get_response_parser_factory(request: Request) -> ResponseHandlerFactory:
+    """Dependency provider buat ResponseParserFactory (instance bersama)."""
+    return get_services(request.app).response_handler
 
 
 # Annotated
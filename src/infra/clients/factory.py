@@ -1,8 +1,8 @@
-from httpx import AsyncClient, Limits
-from httpx_retries import Retry, RetryTransport
+from httpx import AsyncClient
 from loguru import logger
 
 from src.config.client_config import ClientBaseConfig
+from src.core.client.transport import build_timeout, build_transport_stack
 
 
 class HttpClientFactory:
@@ -12,33 +12,19 @@ class HttpClientFactory:
     def create_client(config: ClientBaseConfig) -> AsyncClient:
         log = logger.bind(service="HttpClientFactory")
 
-        # Setup retry strategy
-        retry = Retry(
-            total=config.retry.total,
-            backoff_factor=config.retry.backoff_factor,
-            status_forcelist=config.retry.status_forcelist,
-            allowed_methods=config.retry.allowed_methods,
-        )
-        transport = RetryTransport(retry=retry)
-
-        # Setup connection limits
-        limits = Limits(
-            max_keepalive_connections=config.limits.max_keepalive_connections,
-            max_connections=config.limits.max_connections,
-            keepalive_expiry=config.limits.keepalive_expiry,
-        )
+        # limits & http2 dipasang di pool layer; AsyncClient mengabaikan
+        # keduanya jika transport custom diberikan.
+        transport = build_transport_stack(config)
 
         log.debug(
             f"Creating AsyncClient | base_url={config.base_url} | "
-            f"max_conn={limits.max_connections} | retry_total={retry.total}"
+            f"pool={transport.pool_info()} | retry_total={config.retry.total}"
         )
 
         client = AsyncClient(
             base_url=str(config.base_url),
             headers=config.headers,
-            timeout=config.timeout,
-            http2=config.http2,
+            timeout=build_timeout(config.timeout),
             transport=transport,
-            limits=limits,
         )
         return client
@@ -1,7 +1,14 @@
 from httpx import AsyncClient, Limits
-from httpx_retries import Retry, RetryTransport
+from httpx_retries import Retry
 from loguru import logger
 from src.config.client_config import ClientBaseConfig
+from src.core.client.transport import (
+    TransportStack,
+    build_limits,
+    build_retry,
+    build_timeout,
+    build_transport_stack,
+)
 from src.ports.http_client_factory import IHttpClientFactory
 
 
@@ -23,47 +30,36 @@ class HttpxClientFactory(IHttpClientFactory):
         - Timeouts
         - HTTP/2 support
         """
-        # 1. Setup retry strategy
-        retry = self._create_retry_strategy(config)
-        transport = RetryTransport(retry=retry)
+        # 1. Setup transport stack (pool → retry → metrics)
+        transport = self._create_transport_stack(config)
 
-        # 2. Setup connection limits
-        limits = self._create_connection_limits(config)
-
-        # 3. Log configuration
+        # 2. Log configuration
         self.log.debug(
             f"Creating client | name={config.name} | "
             f"base_url={config.base_url} | "
-            f"max_conn={limits.max_connections} | "
-            f"retry_total={retry.total}"
+            f"pool={transport.pool_info()} | "
+            f"retry_total={config.retry.total}"
         )
 
-        # 4. Build client
+        # 3. Build client — limits & http2 sudah terpasang di pool layer
         client = AsyncClient(
             base_url=str(config.base_url),
             headers=config.headers,
-            timeout=config.timeout,
-            http2=config.http2,
+            timeout=build_timeout(config.timeout),
             transport=transport,
-            limits=limits,
         )
 
         self.log.success(f"Client '{config.name}' created successfully")
         return client
 
+    def _create_transport_stack(self, config: ClientBaseConfig) -> TransportStack:
+        """Build pool → retry → metrics transport stack."""
+        return build_transport_stack(config)
+
     def _create_retry_strategy(self, config: ClientBaseConfig) -> Retry:
         """Extract retry configuration."""
-        return Retry(
-            total=config.retry.total,
-            backoff_factor=config.retry.backoff_factor,
-            status_forcelist=config.retry.status_forcelist,
-            allowed_methods=config.retry.allowed_methods,
-        )
+        return build_retry(config)
 
     def _create_connection_limits(self, config: ClientBaseConfig) -> Limits:
         """Extract connection limits configuration."""
-        return Limits(
-            max_keepalive_connections=config.limits.max_keepalive_connections,
-            max_connections=config.limits.max_connections,
-            keepalive_expiry=config.limits.keepalive_expiry,
-        )
+        return build_limits(config)
@@ -2,16 +2,18 @@ from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse, PlainTextResponse
 from loguru import logger
 
 from src.api import register_api_v1
+from src.api.v1.fastlane import mount_fast_lane
 from src.core.client.base_manager import HttpClientManager
-from src.core.client.main_setup import setup_client
 from src.core.config.cfg_logging import setup_logging
 from src.core.config.settings import get_settings
 from src.custom.exceptions import AppExceptionError
 from src.custom.middlewares import LoggingMiddleware
+from src.custom.negotiation import NotAcceptableError, negotiator, requested_format
+from src.custom.responses import FastJSONResponse
+from src.deps.container import build_services
 from src.tag import tags_metadata
 
 setup_logging()
@@ -24,18 +26,22 @@ async def lifespan(app: FastAPI):
     logger.debug("Application startup")
     settings = get_settings()
     client_manager = HttpClientManager()
-    await setup_client(client_manager, settings.digipos)
-    # add more client here
+    # add more client config here — setup & warm-up berjalan paralel
+    await client_manager.start_all(
+        [settings.digipos], deadline_s=settings.application.startup_deadline_s
+    )
 
     app.state.settings = settings
     app.state.api_manager = client_manager
+    # service graph dibangun sekali, dipakai ulang oleh semua request
+    app.state.services = build_services(settings, client_manager)
 
-    await client_manager.start_all()
     logger.debug(f" settings Loadded with values {settings}")
 
     yield
 
     await client_manager.stop_all()
+    app.state.services = None
     app.state.api_manager = None
     app.state.settings = None
     logger.debug("Application shutdown")
@@ -56,6 +62,7 @@ app = FastAPI(
     title="Parser Kit",
     description=description,
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     openapi_tags=tags_metadata,
     swagger_ui_parameters={"docExpansion": "none"},
     contact={
@@ -66,28 +73,25 @@ app = FastAPI(
 )
 
 # register middleware
-app.add_middleware(LoggingMiddleware)
+app.add_middleware(LoggingMiddleware, config=get_settings().application.access_log)
 
 
 # register exception
 @app.exception_handler(AppExceptionError)
 async def global_exception_handler(request: Request, exc: AppExceptionError):  # noqa: RUF029
-    """Handler dinamis untuk AppExceptionError (mendukung JSON dan TEXT)."""
-    response_format = request.headers.get(
-        "X-Response-Format"
-    ) or request.query_params.get("format", "json")
-
-    if response_format.lower() == "text":
-        text = f"[{exc.__class__.__name__}] {exc.message}"
-        if exc.context:
-            text += f" | Context: {exc.context}"
-        return PlainTextResponse(text, status_code=exc.status_code)
-
-    return JSONResponse(content=exc.to_dict(), status_code=exc.status_code)
+    """Handler dinamis untuk AppExceptionError (format sama dengan route)."""
+    try:
+        fmt = requested_format(request)
+    except NotAcceptableError:
+        # format tidak valid tetap harus dapat error yang bisa dibaca
+        fmt = None
+    return negotiator.render(exc, fmt, status_code=exc.status_code)
 
 
 # register routers
 register_api_v1(app)
+# fast lane: raw ASGI handler untuk command tertentu (OpenAPI tetap dari router)
+mount_fast_lane(app, get_settings().application.fast_lane)
 
 
 @app.get("/")
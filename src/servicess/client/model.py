@@ -7,6 +7,7 @@ class ResponseType(StrEnum):
     """Jenis hasil parsing body response dari raw api parser."""
 
     DICT = "DICT"
+    TYPED = "TYPED"
     LIST = "LIST"
     TEXT = "TEXT"
     PRIMITIVE = "PRIMITIVE"
@@ -37,8 +38,14 @@ class ApiResponseIN:
 
     @property
     def is_error(self) -> bool:
-        """Indicates if the response is an error based on response type."""
-        return self.response_type == ResponseType.ERROR
+        """Body gagal di-parse: JSON invalid (`parse_error`) / bukan JSON (`fallback_raw`).
+
+        Dicek dari `raw_data`, karena `response_type` hanya ada di meta debug.
+        """
+        if self.response_type == ResponseType.ERROR:
+            return True
+        raw = self.raw_data
+        return isinstance(raw, dict) and ("parse_error" in raw or "fallback_raw" in raw)
 
     @property
     def is_ok(self) -> bool:
@@ -1,13 +1,29 @@
+from collections.abc import Callable
+from time import perf_counter
+
 import httpx
 from loguru import logger
+from pydantic import TypeAdapter
 
 from servicess.client.response import ResponseHandlerFactory
+from src.core.client import deadline
+from src.core.client.breaker import CircuitBreaker
+from src.core.client.coalesce import RequestCoalescer
+from src.core.client.hedging import RequestHedger
+from src.core.client.jsonstream import JSONStreamReader
+from src.core.client.limiter import AdaptiveLimiter
+from src.core.client.timeouts import AdaptiveTimeout
+from src.core.config.cfg_api_clients import ClientStream
 from src.custom.exceptions import (
+    DeadlineExceededError,
     HTTPConnectionError,
     HttpResponseError,
     HTTPUnsupportedMethodeError,
+    ResponseTooLargeError,
 )
 
+type ResponseHook = Callable[[httpx.Response], None]
+
 
 class HttpRequestService:
     """HTTP client dengan auto parser berbasis content-type."""
@@ -17,14 +33,137 @@ class HttpRequestService:
         client: httpx.AsyncClient,
         response_handler: ResponseHandlerFactory,
         service_name: str | None = None,
+        coalescer: RequestCoalescer | None = None,
+        breaker: CircuitBreaker | None = None,
+        hedger: RequestHedger | None = None,
+        limiter: AdaptiveLimiter | None = None,
+        timeouts: AdaptiveTimeout | None = None,
+        stream: ClientStream | None = None,
     ):
         inferred_name = service_name or getattr(client.base_url, "host", "Upstream")
         self.client = client
         self.response_handler = response_handler
+        self.coalescer = coalescer
+        self.breaker = breaker
+        self.hedger = hedger
+        self.limiter = limiter
+        self.timeouts = timeouts
+        self.stream = stream or ClientStream()
         self.log = logger.bind(service=inferred_name)
 
-    async def _request(self, method: str, endpoint: str, **kwargs) -> httpx.Response:
-        """Low level request (tanpa parsing)."""
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        idempotent: bool,
+        on_response: ResponseHook | None = None,
+        reader: JSONStreamReader | None = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """Kirim ke upstream; lewat hedger jika endpoint idempotent."""
+        if reader is not None:
+            return await self._send_stream(
+                method, endpoint, reader, on_response, **kwargs
+            )
+        send = getattr(self.client, method.lower())
+        if self.hedger is not None and idempotent:
+            resp = await self.hedger.run(endpoint, lambda: send(endpoint, **kwargs))
+        else:
+            resp = await send(endpoint, **kwargs)
+        if on_response is not None:
+            on_response(resp)
+        return resp
+
+    async def _send_stream(
+        self,
+        method: str,
+        endpoint: str,
+        reader: JSONStreamReader,
+        on_response: ResponseHook | None = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """Kirim dengan `stream=True`; body dibaca `reader` lalu koneksi dilepas.
+
+        Tanpa hedging: response streaming yang kalah race tidak bisa dibatalkan
+        dengan bersih.
+        """
+        request = self.client.build_request(method, endpoint, **kwargs)
+        resp = await self.client.send(request, stream=True)
+        try:
+            if on_response is not None:
+                on_response(resp)
+            if resp.is_error:
+                await reader.read_head(resp)
+            else:
+                await reader.read(resp)
+        finally:
+            await resp.aclose()
+        return resp
+
+    async def _admit(self, endpoint: str) -> float | None:
+        """Cek deadline, breaker & limiter sebelum I/O; return sisa deadline."""
+        deadline.ensure_time_left(endpoint)
+        if self.breaker is not None:
+            self.breaker.before_call(endpoint)
+        if self.limiter is None:
+            return deadline.remaining()
+
+        await self.limiter.acquire(endpoint, timeout_s=deadline.remaining())
+        try:
+            # sisa deadline dihitung ulang setelah antri di limiter
+            return deadline.ensure_time_left(endpoint)
+        except DeadlineExceededError:
+            self.limiter.release(False, 0.0)
+            raise
+
+    def _timeout_for(
+        self, endpoint: str, timeout: httpx.Timeout | None, left: float | None
+    ) -> httpx.Timeout | None:
+        """Timeout efektif: override endpoint → read adaptif → sisa deadline."""
+        if timeout is None and self.timeouts is None and left is None:
+            return None
+        timeout = timeout or self.client.timeout
+        if self.timeouts is not None:
+            timeout = self.timeouts.apply(endpoint, timeout)
+        if left is not None:
+            timeout = httpx.Timeout(**deadline.shrink_timeouts(timeout.as_dict(), left))
+        return timeout
+
+    def _record(
+        self,
+        endpoint: str,
+        success: bool,
+        elapsed_s: float,
+        exc: Exception | None = None,
+    ) -> None:
+        """Catat outcome ke breaker dan latency sample ke adaptive timeout."""
+        if self.breaker is not None:
+            self.breaker.record(success, elapsed_s)
+        if self.timeouts is None:
+            return
+        if exc is None:
+            self.timeouts.observe(endpoint, elapsed_s)
+        elif isinstance(exc, httpx.ReadTimeout):
+            self.timeouts.observe(endpoint, elapsed_s, timed_out=True)
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        idempotent: bool = False,
+        timeout: httpx.Timeout | None = None,
+        on_response: ResponseHook | None = None,
+        reader: JSONStreamReader | None = None,
+        **kwargs,
+    ) -> httpx.Response:
+        """Low level request (tanpa parsing).
+
+        `idempotent=True` mengizinkan hedging (jika hedger aktif) untuk call ini.
+        `timeout` override timeout client untuk endpoint ini; jika ada deadline
+        inbound, timeout per attempt dipotong ke sisa deadline. `on_response`
+        dipanggil dengan response mentah (termasuk 4xx/5xx) sebelum raise.
+        Jika `reader` diberikan, body di-decode streaming ke `reader`.
+        """
         method = method.upper()
 
         if method not in {"GET"}:
@@ -32,12 +171,25 @@ class HttpRequestService:
                 message="forbidden methode call",
                 context={"method": method, "endpoint": endpoint},
             )
+        limiter = self.limiter
+        left = await self._admit(endpoint)
+        timeout = self._timeout_for(endpoint, timeout, left)
+        if timeout is not None:
+            kwargs["timeout"] = timeout
+
+        start = perf_counter()
+        # dropped = sinyal overload (timeout/connection error/429/5xx) untuk AIMD
+        dropped = False
         try:
             self.log.debug(f"Request [{method}] -> {endpoint}")
-            resp = await getattr(self.client, method.lower())(endpoint, **kwargs)
+            resp = await self._send(
+                method, endpoint, idempotent, on_response, reader, **kwargs
+            )
             resp.raise_for_status()
 
         except httpx.RequestError as exc:
+            dropped = True
+            self._record(endpoint, False, perf_counter() - start, exc)
             raise HTTPConnectionError(
                 message="Connection error",
                 context={"endpoint": endpoint, "details": str(exc)},
@@ -45,20 +197,96 @@ class HttpRequestService:
             ) from exc
 
         except httpx.HTTPStatusError as exc:
+            status_code = exc.response.status_code
+            dropped = status_code == 429 or status_code >= 500
+            # 4xx = masalah request kita, bukan tanda upstream down
+            self._record(endpoint, status_code < 500, perf_counter() - start, exc)
             raise HttpResponseError(
-                message=f"Bad status: {exc.response.status_code}",
+                message=f"Bad status: {status_code}",
                 context={
                     "endpoint": endpoint,
-                    "status_code": exc.response.status_code,
-                    "body": exc.response.text[:500],
+                    "status_code": status_code,
+                    "body": reader.head
+                    if reader is not None
+                    else exc.response.content[:500].decode(errors="replace"),
                 },
                 cause=exc,
             ) from exc
+
+        except ResponseTooLargeError:
+            # upstream tetap merespons → bukan kegagalan untuk breaker
+            self._record(endpoint, True, perf_counter() - start)
+            raise
+
+        finally:
+            if limiter is not None:
+                limiter.release(dropped, perf_counter() - start)
+
+        self._record(endpoint, True, perf_counter() - start)
         return resp
 
     async def safe_request(
-        self, method: str, endpoint: str, debugresponse: bool = False, **kwargs
+        self,
+        method: str,
+        endpoint: str,
+        debugresponse: bool = False,
+        idempotent: bool = False,
+        timeout: httpx.Timeout | None = None,
+        on_response: ResponseHook | None = None,
+        schema: TypeAdapter | None = None,
+        **kwargs,
+    ):
+        """High level call — otomatis parsing ke dict (atau `schema` jika cocok).
+
+        Jika coalescer aktif, GET identik yang bersamaan berbagi satu upstream
+        call; tiap caller tetap parsing sendiri → ApiResponseIN miliknya sendiri.
+        """
+        if (
+            self.coalescer is not None
+            and method.upper() == "GET"
+            and (kwargs.keys() <= {"params"})
+        ):
+            key = self.coalescer.make_key(method, endpoint, kwargs.get("params"))
+            raw_response = await self.coalescer.run(
+                key,
+                lambda: self._request(
+                    method, endpoint, idempotent, timeout, on_response, **kwargs
+                ),
+            )
+        else:
+            raw_response = await self._request(
+                method, endpoint, idempotent, timeout, on_response, **kwargs
+            )
+        return self.response_handler(raw_response, debugresponse, schema=schema)
+
+    async def stream_request(
+        self,
+        method: str,
+        endpoint: str,
+        debugresponse: bool = False,
+        fields: list[str] | None = None,
+        timeout: httpx.Timeout | None = None,
+        on_response: ResponseHook | None = None,
+        schema: TypeAdapter | None = None,
+        **kwargs,
     ):
-        """High level call — otomatis parsing ke dict."""
-        raw_response = await self._request(method, endpoint, **kwargs)
-        return self.response_handler(raw_response, debugresponse)
+        """Seperti safe_request, tapi body JSON di-decode streaming.
+
+        Untuk payload besar: body tidak di-buffer utuh, dibatasi
+        `stream.max_body_bytes`, dan hanya `fields` (path bertitik, mis.
+        `data.items`) yang disimpan (kosong = semua). Tidak lewat coalescer/hedger.
+        """
+        reader = JSONStreamReader(
+            self.stream.max_body_bytes, fields, self.stream.head_bytes
+        )
+        raw_response = await self._request(
+            method,
+            endpoint,
+            timeout=timeout,
+            on_response=on_response,
+            reader=reader,
+            **kwargs,
+        )
+        return self.response_handler(
+            raw_response, debugresponse, stream=reader, schema=schema
+        )
@@ -3,33 +3,85 @@ from typing import Any
 
 import httpx
 from loguru import logger
+from pydantic import TypeAdapter, ValidationError
 
 from servicess.client.model import ApiResponseIN, ResponseType
+from src.core.client.jsonstream import JSONStreamReader
 from src.custom.exceptions import HttpResponseError
 from utils.log_utils import timeit
 
+# id TypeAdapter yang shape-nya sudah pernah di-warn tidak cocok
+_drift_warned: set[int] = set()
+
+
+def body_head(
+    resp: httpx.Response, stream: JSONStreamReader | None = None, limit: int = 500
+) -> str:
+    """Awal body untuk context error, tanpa decode seluruh body ke str."""
+    if stream is not None:
+        return stream.head[:limit]
+    return resp.content[:limit].decode(errors="replace")
+
 
 class HttpResponseService:
     """Convert httpx.Response → ApiResponseIN (flat, minimal, safe)."""
 
-    def __init__(self, resp: httpx.Response, debug: bool = False):
+    def __init__(
+        self,
+        resp: httpx.Response,
+        debug: bool = False,
+        stream: JSONStreamReader | None = None,
+        schema: TypeAdapter | None = None,
+    ):
         self.resp = resp
         self.debug = debug
+        self.stream = stream
+        self.schema = schema
         self.last_error: str | None = None
         self.log = logger.bind(url=str(resp.url), debug=debug)
 
     def _try_parse_json(self) -> tuple[str, Any]:
         """Error json tidak di raise , tetapi ada flag yang bisa di consume layer selanjut nya."""
+        stream = self.stream
+        if stream is not None and stream.error is not None:
+            return self._json_error(stream.error)
+        if self.schema is not None:
+            typed = self._try_parse_typed()
+            if typed is not None:
+                return ResponseType.TYPED, typed
         try:
-            body = self.resp.json()
+            body = self.resp.json() if stream is None else stream.value
             return ResponseType.DICT, body if isinstance(body, dict) else {"raw": body}
         except Exception as e:
-            self.last_error = f"Invalid JSON: {e}"
-            return ResponseType.ERROR, {
-                "parse_error": True,
-                "error": str(e),
-                "raw": self.resp.text[:500] or None,
-            }
+            return self._json_error(str(e))
+
+    def _try_parse_typed(self) -> Any | None:
+        """Bytes → typed model langsung (tanpa dict perantara).
+
+        None jika shape upstream tidak cocok; caller lanjut ke jalur dict.
+        """
+        try:
+            if self.stream is None:
+                return self.schema.validate_json(self.resp.content)
+            return self.schema.validate_python(self.stream.value)
+        except ValidationError as e:
+            # drift schema cukup di-warn sekali; body error yang berulang → debug
+            level = "DEBUG" if id(self.schema) in _drift_warned else "WARNING"
+            _drift_warned.add(id(self.schema))
+            self.log.log(
+                level,
+                f"Typed decode gagal ({e.error_count()} error), fallback ke dict: "
+                f"{e.errors(include_url=False, include_input=False)[:3]}",
+            )
+            return None
+
+    def _json_error(self, error: str) -> tuple[str, Any]:
+        self.last_error = f"Invalid JSON: {error}"
+        return ResponseType.ERROR, {
+            "parse_error": True,
+            "error": error,
+            "raw": body_head(self.resp, self.stream) or None,
+        }
 
     def _try_parse_text(self) -> tuple[str, Any]:
         text = (self.resp.text or "").strip()
@@ -100,9 +152,15 @@ class ResponseHandlerFactory:
         self.parser_cls = parser_cls
         self.strict = strict
 
-    def __call__(self, resp: httpx.Response, debug: bool = False) -> ApiResponseIN:
+    def __call__(
+        self,
+        resp: httpx.Response,
+        debug: bool = False,
+        stream: JSONStreamReader | None = None,
+        schema: TypeAdapter | None = None,
+    ) -> ApiResponseIN:
         try:
-            parsed = self.parser_cls(resp, debug).to_response_in()
+            parsed = self.parser_cls(resp, debug, stream, schema).to_response_in()
 
         except HttpResponseError as e:
             # misal bukan JSON / upstream kacau
@@ -113,7 +171,7 @@ class ResponseHandlerFactory:
                 status_code=resp.status_code,
                 url=str(resp.url.host),
                 path=str(resp.url.path),
-                raw_data={"fallback_raw": resp.text[:500]},
+                raw_data={"fallback_raw": body_head(resp, stream)},
                 debug=debug,
                 meta={"with_meta": False, "fallback_reason": str(e)},
             )
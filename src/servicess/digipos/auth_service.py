@@ -1,4 +1,6 @@
-from src.config.settings import DigiposConfig
+from hmac import compare_digest
+
+from src.core.config.cfg_api_clients import DigiposAccount, DigiposConfig
 from src.custom.exceptions import AuthenticationError
 
 
@@ -6,14 +8,18 @@ class DigiposAuthService:
     def __init__(self, setting: DigiposConfig):
         self.setting = setting
 
-    def validate_username(self, username: str):
-        if username != self.setting.username:
+    def validate_username(self, username: str) -> DigiposAccount:
+        """Lookup akun dari index username (O(1)); raise jika tidak terdaftar."""
+        account = self.setting.account(username)
+        if account is None:
             raise AuthenticationError("Username tidak sesuai")
+        return account
 
-    def validate_password(self, password: str):
-        if password != self.setting.password:
+    def validate_password(self, account: DigiposAccount, password: str):
+        if not compare_digest(password.encode(), account.password.encode()):
             raise AuthenticationError("Password tidak sesuai")
 
-    def validate_usnpass(self, username: str, password: str):
-        self.validate_username(username)
-        self.validate_password(password)
+    def validate_usnpass(self, username: str, password: str) -> DigiposAccount:
+        account = self.validate_username(username)
+        self.validate_password(account, password)
+        return account
@@ -1,5 +1,11 @@
 """bussines logic for digipos."""
 
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from dataclasses import replace
+from typing import Any
+
+import httpx
 from loguru import logger
 
 from servicess.client.depre_cated_response_model import (
@@ -8,16 +14,28 @@ from servicess.client.depre_cated_response_model import (
 )
 from servicess.client.request import HttpRequestService
 from servicess.digipos.sch_digipos import (
+    DGReqBalanceBatch,
     DGReqSimStatus,
     DGReqUsername,
     DGReqUsnOtp,
     DGReqUsnPass,
     DGResBalance,
 )
+from servicess.digipos.sch_digipos_typed import digipos_schema
 from servicess.parser.parser_utils import clean_validate_raw_dict_data
-from src.core.config.cfg_api_clients import DigiposConfig
+from servicess.parser.registry import output_models
+from src.core.client import deadline
+from src.core.client.cache import ResponseCache
+from src.core.client.limiter import AdaptiveLimiter
+from src.core.client.ratelimit import AccountRateLimiter
+from src.core.client.transport import build_timeout
+from src.core.config.cfg_api_clients import DigiposAccount, DigiposConfig
+from src.custom.exceptions import AppExceptionError
 from src.servicess.digipos.auth_service import DigiposAuthService
 
+# output model + TypeAdapter dibangun sekali saat import, bukan per request
+output_models.register(DGResBalance)
+
 
 class DGCommandServices:
     def __init__(
@@ -25,97 +43,244 @@ class DGCommandServices:
         http_service: HttpRequestService,
         auth_service: DigiposAuthService,
         setting: DigiposConfig,
+        cache: ResponseCache | None = None,
+        account_limiter: Callable[[DigiposAccount], AdaptiveLimiter | None]
+        | None = None,
+        rate_limiter: AccountRateLimiter | None = None,
     ):
         self.http_service = http_service
         self.auth_service = auth_service
         self.setting = setting
+        self.cache = cache
+        self.account_limiter = account_limiter
+        self.rate_limiter = rate_limiter
         self.logger = logger.bind(service="Digipos Command Service")
 
+    async def _call(
+        self,
+        account: DigiposAccount,
+        command: str,
+        data: DGReqUsername,
+        debugresponse: bool = False,
+    ) -> ApiResponseIN:
+        """Call upstream: token bucket akun → slot concurrency akun → request."""
+        endpoint = getattr(self.setting.endpoints, command)
+        waited = await self._throttle(account, command)
+
+        stream_fields = self.setting.endpoints.stream.get(command)
+
+        async def _send() -> ApiResponseIN:
+            kwargs = {
+                "method": "GET",
+                "endpoint": endpoint,
+                "params": data.model_dump(),
+                "debugresponse": debugresponse,
+                "timeout": self._timeout(command),
+                "on_response": self._rate_hook(account, command),
+                "schema": digipos_schema(command),
+            }
+            # payload besar (profile, list_va) di-decode streaming + size limit
+            if stream_fields is not None:
+                return await self.http_service.stream_request(
+                    fields=stream_fields, **kwargs
+                )
+            return await self.http_service.safe_request(
+                idempotent=command in self.setting.endpoints.idempotent, **kwargs
+            )
+
+        limiter = self.account_limiter(account) if self.account_limiter else None
+        if limiter is None:
+            response = await _send()
+        else:
+            async with limiter.slot(endpoint, timeout_s=deadline.remaining()):
+                response = await _send()
+
+        if data.debug and self.rate_limiter is not None:
+            meta = {**(response.meta or {}), "rate_limit": {"wait_s": round(waited, 3)}}
+            response = replace(response, meta=meta)
+        return response
+
+    async def _throttle(self, account: DigiposAccount, command: str) -> float:
+        """Tunggu token bucket akun untuk command ini; return lama menunggu."""
+        if self.rate_limiter is None:
+            return 0.0
+        return await self.rate_limiter.acquire(
+            account.username, command, max_wait_s=deadline.remaining()
+        )
+
+    def _rate_hook(
+        self, account: DigiposAccount, command: str
+    ) -> Callable[[httpx.Response], None] | None:
+        """Teruskan status & header rate-limit upstream ke bucket akun."""
+        rate_limiter = self.rate_limiter
+        if rate_limiter is None:
+            return None
+        return lambda resp: rate_limiter.observe(
+            account.username, command, resp.status_code, resp.headers
+        )
+
+    async def _read(
+        self,
+        account: DigiposAccount,
+        command: str,
+        data: DGReqUsername,
+        debugresponse: bool = False,
+    ) -> ApiResponseIN:
+        """Read command dengan TTL cache per akun (namespace milik akun).
+
+        Cache hanya menyimpan hasil non-debug tanpa meta upstream; call debug
+        selalu ke upstream supaya meta/header miliknya tidak bocor ke caller lain.
+        """
+        ttl = self.setting.endpoints.ttl_for(command)
+        if self.cache is None or ttl <= 0:
+            return await self._call(account, command, data, debugresponse)
+
+        if data.debug:
+            response = await self._call(account, command, data, debugresponse)
+            cache_info = {"ttl_s": ttl, "bypass": True, **self.cache.info(command)}
+            return replace(
+                response, meta={**(response.meta or {}), "cache": cache_info}
+            )
+
+        # loader non-debug: aman dipakai ulang oleh refresh SWR di background
+        async def _load() -> ApiResponseIN:
+            response = await self._call(account, command, data)
+            return replace(response, meta={"with_meta": False}, debug=False)
+
+        result = await self.cache.get_or_load(account.namespace, command, ttl, _load)
+        raw_response = result.value
+        # flag staleness selalu dikirim supaya Otomax bisa memutuskan sendiri
+        return replace(raw_response, meta={**raw_response.meta, **result.meta()})
+
+    def _timeout(self, command: str) -> httpx.Timeout:
+        """Timeout client + override per command dari `endpoints.timeouts`."""
+        return build_timeout(self.setting.timeout_for(command))
+
+    def _invalidate(self, account: DigiposAccount) -> None:
+        """Buang cache akun setelah perubahan sesi (login/otp/logout)."""
+        if self.cache is not None:
+            self.cache.invalidate(account.namespace)
+
+    async def _session(
+        self, account: DigiposAccount, command: str, data: DGReqUsername
+    ) -> ApiResponseIN:
+        """Command yang mengubah sesi akun; cache akun selalu di-invalidate."""
+        try:
+            return await self._call(account, command, data)
+        finally:
+            self._invalidate(account)
+
     async def login(self, data: DGReqUsnPass):
         """Ambil login dari Digipos API."""
-        self.auth_service.validate_usnpass(data.username, data.password)
-        raw_response = await self.http_service.safe_request(
-            method="GET",
-            endpoint=self.setting.endpoints.login,
-            params=data.model_dump(),
-        )
-        return raw_response
+        account = self.auth_service.validate_usnpass(data.username, data.password)
+        return await self._session(account, "login", data)
 
     async def verify_otp(self, data: DGReqUsnOtp):
         """Ambil verify OTP dari Digipos API."""
-        self.auth_service.validate_username(data.username)
-        raw_response = await self.http_service.safe_request(
-            method="GET",
-            endpoint=self.setting.endpoints.verify_otp,
-            params=data.model_dump(),
-        )
-        return raw_response
+        account = self.auth_service.validate_username(data.username)
+        return await self._session(account, "verify_otp", data)
 
     async def balance(self, data: DGReqUsername) -> ApiResponseOUT[DGResBalance]:
         """Ambil Balance dari Digipos API dan clean data."""
-        self.auth_service.validate_username(data.username)
-
-        # 1. Ambil raw response
-        raw_response: ApiResponseIN = await self.http_service.safe_request(
-            method="GET",
-            endpoint=self.setting.endpoints.balance,
-            params=data.model_dump(),
-            debugresponse=data.debug,
+        account = self.auth_service.validate_username(data.username)
+
+        # 1. Ambil raw response (cache-aware)
+        raw_response: ApiResponseIN = await self._read(
+            account, "balance", data, debugresponse=data.debug
         )
         final_response = clean_validate_raw_dict_data(raw_response, DGResBalance)
         return final_response
 
+    def balance_batch(self, data: DGReqBalanceBatch) -> AsyncIterator[dict[str, Any]]:
+        """Balance banyak akun; hasil di-yield sesuai urutan selesai.
+
+        Validasi jumlah item dilakukan di sini (sebelum stream dimulai) supaya
+        error bisa dikembalikan sebagai response biasa.
+        """
+        usernames = list(dict.fromkeys(data.usernames))
+        if len(usernames) > self.setting.batch_max_items:
+            raise AppExceptionError(
+                message="Terlalu banyak username dalam satu batch",
+                context={"items": len(usernames), "max": self.setting.batch_max_items},
+            )
+        return self._balance_stream(usernames, data.debug)
+
+    async def _balance_item(self, username: str, debug: bool) -> dict[str, Any]:
+        # deadline per item, bukan per batch (task punya context sendiri)
+        deadline.set_deadline(self.setting.endpoints.deadline_for("balance"))
+        try:
+            response = await self.balance(DGReqUsername(username=username, debug=debug))
+        except AppExceptionError as exc:
+            return {"username": username, "ok": False, **exc.to_dict()}
+        except Exception as exc:
+            self.logger.exception(f"Batch balance {username} gagal")
+            return {
+                "username": username,
+                "ok": False,
+                "error": type(exc).__name__,
+                "message": str(exc),
+            }
+        return {
+            "username": username,
+            "ok": True,
+            "result": response.model_dump(mode="json"),
+        }
+
+    async def _balance_stream(
+        self, usernames: list[str], debug: bool
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Fan-out dibatasi `batch_max_concurrency`; task baru dimulai saat slot kosong."""
+        pending_names = iter(usernames)
+        running: set[asyncio.Task[dict[str, Any]]] = set()
+
+        def _fill() -> None:
+            while len(running) < self.setting.batch_max_concurrency:
+                username = next(pending_names, None)
+                if username is None:
+                    return
+                running.add(asyncio.create_task(self._balance_item(username, debug)))
+
+        try:
+            _fill()
+            while running:
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                running.difference_update(done)
+                _fill()
+                for task in done:
+                    yield task.result()
+        finally:
+            # client disconnect / generator ditutup → batalkan sisa request
+            for task in running:
+                task.cancel()
+
     async def profile(self, data: DGReqUsername):
-        self.auth_service.validate_username(data.username)
-        raw_response = await self.http_service.safe_request(
-            method="GET",
-            endpoint=self.setting.endpoints.profile,
-            params=data.model_dump(),
-        )
+        account = self.auth_service.validate_username(data.username)
+        raw_response = await self._read(account, "profile", data)
         return raw_response
 
     async def list_va(self, data: DGReqUsername):
-        self.auth_service.validate_username(data.username)
-        raw_response = await self.http_service.safe_request(
-            method="GET",
-            endpoint=self.setting.endpoints.list_va,
-            params=data.model_dump(),
-        )
+        account = self.auth_service.validate_username(data.username)
+        raw_response = await self._read(account, "list_va", data)
         return raw_response
 
     async def reward(self, data: DGReqUsername):
-        self.auth_service.validate_username(data.username)
-        raw_response = await self.http_service.safe_request(
-            method="GET",
-            endpoint=self.setting.endpoints.reward,
-            params=data.model_dump(),
-        )
+        account = self.auth_service.validate_username(data.username)
+        raw_response = await self._read(account, "reward", data)
         return raw_response
 
     async def banner(self, data: DGReqUsername):
-        self.auth_service.validate_username(data.username)
-        raw_response = await self.http_service.safe_request(
-            method="GET",
-            endpoint=self.setting.endpoints.banner,
-            params=data.model_dump(),
-        )
+        account = self.auth_service.validate_username(data.username)
+        raw_response = await self._read(account, "banner", data)
         return raw_response
 
     async def logout(self, data: DGReqUsername):
-        self.auth_service.validate_username(data.username)
-        raw_response = await self.http_service.safe_request(
-            method="GET",
-            endpoint=self.setting.endpoints.logout,
-            params=data.model_dump(),
-        )
-        return raw_response
+        account = self.auth_service.validate_username(data.username)
+        return await self._session(account, "logout", data)
 
     # utils methode
     async def sim_status(self, data: DGReqSimStatus):
-        self.auth_service.validate_username(data.username)
-        raw_response = await self.http_service.safe_request(
-            method="GET",
-            endpoint=self.setting.endpoints.sim_status,
-            params=data.model_dump(),
-        )
+        account = self.auth_service.validate_username(data.username)
+        raw_response = await self._call(account, "sim_status", data)
         return raw_response
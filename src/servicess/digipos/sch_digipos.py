@@ -21,6 +21,11 @@ class DGReqSimStatus(DGReqUsername):
     to: str
 
 
+class DGReqBalanceBatch(BaseModel):
+    usernames: list[str] = Field(min_length=1)
+    debug: bool = Field(default=False)
+
+
 class DGResBalance(BaseModel):
     ngrs: dict[str, str]
     linkaja: str
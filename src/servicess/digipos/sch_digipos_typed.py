@@ -0,0 +1,87 @@
+"""Typed schema response upstream Digipos per command.
+
+Body response di-decode langsung dari bytes ke model ini
+(`TypeAdapter.validate_json`, parser JSON pydantic-core) tanpa dict perantara.
+Field yang dideklarasikan wajib ada; jika shape upstream berubah, validasi
+gagal dan parser otomatis kembali ke jalur dict lama. Urutan key saat
+serialize mengikuti body upstream, bukan urutan field yang dideklarasikan.
+"""
+
+from typing import Any
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    PrivateAttr,
+    SerializerFunctionWrapHandler,
+    TypeAdapter,
+    ValidatorFunctionWrapHandler,
+    model_serializer,
+    model_validator,
+)
+
+from servicess.digipos.sch_digipos import DGResBalance
+
+
+class _Upstream(BaseModel):
+    """Field di luar schema tetap dibawa apa adanya."""
+
+    model_config = ConfigDict(extra="allow")
+
+    _key_order: tuple[str, ...] = PrivateAttr(default=())
+
+    @model_validator(mode="wrap")
+    @classmethod
+    def _keep_key_order(
+        cls, data: Any, handler: ValidatorFunctionWrapHandler
+    ) -> "_Upstream":
+        model = handler(data)
+        if isinstance(data, dict):
+            model._key_order = tuple(data)
+        return model
+
+    @model_serializer(mode="wrap")
+    def _upstream_order(self, handler: SerializerFunctionWrapHandler) -> dict[str, Any]:
+        out = handler(self)
+        if not self._key_order:
+            return out
+        return {key: out[key] for key in self._key_order if key in out} | out
+
+
+class DGProfileData(_Upstream):
+    outlet: dict[str, Any]
+    user: dict[str, Any]
+
+
+class DGResProfile(_Upstream):
+    data: DGProfileData
+
+
+class DGListVAData(_Upstream):
+    linkaja: Any
+    finpay: Any
+
+
+class DGResListVA(_Upstream):
+    data: DGListVAData
+
+
+class DGResSimStatus(_Upstream):
+    sim_status: str
+
+
+# reward & banner belum punya shape yang stabil: tetap typed decode dari bytes,
+# tapi sebagai object JSON generik
+DIGIPOS_SCHEMAS: dict[str, TypeAdapter] = {
+    "balance": TypeAdapter(DGResBalance),
+    "profile": TypeAdapter(DGResProfile),
+    "list_va": TypeAdapter(DGResListVA),
+    "reward": TypeAdapter(dict[str, Any]),
+    "banner": TypeAdapter(dict[str, Any]),
+    "sim_status": TypeAdapter(DGResSimStatus),
+}
+
+
+def digipos_schema(command: str) -> TypeAdapter | None:
+    """TypeAdapter untuk command, None = pakai jalur dict (login/otp/logout)."""
+    return DIGIPOS_SCHEMAS.get(command)
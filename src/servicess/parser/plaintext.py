@@ -0,0 +1,140 @@
+"""Renderer plaintext (`key=value&key={...}`) untuk output Otomax.
+
+Format sama dengan `dict_to_plaintext` lama: nested object → `{...}`, bool →
+`true/false`, spasi dihapus. Bedanya:
+
+- formatter per class model di-compile sekali (daftar field), render langsung
+  dari atribut model tanpa `model_dump()`;
+- satu pass ke satu list token lalu satu `join`, list & nested model ikut
+  ditangani (`[a,b]`, `{...}`).
+
+Hasil render tidak di-cache: payload balance membawa `meta` yang berubah tiap
+request (mis. `age_s`), dan key yang aman (class + JSON) sudah semahal render.
+"""
+
+from collections.abc import Callable
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel
+
+type _Format = Callable[[Any], str]
+
+
+def _text(value: Any) -> str:
+    return str(value).replace(" ", "")
+
+
+def _bool(value: bool) -> str:
+    return "true" if value else "false"
+
+
+def _none(_: None) -> str:
+    return "None"
+
+
+class PlaintextRenderer:
+    """Compile formatter per model class, render tanpa `model_dump()`.
+
+    Tabel `_formatters` berisi formatter untuk value di dalam object: dict &
+    model dibungkus `{...}`. Formatter field model ditentukan sekali dari
+    annotation (str/int/float langsung, sisanya dispatch per type value).
+    """
+
+    def __init__(self) -> None:
+        self._formatters: dict[type, _Format] = {
+            str: _text,
+            int: str,
+            float: _text,
+            bool: _bool,
+            type(None): _none,
+            dict: self._nested_dict,
+            list: self._list,
+            tuple: self._list,
+        }
+        self._models: dict[type[BaseModel], _Format] = {}
+
+    def _value(self, value: Any) -> str:
+        cls = type(value)
+        return (self._formatters.get(cls) or self._resolve(cls))(value)
+
+    def _resolve(self, cls: type) -> _Format:
+        """Formatter untuk type yang belum dikenal (model, enum, subclass)."""
+        if issubclass(cls, BaseModel):
+            model = self.compile(cls)
+
+            def fmt(obj: BaseModel) -> str:
+                return "{" + model(obj) + "}"
+
+        elif issubclass(cls, Enum):
+            fmt = self._enum
+        elif issubclass(cls, bool):
+            fmt = _bool
+        elif issubclass(cls, dict):
+            fmt = self._nested_dict
+        elif issubclass(cls, list | tuple):
+            fmt = self._list
+        else:
+            fmt = _text
+        self._formatters[cls] = fmt
+        return fmt
+
+    def _enum(self, value: Enum) -> str:
+        return self._value(value.value)
+
+    def _dict(self, data: dict) -> str:
+        get, resolve = self._formatters.get, self._resolve
+        return "&".join(
+            [
+                f"{str(k).replace(' ', '')}={(get(type(v)) or resolve(type(v)))(v)}"
+                for k, v in data.items()
+            ]
+        )
+
+    def _nested_dict(self, data: dict) -> str:
+        return "{" + self._dict(data) + "}"
+
+    def _list(self, items: list | tuple) -> str:
+        value = self._value
+        return "[" + ",".join([value(item) for item in items]) + "]"
+
+    def _field_formatter(self, annotation: Any) -> _Format:
+        # str/int/float: cukup str() tanpa dispatch; union/dict/model → per value
+        if annotation in (str, int, float):
+            return _text
+        return self._value
+
+    def compile(self, model: type[BaseModel]) -> _Format:
+        """Formatter `key=value&...` untuk model class, dibuat sekali per class."""
+        fmt = self._models.get(model)
+        if fmt is not None:
+            return fmt
+        fields = [
+            (name, name.replace(" ", ""), self._field_formatter(info.annotation))
+            for name, info in model.model_fields.items()
+            if not info.exclude  # sama dengan model_dump()
+        ]
+
+        def fmt(obj: BaseModel) -> str:
+            text = "&".join(
+                [
+                    f"{key}={field_fmt(getattr(obj, name))}"
+                    for name, key, field_fmt in fields
+                ]
+            )
+            extra = obj.__pydantic_extra__
+            if extra:
+                text = f"{text}&{self._dict(extra)}" if text else self._dict(extra)
+            return text
+
+        self._models[model] = fmt
+        return fmt
+
+    def render(self, obj: BaseModel | dict) -> str:
+        """Render model/dict ke `key=value&key={...}`."""
+        if not isinstance(obj, BaseModel):
+            return self._dict(obj)
+        return self.compile(type(obj))(obj)
+
+
+plaintext = PlaintextRenderer()
@@ -0,0 +1,85 @@
+"""Registry model output per target model.
+
+`ApiResponseOUT[T | ApiErrorParsing]` dan `TypeAdapter(T)` dibuat sekali per
+target model (saat register / pemakaian pertama), bukan di setiap request.
+Yang divalidasi per request hanya `raw_data` dari upstream; field internal
+(status_code, url, meta, ...) berasal dari kode kita sendiri sehingga dibangun
+lewat `model_construct` tanpa validasi ulang.
+"""
+
+from dataclasses import dataclass
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter
+
+from servicess.client.depre_cated_response_model import (
+    ApiErrorParsing,
+    ApiResponseOUT,
+    CleanAndParseStatus,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class OutputSpec[T: BaseModel]:
+    target: type[T] | None
+    model: type[ApiResponseOUT]
+    adapter: TypeAdapter[T] | None
+
+    def validate(self, raw_data: Any) -> T:
+        """Validasi data upstream ke target model (raise ValidationError)."""
+        if self.adapter is None:
+            raise TypeError("OutputSpec tanpa target model tidak bisa validasi")
+        return self.adapter.validate_python(raw_data)
+
+    def build(
+        self,
+        source: Any,
+        data: T | ApiErrorParsing,
+        parse: CleanAndParseStatus,
+        description: str | None = None,
+    ) -> ApiResponseOUT:
+        """Bangun output dari field trusted tanpa validasi (fast path)."""
+        meta = source.meta
+        return self.model.model_construct(
+            status_code=source.status_code,
+            url=source.url,
+            path=getattr(source, "path", "-"),
+            debug=source.debug,
+            meta=meta.copy() if meta else None,
+            parse=parse.value,
+            data=data,
+            description=description,
+        )
+
+
+class OutputModelRegistry:
+    """Cache OutputSpec per target model."""
+
+    def __init__(self) -> None:
+        self._specs: dict[type[BaseModel] | None, OutputSpec] = {}
+
+    def get(self, target: type[BaseModel] | None) -> OutputSpec:
+        """Spec milik target; dibuat & di-cache pada pemakaian pertama."""
+        spec = self._specs.get(target)
+        if spec is None:
+            if target is None:
+                spec = OutputSpec(None, ApiResponseOUT[ApiErrorParsing], None)
+            else:
+                spec = OutputSpec(
+                    target,
+                    ApiResponseOUT[target | ApiErrorParsing],
+                    TypeAdapter(target),
+                )
+            self._specs[target] = spec
+        return spec
+
+    def register(self, *targets: type[BaseModel]) -> None:
+        """Pre-build spec saat startup supaya request pertama tidak membayar."""
+        for target in targets:
+            self.get(target)
+
+    def registered(self) -> list[str]:
+        return [t.__name__ if t else "None" for t in self._specs]
+
+
+output_models = OutputModelRegistry()
@@ -11,6 +11,7 @@ class Tags(StrEnum):
     digipos_account = "digipos_account"
     digipos_utils = "digipos_utils"
     digipos_transaction = "digipos_transaction"
+    health = "health"
 
 
 tags_metadata: list[dict[str, Any]] = [{"name": tag} for tag in Tags]
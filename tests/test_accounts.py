@@ -0,0 +1,152 @@
+"""Multi akun Digipos: config lama, index username, limiter & cache per akun."""
+
+import asyncio
+
+import pytest
+from pydantic import ValidationError
+from src.core.client.base_manager import HttpClientManager
+from src.core.client.cache import ResponseCache
+from src.core.config.cfg_api_clients import DigiposConfig
+from src.custom.exceptions import AuthenticationError
+from src.servicess.digipos.auth_service import DigiposAuthService
+from src.servicess.digipos.command_service import DGCommandServices
+
+from servicess.client.model import ApiResponseIN
+from servicess.digipos.sch_digipos import DGReqUsername
+
+BALANCE = {"ngrs": {"saldo": "1000"}, "linkaja": "2", "finpay": "3"}
+
+
+def _config(**kwargs) -> DigiposConfig:
+    return DigiposConfig(
+        **{"name": "digipos", "base_url": "http://digipos.test", **kwargs}
+    )
+
+
+def _account(username: str, **kwargs) -> dict:
+    return {"username": username, "password": "x", "pin": "1", **kwargs}
+
+
+class SlowHttpService:
+    """Pengganti HttpRequestService yang mencatat username yang sedang in-flight."""
+
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+        self.active: dict[str, int] = {}
+        self.peak: dict[str, int] = {}
+
+    async def safe_request(self, *, params: dict, **_kwargs) -> ApiResponseIN:
+        username = params["username"]
+        self.calls.append(username)
+        self.active[username] = self.active.get(username, 0) + 1
+        self.peak[username] = max(self.peak.get(username, 0), self.active[username])
+        await asyncio.sleep(0.01)
+        self.active[username] -= 1
+        return ApiResponseIN(
+            status_code=200,
+            url="digipos.test",
+            path="/balance",
+            raw_data=BALANCE,
+            meta={"with_meta": False},
+            debug=False,
+        )
+
+
+def test_legacy_single_account_is_merged():
+    config = _config(username="old", password="p", pin="9", accounts=[_account("u1")])
+
+    assert [acc.username for acc in config.accounts] == ["old", "u1"]
+    assert config.account("old").password == "p"
+    assert config.account("missing") is None
+
+    # akun lama yang juga ada di `accounts` tidak diduplikasi
+    config = _config(username="u1", accounts=[_account("u1")])
+    assert [acc.username for acc in config.accounts] == ["u1"]
+
+
+def test_duplicate_username_is_rejected():
+    with pytest.raises(ValidationError, match="Duplicate Digipos account 'u1'"):
+        _config(accounts=[_account("u1"), _account("u1")])
+
+
+def test_unknown_username_is_rejected():
+    auth = DigiposAuthService(_config(accounts=[_account("u1")]))
+
+    assert auth.validate_username("u1").username == "u1"
+    with pytest.raises(AuthenticationError):
+        auth.validate_username("u2")
+    with pytest.raises(AuthenticationError):
+        auth.validate_usnpass("u1", "salah")
+
+
+def test_account_settings_overrides():
+    config = _config(
+        account_max_concurrency=5,
+        accounts=[
+            _account("u1"),
+            _account("u2", max_concurrency=1, cache_namespace="outlet-2"),
+        ],
+    )
+    u1, u2 = config.accounts
+
+    assert (config.concurrency_for(u1), config.concurrency_for(u2)) == (5, 1)
+    assert (u1.namespace, u2.namespace) == ("u1", "outlet-2")
+
+
+def test_account_limiters_are_separate_per_account():
+    manager = HttpClientManager()
+    manager.setup_client(_config())
+
+    u1 = manager.get_account_limiter("digipos", "u1", 2)
+    assert manager.get_account_limiter("digipos", "u1", 2) is u1
+    assert manager.get_account_limiter("digipos", "u2", 2) is not u1
+    assert u1.max_limit == 2
+    assert set(manager.account_limiter_stats("digipos")) == {"u1", "u2"}
+
+    manager.setup_client(_config(name="off", concurrency={"enabled": False}))
+    assert manager.get_account_limiter("off", "u1", 2) is None
+
+
+async def test_busy_account_does_not_block_other_accounts():
+    config = _config(
+        accounts=[_account("u1", max_concurrency=1), _account("u2")],
+        endpoints={"cache_ttl": {}},
+    )
+    manager = HttpClientManager()
+    manager.setup_client(config)
+    http = SlowHttpService()
+    service = DGCommandServices(
+        http,
+        DigiposAuthService(config),
+        config,
+        account_limiter=lambda account: manager.get_account_limiter(
+            "digipos", account.username, config.concurrency_for(account)
+        ),
+    )
+
+    await asyncio.gather(
+        *(service.balance(DGReqUsername(username="u1")) for _ in range(3)),
+        *(service.balance(DGReqUsername(username="u2")) for _ in range(3)),
+    )
+
+    assert http.peak == {"u1": 1, "u2": 3}
+
+
+async def test_cache_is_namespaced_per_account():
+    config = _config(accounts=[_account("u1"), _account("u2")])
+    http = SlowHttpService()
+    service = DGCommandServices(
+        http,
+        DigiposAuthService(config),
+        config,
+        cache=ResponseCache("digipos", max_bytes=1 << 20),
+    )
+
+    for username in ("u1", "u2", "u1", "u2"):
+        await service.balance(DGReqUsername(username=username))
+    assert http.calls == ["u1", "u2"]
+
+    service._invalidate(config.account("u1"))
+    for username in ("u1", "u2"):
+        await service.balance(DGReqUsername(username=username))
+    assert http.calls == ["u1", "u2", "u1"]
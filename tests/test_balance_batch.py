@@ -0,0 +1,143 @@
+"""/digipos/balance/batch: NDJSON, fan-out terbatas, error per akun inline."""
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.core.config.cfg_api_clients import DigiposConfig
+from src.custom.exceptions import AppExceptionError, HTTPConnectionError
+from src.custom.negotiation import negotiator
+from src.servicess.digipos.auth_service import DigiposAuthService
+from src.servicess.digipos.command_service import DGCommandServices
+
+from api.v1.dgp_account import router
+from servicess.client.model import ApiResponseIN
+from servicess.digipos.sch_digipos import DGReqBalanceBatch
+
+BALANCE = {"ngrs": {"saldo": "1000"}, "linkaja": "2", "finpay": "3"}
+
+
+class FakeHttpService:
+    """Balance per username; `down` → connection error, `boom` → bug tak terduga."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def safe_request(self, *, params: dict, **_kwargs) -> ApiResponseIN:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(0.03 if params["username"] == "slow" else 0.01)
+            if params["username"] == "down":
+                raise HTTPConnectionError(message="Connection error")
+            if params["username"] == "boom":
+                raise RuntimeError("boom")
+        finally:
+            self.active -= 1
+        return ApiResponseIN(
+            status_code=200,
+            url="digipos.test",
+            path="/balance",
+            raw_data=BALANCE,
+            meta={"with_meta": False},
+            debug=False,
+        )
+
+
+def _service(http: FakeHttpService, **settings) -> DGCommandServices:
+    names = ["slow", "down", "boom", *(f"u{i}" for i in range(6))]
+    config = DigiposConfig(
+        name="digipos",
+        base_url="http://digipos.test",
+        accounts=[{"username": n, "password": "x", "pin": "1"} for n in names],
+        endpoints={"cache_ttl": {}},
+        **settings,
+    )
+    return DGCommandServices(http, DigiposAuthService(config), config)
+
+
+async def _collect(service: DGCommandServices, usernames: list[str]) -> list[dict]:
+    batch = service.balance_batch(DGReqBalanceBatch(usernames=usernames))
+    return [item async for item in batch]
+
+
+async def test_fan_out_is_bounded_and_deduplicated():
+    http = FakeHttpService()
+    service = _service(http, batch_max_concurrency=2)
+    usernames = [f"u{i}" for i in range(6)]
+
+    items = await _collect(service, [*usernames, "u0"])
+
+    assert sorted(item["username"] for item in items) == usernames
+    assert all(item["ok"] for item in items)
+    assert http.peak == 2
+
+
+async def test_results_stream_in_completion_order():
+    service = _service(FakeHttpService())
+
+    items = await _collect(service, ["slow", "u0", "u1"])
+
+    assert items[-1]["username"] == "slow"
+
+
+async def test_errors_are_reported_inline():
+    service = _service(FakeHttpService())
+
+    items = {
+        item["username"]: item
+        for item in await _collect(service, ["down", "boom", "nobody", "u0"])
+    }
+
+    assert items["u0"]["ok"] is True
+    assert items["u0"]["result"]["data"] == BALANCE
+    assert items["down"] == {
+        "username": "down",
+        "ok": False,
+        "error": "HTTPConnectionError",
+        "message": "Connection error",
+    }
+    assert items["boom"]["error"] == "RuntimeError"
+    assert items["nobody"]["error"] == "AuthenticationError"
+
+
+def test_too_many_items_fail_before_streaming():
+    service = _service(FakeHttpService(), batch_max_items=2)
+
+    with pytest.raises(AppExceptionError, match="Terlalu banyak"):
+        service.balance_batch(DGReqBalanceBatch(usernames=["u0", "u1", "u2"]))
+
+
+def _client(service: DGCommandServices) -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+    app.add_exception_handler(
+        AppExceptionError,
+        lambda _request, exc: negotiator.render(exc, None, status_code=exc.status_code),
+    )
+    app.state.services = SimpleNamespace(digipos=SimpleNamespace(command=service))
+    return TestClient(app)
+
+
+def test_route_streams_ndjson():
+    client = _client(_service(FakeHttpService(), batch_max_items=3))
+
+    resp = client.post(
+        f"{router.prefix}/balance/batch", json={"usernames": ["u0", "down"]}
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert {(line["username"], line["ok"]) for line in lines} == {
+        ("u0", True),
+        ("down", False),
+    }
+
+    resp = client.post(
+        f"{router.prefix}/balance/batch", json={"usernames": ["u0", "u1", "u2", "u3"]}
+    )
+    assert resp.status_code == 400
@@ -0,0 +1,112 @@
+"""Balancer: rewrite host berdasarkan origin, bukan prefix string URL."""
+
+import asyncio
+
+import httpx
+import pytest
+from src.core.client.balancer import BalancerTransport, HostState
+from src.core.config.cfg_api_clients import ClientBalancer
+
+
+async def _send(bases: list[str], url: str, target: str) -> httpx.URL:
+    seen: list[httpx.URL] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url)
+        return httpx.Response(200)
+
+    balancer = BalancerTransport(httpx.MockTransport(handler), bases, ClientBalancer())
+    chosen = next(host for host in balancer.hosts if host.base == target)
+    balancer.pick = lambda: chosen
+
+    await balancer.handle_async_request(httpx.Request("GET", url))
+    assert chosen.requests == 1
+    return seen[0]
+
+
+@pytest.mark.parametrize(
+    ("bases", "url", "target", "expected"),
+    [
+        # base .3 adalah prefix string dari .30
+        (
+            ["http://10.0.0.3", "http://10.0.0.30"],
+            "http://10.0.0.30/balance?username=u1",
+            "http://10.0.0.3",
+            "http://10.0.0.3/balance?username=u1",
+        ),
+        (
+            ["http://10.0.0.3", "http://10.0.0.30"],
+            "http://10.0.0.3/balance",
+            "http://10.0.0.30",
+            "http://10.0.0.30/balance",
+        ),
+        # port 80 (default) vs 8080
+        (
+            ["http://upstream:80", "http://upstream:8080"],
+            "http://upstream:8080/balance",
+            "http://upstream:80",
+            "http://upstream/balance",
+        ),
+        (
+            ["http://upstream:80", "http://upstream:8080"],
+            "http://upstream/balance",
+            "http://upstream:8080",
+            "http://upstream:8080/balance",
+        ),
+        # base dengan path prefix berbeda
+        (
+            ["http://a.test/api", "http://b.test/v2/api"],
+            "http://a.test/api/balance",
+            "http://b.test/v2/api",
+            "http://b.test/v2/api/balance",
+        ),
+    ],
+)
+async def test_rewrite_matches_origin(bases, url, target, expected):
+    assert await _send(bases, url, target) == httpx.URL(expected)
+
+
+async def test_same_host_is_not_rewritten():
+    url = "http://10.0.0.30/balance"
+    bases = ["http://10.0.0.3", "http://10.0.0.30"]
+    assert await _send(bases, url, "http://10.0.0.30") == httpx.URL(url)
+
+
+async def test_ejected_host_is_probed_and_readmitted():
+    settings = ClientBalancer(eject_after_failures=1, eject_duration_s=0.3)
+    fail = {"http://a.test": True}
+    seen: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        host = f"http://{request.url.host}"
+        seen.append(host)
+        if fail.get(host):
+            # gagal lambat → EWMA a jauh lebih buruk dari b
+            await asyncio.sleep(0.1)
+            return httpx.Response(503)
+        await asyncio.sleep(0.01 if host == "http://a.test" else 0.02)
+        return httpx.Response(200)
+
+    balancer = BalancerTransport(
+        httpx.MockTransport(handler), ["http://a.test", "http://b.test"], settings
+    )
+    a = balancer.hosts[0]
+
+    async def send() -> None:
+        await balancer.handle_async_request(httpx.Request("GET", "http://a.test/x"))
+
+    await send()
+    assert a.state == HostState.EJECTED
+    for _ in range(3):
+        await send()
+    assert seen[1:] == ["http://b.test"] * 3
+
+    fail.clear()
+    await asyncio.sleep(0.3)
+    await send()
+    assert seen[-1] == "http://a.test"
+    assert a.state == HostState.UP
+
+    # EWMA baru (lebih cepat dari b) → a kembali dapat traffic
+    await send()
+    assert seen[-1] == "http://a.test"
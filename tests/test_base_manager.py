@@ -0,0 +1,70 @@
+"""Startup client manager: setup error di-raise, warm-up opt-in & ditoleransi."""
+
+import httpx
+import pytest
+from src.core.client import base_manager
+from src.core.client.base_manager import HttpClientManager
+from src.core.config.cfg_api_clients import ApiBaseConfig
+
+
+def _config(**overrides) -> ApiBaseConfig:
+    return ApiBaseConfig(
+        name="digipos",
+        base_url="http://digipos.invalid",
+        health={"enabled": False},
+        **overrides,
+    )
+
+
+async def test_setup_error_is_raised(monkeypatch):
+    def _broken(_config):
+        raise RuntimeError("factory broken")
+
+    monkeypatch.setattr(base_manager.HttpClientFactory, "create_client", _broken)
+    manager = HttpClientManager()
+
+    with pytest.raises(RuntimeError, match="factory broken"):
+        await manager.start_all([_config()])
+
+
+async def test_warmup_error_is_tolerated(monkeypatch):
+    async def _broken(_self, _name):
+        raise httpx.ConnectError("upstream down")
+
+    monkeypatch.setattr(HttpClientManager, "warmup", _broken)
+    manager = HttpClientManager()
+
+    await manager.start_all([_config()], deadline_s=5)
+    try:
+        assert isinstance(manager.get_client("digipos"), httpx.AsyncClient)
+    finally:
+        await manager.stop_all()
+
+
+def _counting_client(requests: list[str]) -> httpx.AsyncClient:
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(f"{request.method} {request.url.path}")
+        return httpx.Response(200)
+
+    return httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), base_url="http://digipos.invalid"
+    )
+
+
+async def test_warmup_is_opt_in():
+    requests: list[str] = []
+    manager = HttpClientManager()
+    manager.register_client("digipos", _counting_client(requests), _config())
+
+    await manager.warmup("digipos")
+    assert requests == []
+
+
+async def test_warmup_opens_configured_connections():
+    requests: list[str] = []
+    manager = HttpClientManager()
+    config = _config(warmup={"connections": 3, "path": "/ping"})
+    manager.register_client("digipos", _counting_client(requests), config)
+
+    await manager.warmup("digipos")
+    assert requests == ["HEAD /ping"] * 3
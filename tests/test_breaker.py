@@ -0,0 +1,109 @@
+"""CircuitBreaker: closed → open → half-open → closed/open, opt-in per client."""
+
+import asyncio
+
+import pytest
+from src.core.client.base_manager import HttpClientManager
+from src.core.client.breaker import BreakerState, CircuitBreaker
+from src.core.config.cfg_api_clients import ApiBaseConfig, ClientBreaker
+from src.custom.exceptions import HTTPConnectionError
+
+
+def _breaker(**settings) -> CircuitBreaker:
+    config = {
+        "window_size": 4,
+        "min_calls": 4,
+        "open_duration_s": 0.2,
+        "half_open_max_calls": 2,
+        **settings,
+    }
+    return CircuitBreaker("digipos", ClientBreaker(**config))
+
+
+def _call(breaker: CircuitBreaker, success: bool, elapsed_s: float = 0.01) -> None:
+    breaker.before_call("/balance")
+    breaker.record(success, elapsed_s)
+
+
+def _trip(breaker: CircuitBreaker) -> None:
+    for _ in range(4):
+        _call(breaker, success=False)
+    assert breaker.state == BreakerState.OPEN
+
+
+def test_opens_after_failure_rate_and_fails_fast():
+    breaker = _breaker()
+    for success in (True, False, True):
+        _call(breaker, success)
+    assert breaker.state == BreakerState.CLOSED  # belum min_calls
+
+    _call(breaker, success=False)
+    assert breaker.state == BreakerState.OPEN
+
+    with pytest.raises(HTTPConnectionError, match="Circuit open") as exc:
+        breaker.before_call("/balance")
+    assert exc.value.context["circuit"] == "open"
+    assert breaker.snapshot()["rejected"] == 1
+
+
+def test_slow_calls_open_circuit():
+    breaker = _breaker(slow_call_threshold_s=1.0, slow_call_rate_threshold=0.75)
+
+    for _ in range(3):
+        _call(breaker, success=True, elapsed_s=2.0)
+    _call(breaker, success=True)
+
+    assert breaker.state == BreakerState.OPEN
+
+
+async def test_half_open_probes_close_circuit():
+    breaker = _breaker()
+    _trip(breaker)
+    await asyncio.sleep(0.25)
+
+    breaker.before_call("/balance")
+    assert breaker.state == BreakerState.HALF_OPEN
+    breaker.before_call("/balance")
+    with pytest.raises(HTTPConnectionError):
+        breaker.before_call("/balance")  # kuota probe habis
+
+    breaker.record(True, 0.01)
+    breaker.record(True, 0.01)
+    assert breaker.state == BreakerState.CLOSED
+
+
+async def test_failed_probe_reopens_circuit():
+    breaker = _breaker()
+    _trip(breaker)
+    await asyncio.sleep(0.25)
+
+    _call(breaker, success=False)
+
+    assert breaker.state == BreakerState.OPEN
+    with pytest.raises(HTTPConnectionError):
+        breaker.before_call("/balance")
+
+
+async def test_lost_probes_do_not_pin_half_open():
+    breaker = _breaker()
+    _trip(breaker)
+    await asyncio.sleep(0.25)
+    breaker.before_call("/balance")
+    breaker.before_call("/balance")  # dua probe tidak pernah di-record
+
+    await asyncio.sleep(0.25)
+    breaker.before_call("/balance")
+    assert breaker.state == BreakerState.HALF_OPEN
+
+
+def test_breaker_is_opt_in():
+    config = {"name": "digipos", "base_url": "http://digipos.invalid"}
+    manager = HttpClientManager()
+
+    manager.setup_client(ApiBaseConfig(**config))
+    assert manager.get_breaker("digipos") is None
+
+    manager.setup_client(
+        ApiBaseConfig(**{**config, "name": "other"}, breaker={"enabled": True})
+    )
+    assert isinstance(manager.get_breaker("other"), CircuitBreaker)
@@ -0,0 +1,207 @@
+"""Response cache: meta debug tidak bocor antar caller, error tidak di-cache."""
+
+import asyncio
+
+import pytest
+from src.core.client.cache import CacheState, ResponseCache
+from src.core.config.cfg_api_clients import DigiposConfig
+from src.custom.exceptions import HTTPConnectionError
+from src.servicess.digipos.auth_service import DigiposAuthService
+from src.servicess.digipos.command_service import DGCommandServices
+
+from servicess.client.model import ApiResponseIN, ResponseType
+from servicess.digipos.sch_digipos import DGReqUsername
+
+BALANCE = {"ngrs": {"saldo": "1000"}, "linkaja": "2", "finpay": "3"}
+
+
+def _response(raw_data, debug: bool = False, response_type=ResponseType.DICT):
+    meta = {"with_meta": False}
+    if debug:
+        meta = {
+            "with_meta": True,
+            "response_headers": {"x-secret": "s3cr3t"},
+            "response_type": response_type,
+        }
+    return ApiResponseIN(
+        status_code=200,
+        url="digipos.test",
+        path="/balance",
+        raw_data=raw_data,
+        meta=meta,
+        debug=debug,
+    )
+
+
+class FakeHttpService:
+    """Pengganti HttpRequestService: tiap call menghasilkan response baru."""
+
+    def __init__(self, raw_data=BALANCE) -> None:
+        self.raw_data = raw_data
+        self.calls = 0
+
+    async def safe_request(self, *, debugresponse: bool = False, **_kwargs):
+        self.calls += 1
+        return _response(self.raw_data, debug=debugresponse)
+
+
+def _service(http: FakeHttpService) -> DGCommandServices:
+    config = DigiposConfig(
+        name="digipos",
+        base_url="http://digipos.test",
+        accounts=[{"username": "u1", "password": "x", "pin": "1"}],
+    )
+    cache = ResponseCache("digipos", max_bytes=1 << 20)
+    return DGCommandServices(http, DigiposAuthService(config), config, cache=cache)
+
+
+async def test_debug_meta_is_not_served_to_other_callers():
+    http = FakeHttpService()
+    service = _service(http)
+
+    debug = await service.balance(DGReqUsername(username="u1", debug=True))
+    assert debug.debug is True
+    assert debug.meta["response_headers"] == {"x-secret": "s3cr3t"}
+
+    plain = await service.balance(DGReqUsername(username="u1"))
+    cached = await service.balance(DGReqUsername(username="u1", text=False))
+
+    assert http.calls == 2  # debug tidak mengisi cache, plain mengisi
+    for response in (plain, cached):
+        assert response.debug is False
+        assert "response_headers" not in response.meta
+        assert "s3cr3t" not in response.model_dump_json()
+    assert cached.meta["cache_state"] == "FRESH"
+
+
+async def test_debug_call_does_not_read_non_debug_entry():
+    http = FakeHttpService()
+    service = _service(http)
+
+    await service.balance(DGReqUsername(username="u1"))
+    debug = await service.balance(DGReqUsername(username="u1", debug=True))
+
+    assert http.calls == 2
+    assert debug.meta["with_meta"] is True
+    assert debug.meta["cache"]["bypass"] is True
+
+
+async def test_error_responses_are_not_cached():
+    cache = ResponseCache("digipos", max_bytes=1 << 20)
+    loads = 0
+    bodies = [
+        {"parse_error": True, "error": "Expecting value", "raw": "<html>"},
+        {"fallback_raw": "<html>maintenance</html>"},
+    ]
+
+    for body in bodies:
+
+        async def _load(body=body):
+            nonlocal loads
+            loads += 1
+            return _response(body)
+
+        first = await cache.get_or_load("u1", "profile", 60, _load)
+        second = await cache.get_or_load("u1", "profile", 60, _load)
+        assert first.value.is_error
+        assert second.state == "MISS"
+
+    assert loads == 4
+    assert cache.info()["entries"] == 0
+
+
+def test_set_skips_error_response():
+    cache = ResponseCache("digipos", max_bytes=1 << 20)
+    error = _response({"raw": "x"}, debug=True, response_type=ResponseType.ERROR)
+
+    cache.set("u1", "balance", error, ttl=60)
+    cache.set("u1", "profile", _response(BALANCE), ttl=60)
+
+    assert cache.get("u1", "balance") is None
+    assert cache.get("u1", "profile") is not None
+
+
+async def test_load_started_before_invalidate_is_not_cached():
+    cache = ResponseCache("digipos", max_bytes=1 << 20)
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def slow_loader():
+        started.set()
+        await release.wait()
+        return {"session": "old"}
+
+    load = asyncio.create_task(cache.get_or_load("u1", "balance", 60, slow_loader))
+    await started.wait()
+    cache.invalidate("u1")  # mis. login/logout di tengah request
+    release.set()
+
+    result = await load
+    assert result.value == {"session": "old"}  # caller tetap dapat hasilnya
+    assert cache.get("u1", "balance") is None
+
+    fresh = await cache.get_or_load("u1", "balance", 60, _value({"session": "new"}))
+    assert fresh.state == CacheState.MISS
+    assert cache.get("u1", "balance").value == {"session": "new"}
+
+
+def _value(value):
+    async def loader():
+        return value
+
+    return loader
+
+
+async def test_stale_entry_is_served_while_revalidating():
+    cache = ResponseCache("digipos", max_bytes=1 << 20, stale_while_revalidate=1)
+    calls = 0
+
+    async def loader():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return {"saldo": calls}
+
+    await cache.get_or_load("u1", "balance", 0.01, loader)
+    await asyncio.sleep(0.02)
+
+    stale = await asyncio.gather(
+        *(cache.get_or_load("u1", "balance", 0.01, loader) for _ in range(3))
+    )
+    assert [r.state for r in stale] == [CacheState.STALE] * 3
+    assert all(r.value == {"saldo": 1} for r in stale)
+
+    await asyncio.sleep(0.015)  # satu background refresh untuk tiga caller
+    assert calls == 2
+    assert cache.get("u1", "balance").value == {"saldo": 2}
+    assert cache.stats.endpoint("balance").refreshes == 1
+
+
+async def test_stale_entry_is_served_on_upstream_error():
+    cache = ResponseCache("digipos", max_bytes=1 << 20, stale_if_error=1)
+
+    async def down():
+        raise HTTPConnectionError(message="down")
+
+    await cache.get_or_load("u1", "balance", 0.01, _value({"saldo": 1}))
+    await asyncio.sleep(0.02)
+
+    result = await cache.get_or_load("u1", "balance", 0.01, down)
+    assert result.state == CacheState.STALE_IF_ERROR
+    assert result.value == {"saldo": 1}
+
+    cache.invalidate("u1")
+    with pytest.raises(HTTPConnectionError):
+        await cache.get_or_load("u1", "balance", 0.01, down)
+
+
+async def test_stale_windows_are_off_by_default():
+    cache = ResponseCache("digipos", max_bytes=1 << 20)
+
+    async def down():
+        raise HTTPConnectionError(message="down")
+
+    await cache.get_or_load("u1", "balance", 0.01, _value({"saldo": 1}))
+    await asyncio.sleep(0.02)
+
+    with pytest.raises(HTTPConnectionError):
+        await cache.get_or_load("u1", "balance", 0.01, down)
@@ -0,0 +1,90 @@
+"""Single-flight: GET identik bersamaan berbagi satu upstream call."""
+
+import asyncio
+
+import httpx
+import pytest
+from src.core.client.coalesce import RequestCoalescer
+from src.custom.exceptions import HTTPConnectionError
+
+from servicess.client.request import HttpRequestService
+from servicess.client.response import ResponseHandlerFactory
+
+
+def _service(calls: list[str], fail: bool = False) -> HttpRequestService:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url.params))
+        await asyncio.sleep(0.02)
+        if fail:
+            raise httpx.ConnectError("down", request=request)
+        return httpx.Response(200, json={"saldo": "1000"})
+
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), base_url="http://digipos.test"
+    )
+    return HttpRequestService(
+        client, ResponseHandlerFactory(), coalescer=RequestCoalescer("digipos")
+    )
+
+
+async def test_identical_gets_share_one_upstream_call():
+    calls: list[str] = []
+    service = _service(calls)
+
+    responses = await asyncio.gather(
+        *(
+            service.safe_request(
+                "GET", "/balance", params={"username": "u1", "text": text}
+            )
+            for text in (True, False, True)
+        )
+    )
+
+    assert len(calls) == 1  # `text` tidak mempengaruhi hasil upstream
+    assert len({id(response) for response in responses}) == 3
+    assert all(response.raw_data == {"saldo": "1000"} for response in responses)
+    assert service.coalescer.stats.snapshot()["merged"] == 2
+    assert service.coalescer.inflight == 0
+
+
+async def test_different_params_are_not_merged():
+    calls: list[str] = []
+    service = _service(calls)
+
+    await asyncio.gather(
+        service.safe_request("GET", "/balance", params={"username": "u1"}),
+        service.safe_request("GET", "/balance", params={"username": "u2"}),
+    )
+
+    assert len(calls) == 2
+
+
+async def test_cancelled_caller_does_not_cancel_followers():
+    calls: list[str] = []
+    service = _service(calls)
+    params = {"username": "u1"}
+
+    first = asyncio.create_task(service.safe_request("GET", "/balance", params=params))
+    second = asyncio.create_task(service.safe_request("GET", "/balance", params=params))
+    await asyncio.sleep(0.005)
+    first.cancel()
+
+    assert (await second).raw_data == {"saldo": "1000"}
+    assert len(calls) == 1
+
+
+async def test_error_reaches_every_caller_and_is_not_reused():
+    calls: list[str] = []
+    service = _service(calls, fail=True)
+    params = {"username": "u1"}
+
+    results = await asyncio.gather(
+        *(service.safe_request("GET", "/balance", params=params) for _ in range(3)),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, HTTPConnectionError) for result in results)
+    assert len(calls) == 1
+
+    with pytest.raises(HTTPConnectionError):
+        await service.safe_request("GET", "/balance", params=params)
+    assert len(calls) == 2
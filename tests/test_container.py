@@ -0,0 +1,72 @@
+"""Service graph: dibangun sekali, dipakai ulang semua request."""
+
+from types import SimpleNamespace
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.core.client.base_manager import HttpClientManager
+from src.core.config.cfg_api_clients import DigiposConfig
+from src.deps.container import build_services, get_services
+from src.deps.dep_digipos import DepDigiposCommandService, DepDigiposHttpService
+
+
+def _app(**digipos) -> FastAPI:
+    config = DigiposConfig(
+        name="digipos",
+        base_url="http://digipos.test",
+        accounts=[{"username": "u1", "password": "x", "pin": "1"}],
+        **digipos,
+    )
+    manager = HttpClientManager()
+    manager.setup_client(config)
+    app = FastAPI()
+    app.state.settings = SimpleNamespace(digipos=config)
+    app.state.api_manager = manager
+    return app
+
+
+def test_graph_is_wired_to_manager_components():
+    app = _app(breaker={"enabled": True})
+    manager = app.state.api_manager
+
+    services = build_services(app.state.settings, manager)
+    http = services.digipos.http
+    command = services.digipos.command
+
+    assert http.client is manager.get_client("digipos")
+    assert http.breaker is manager.get_breaker("digipos")
+    assert http.limiter is manager.get_limiter("digipos")
+    assert http.response_handler is services.response_handler
+    assert command.http_service is http
+    assert command.auth_service is services.digipos.auth
+    assert command.cache is manager.get_cache("digipos")
+    assert command.rate_limiter is None  # opt-in
+    account = services.digipos.config.account("u1")
+    assert command.account_limiter(account) is command.account_limiter(account)
+
+
+def test_get_services_builds_once():
+    app = _app()
+
+    services = get_services(app)
+
+    assert get_services(app) is services
+    assert app.state.services is services
+
+
+def test_dependencies_reuse_singletons_across_requests():
+    app = _app()
+    app.state.services = build_services(app.state.settings, app.state.api_manager)
+
+    @app.get("/ids")
+    async def _ids(command: DepDigiposCommandService, http: DepDigiposHttpService):
+        return [id(command), id(http)]
+
+    client = TestClient(app)
+    first = client.get("/ids").json()
+
+    assert client.get("/ids").json() == first
+    assert first == [
+        id(app.state.services.digipos.command),
+        id(app.state.services.digipos.http),
+    ]
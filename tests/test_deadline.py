@@ -0,0 +1,127 @@
+"""Deadline inbound: dipropagasi lewat contextvar, memotong timeout upstream."""
+
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from src.core.client import deadline
+from src.custom.exceptions import DeadlineExceededError
+from src.deps.dep_factory import deadline_factory
+
+from servicess.client.request import HttpRequestService
+from servicess.client.response import ResponseHandlerFactory
+
+
+def _service(seen: list[dict]) -> HttpRequestService:
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"])
+        return httpx.Response(200, json={"saldo": "1000"})
+
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler),
+        base_url="http://digipos.test",
+        timeout=httpx.Timeout(10.0, connect=2.0),
+    )
+    return HttpRequestService(client, ResponseHandlerFactory())
+
+
+def test_no_deadline_is_noop():
+    assert deadline.remaining() is None
+    assert deadline.ensure_time_left("/balance") is None
+
+
+def test_deadline_is_scoped_and_copied_to_tasks():
+    async def child() -> float | None:
+        return deadline.remaining()
+
+    async def main() -> float | None:
+        token = deadline.set_deadline(5.0)
+        try:
+            return await asyncio.create_task(child())
+        finally:
+            deadline.reset_deadline(token)
+
+    assert 4.5 < asyncio.run(main()) <= 5.0
+    assert deadline.remaining() is None
+
+
+def test_shrink_timeouts_caps_every_phase():
+    timeouts = {"connect": 2.0, "read": 10.0, "write": None, "pool": 5.0}
+
+    assert deadline.shrink_timeouts(timeouts, 3.0) == {
+        "connect": 2.0,
+        "read": 3.0,
+        "write": 3.0,
+        "pool": 3.0,
+    }
+
+
+async def test_upstream_timeout_is_cut_to_remaining_deadline():
+    seen: list[dict] = []
+    service = _service(seen)
+
+    await service.safe_request("GET", "/balance")
+    token = deadline.set_deadline(1.0)
+    try:
+        await service.safe_request("GET", "/balance")
+    finally:
+        deadline.reset_deadline(token)
+
+    assert seen[0]["read"] == 10.0
+    assert seen[1]["connect"] <= 1.0
+    assert seen[1]["read"] <= 1.0
+
+
+async def test_expired_deadline_skips_upstream():
+    seen: list[dict] = []
+    service = _service(seen)
+
+    token = deadline.set_deadline(0.001)
+    await asyncio.sleep(0.005)
+    try:
+        with pytest.raises(DeadlineExceededError) as exc:
+            await service.safe_request("GET", "/balance")
+    finally:
+        deadline.reset_deadline(token)
+
+    assert exc.value.status_code == 504
+    assert seen == []
+
+
+@pytest.fixture
+def client() -> TestClient:
+    app = FastAPI()
+    app.state.settings = SimpleNamespace(default_s=8.0)
+
+    @app.get("/remaining")
+    async def _remaining(
+        timeout_s: float = Depends(deadline_factory(lambda s: s.default_s)),
+    ):
+        return {"timeout_s": timeout_s, "left": deadline.remaining()}
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "expected"),
+    [
+        ({}, 8.0),
+        ({"headers": {deadline.DEADLINE_HEADER: "2.5"}}, 2.5),
+        ({"params": {deadline.DEADLINE_QUERY: "3"}}, 3.0),
+    ],
+)
+def test_dependency_uses_caller_deadline_or_route_default(client, kwargs, expected):
+    body = client.get("/remaining", **kwargs).json()
+
+    assert body["timeout_s"] == expected
+    assert 0 < body["left"] <= expected
+
+
+def test_dependency_rejects_non_positive_deadline(client):
+    assert (
+        client.get("/remaining", headers={deadline.DEADLINE_HEADER: "0"}).status_code
+        == 422
+    )
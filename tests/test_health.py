@@ -0,0 +1,82 @@
+"""Health check: state up/down dari probe dan readiness dari cache state."""
+
+
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.core.client.base_manager import HttpClientManager
+from src.core.client.health import HealthChecker
+from src.core.config.cfg_api_clients import ApiBaseConfig, ClientHealth
+
+from api.v1.health import router
+
+
+def _checker(statuses: list[int], **settings) -> HealthChecker:
+    replies = iter(statuses)
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda _req: httpx.Response(next(replies))),
+        base_url="http://digipos.test",
+    )
+    return HealthChecker("digipos", client, ClientHealth(**settings))
+
+
+async def test_state_follows_thresholds():
+    checker = _checker([503, 200, 500, 200, 500, 500], failure_threshold=2)
+
+    assert await checker.check() is False
+    assert checker.state.up is False  # unknown → down pada gagal pertama
+    assert await checker.check() is True
+    assert checker.state.up is True
+    await checker.check()
+    assert checker.state.up is True  # satu gagal belum melewati threshold
+    await checker.check()
+    await checker.check()
+    await checker.check()
+    assert checker.state.up is False
+    assert checker.snapshot()["last_error"] == "status 500"
+
+
+async def test_connection_error_marks_down():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("refused", request=request)
+
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    checker = HealthChecker("digipos", client, ClientHealth())
+
+    assert await checker.check() is False
+    assert "ConnectError" in checker.state.last_error
+
+
+def _manager(**health) -> HttpClientManager:
+    manager = HttpClientManager()
+    manager.setup_client(
+        ApiBaseConfig(name="digipos", base_url="http://digipos.invalid", health=health)
+    )
+    return manager
+
+
+def _ready(manager: HttpClientManager) -> httpx.Response:
+    app = FastAPI()
+    app.include_router(router)
+    app.state.api_manager = manager
+    return TestClient(app).get("/health/ready")
+
+
+def test_health_checks_are_opt_in():
+    manager = _manager()
+
+    assert manager.health_snapshot() == {}
+    assert _ready(manager).status_code == 200
+
+
+def test_only_critical_clients_gate_readiness():
+    manager = _manager(enabled=True)
+    assert _ready(manager).status_code == 200  # enabled, belum critical
+
+    manager = _manager(enabled=True, critical=True)
+    resp = _ready(manager)
+    assert resp.status_code == 503
+    assert resp.json()["clients"]["digipos"]["status"] == "unknown"
+
+    manager._health["digipos"].state.up = True
+    assert _ready(manager).json()["status"] == "ready"
@@ -0,0 +1,47 @@
+"""Hedging: response 5xx tidak boleh memenangkan race."""
+
+import asyncio
+
+import httpx
+from src.core.client.hedging import RequestHedger
+from src.core.config.cfg_api_clients import ClientHedge
+
+
+def _hedger() -> RequestHedger:
+    hedger = RequestHedger(
+        "digipos", ClientHedge(enabled=True, min_samples=1, min_delay_s=0.01)
+    )
+    hedger.tracker("/balance").observe(0.01)
+    return hedger
+
+
+def _call(*plan: tuple[float, int]):
+    """Attempt ke-n menunggu `delay` detik lalu mengembalikan `status`."""
+    attempts = iter(plan)
+
+    async def call() -> httpx.Response:
+        delay, status = next(attempts)
+        await asyncio.sleep(delay)
+        return httpx.Response(status)
+
+    return call
+
+
+async def test_hedge_wins_when_primary_returns_5xx():
+    hedger = _hedger()
+
+    response = await hedger.run("/balance", _call((0.05, 503), (0.1, 200)))
+
+    assert response.status_code == 200
+    assert hedger.stats.hedge_wins == 1
+    assert len(hedger.tracker("/balance")) == 2
+
+
+async def test_5xx_returned_only_when_every_attempt_fails():
+    hedger = _hedger()
+
+    response = await hedger.run("/balance", _call((0.05, 503), (0.1, 502)))
+
+    assert response.status_code == 503
+    assert hedger.stats.hedge_wins == 0
+    assert len(hedger.tracker("/balance")) == 1  # latency gagal tidak dicatat
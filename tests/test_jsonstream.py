@@ -0,0 +1,119 @@
+"""StreamingJSONDecoder: hasil sama dengan json.loads, seleksi field nested."""
+
+import json
+
+import httpx
+import pytest
+from src.core.client.jsonstream import (
+    JSONStreamReader,
+    StreamingJSONDecoder,
+    parse_fields,
+)
+from src.custom.exceptions import ResponseTooLargeError
+
+PROFILE = {
+    "status": "ok",
+    "code": 0,
+    "data": {
+        "outlet": {"id": 12, "name": "Toko Ü", "tags": ["a", "b"], "empty": {}},
+        "user": {"name": "u1", "active": True, "limit": 1.5e3, "note": None},
+        "items": [{"sku": i, "price": i * 1000} for i in range(5)],
+    },
+    "ts": 1700000000,
+}
+
+
+def _decode(payload: bytes, chunk: int, fields=None):
+    decoder = StreamingJSONDecoder(fields)
+    for i in range(0, len(payload), chunk):
+        decoder.feed(payload[i : i + chunk])
+    return decoder.close()
+
+
+@pytest.mark.parametrize("chunk", [1, 2, 7, 64, 1 << 20])
+@pytest.mark.parametrize(
+    "value",
+    [
+        PROFILE,
+        {},
+        {"a": {}},
+        {"a": {"b": {"c": {"d": [1, {"e": 2}]}}}},
+        {"n": -12.5e-3, "s": 'x\\"y', "u": "€"},
+        [1, 2, {"a": 3}],
+        "text",
+        42,
+    ],
+)
+def test_decode_matches_json_loads(value, chunk):
+    payload = json.dumps(value, ensure_ascii=False, indent=1).encode()
+    assert _decode(payload, chunk) == value
+
+
+@pytest.mark.parametrize("chunk", [1, 5, 1 << 20])
+def test_nested_field_selection(chunk):
+    payload = json.dumps(PROFILE).encode()
+
+    result = _decode(payload, chunk, ["status", "data.user.name", "data.items"])
+
+    assert result == {
+        "status": "ok",
+        "data": {"user": {"name": "u1"}, "items": PROFILE["data"]["items"]},
+    }
+
+
+def test_shorter_path_wins():
+    assert parse_fields(["data.items", "data"]) == {"data": None}
+    assert parse_fields(["data", "data.items"]) == {"data": None}
+    assert parse_fields([]) is None
+    assert _decode(json.dumps(PROFILE).encode(), 3, ["data", "data.user"]) == {
+        "data": PROFILE["data"]
+    }
+
+
+@pytest.mark.parametrize(
+    ("fields", "expected"),
+    [(["data.key7"], {"data": {"key7": "x" * 50}}), (None, None)],
+)
+def test_envelope_is_not_buffered_whole(fields, expected):
+    body = {"status": "ok", "data": {f"key{i}": "x" * 50 for i in range(2000)}}
+    payload = json.dumps(body).encode()
+    decoder = StreamingJSONDecoder(fields)
+    peak = 0
+    for i in range(0, len(payload), 512):
+        decoder.feed(payload[i : i + 512])
+        peak = max(peak, len(decoder._buf) + decoder._pending_len)
+
+    assert decoder.close() == (expected or body)
+    assert peak < len(payload) / 20
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [b'{"a": 1', b'{"a": 1,}', b'{"a" 1}', b'{"a": 1} x', b'{"a": {"b": 1}', b"{"],
+)
+def test_invalid_json_raises(payload):
+    with pytest.raises(json.JSONDecodeError):
+        _decode(payload, 2)
+
+
+async def test_reader_limits_size_and_keeps_errors():
+    def response(body: bytes) -> httpx.Response:
+        return httpx.Response(
+            200,
+            stream=httpx.ByteStream(body),
+            request=httpx.Request("GET", "http://digipos.test/profile"),
+        )
+
+    reader = JSONStreamReader(fields=["data.user"])
+    await reader.read(response(json.dumps(PROFILE).encode()))
+    assert reader.value == {"data": {"user": PROFILE["data"]["user"]}}
+
+    reader = JSONStreamReader()
+    await reader.read(response(b'{"a": '))
+    assert reader.error is not None
+    assert reader.head == '{"a": '
+
+    with pytest.raises(ResponseTooLargeError):
+        await JSONStreamReader(max_bytes=10).read(
+            response(json.dumps(PROFILE).encode())
+        )
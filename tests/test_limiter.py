@@ -0,0 +1,104 @@
+"""AdaptiveLimiter: antrian, timeout, race grant/timeout dan AIMD."""
+
+import asyncio
+import time
+
+import pytest
+from src.core.client.limiter import AdaptiveLimiter
+from src.core.config.cfg_api_clients import ClientConcurrency
+from src.custom.exceptions import HTTPConnectionError, HttpResponseError
+
+
+def _limiter(limit: int = 1, **settings) -> AdaptiveLimiter:
+    config = ClientConcurrency(initial_limit=limit, **settings)
+    return AdaptiveLimiter("digipos", config, max_limit=10)
+
+
+async def _queued(limiter: AdaptiveLimiter, **kwargs) -> asyncio.Task:
+    task = asyncio.create_task(limiter.acquire("/balance", **kwargs))
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 1
+    return task
+
+
+async def test_queue_timeout_rejects_waiter():
+    limiter = _limiter(queue_timeout_s=0.01)
+    await limiter.acquire("/balance")
+
+    with pytest.raises(HTTPConnectionError, match="queue timeout"):
+        await limiter.acquire("/balance")
+
+    assert limiter.in_flight == 1
+    assert limiter.queue_depth == 0
+    assert limiter.stats.rejected == 1
+
+
+async def test_full_queue_rejects_immediately():
+    limiter = _limiter(max_queue=1)
+    await limiter.acquire("/balance")
+    waiter = await _queued(limiter)
+
+    with pytest.raises(HTTPConnectionError, match="queue full"):
+        await limiter.acquire("/balance")
+
+    limiter.release(dropped=False, elapsed_s=0.0)
+    await waiter
+    assert limiter.in_flight == 1
+
+
+async def test_slot_granted_right_before_timeout_is_kept():
+    limiter = _limiter(queue_timeout_s=0.01)
+    await limiter.acquire("/balance")
+    waiter = await _queued(limiter)
+
+    # release dan timeout jatuh di iterasi loop yang sama, release lebih dulu
+    asyncio.get_running_loop().call_later(0.001, limiter.release, False, 0.0)
+    time.sleep(0.02)
+    await waiter
+
+    assert limiter.in_flight == 1
+    limiter.release(dropped=False, elapsed_s=0.0)
+    assert limiter.in_flight == 0
+    assert limiter.stats.rejected == 0
+
+
+async def test_granted_slot_is_returned_when_waiter_is_cancelled():
+    limiter = _limiter(limit=1)
+    await limiter.acquire("/balance")
+    waiter = await _queued(limiter)
+
+    limiter.release(dropped=False, elapsed_s=0.0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert limiter.in_flight == 0
+
+
+def test_limit_grows_additively_and_backs_off_multiplicatively():
+    limiter = _limiter(limit=4, min_limit=2, target_latency_s=1.0, backoff_ratio=0.5)
+
+    limiter.in_flight = 1
+    limiter.release(dropped=False, elapsed_s=0.5)
+    assert limiter.limit == pytest.approx(4.25)
+
+    limiter.in_flight = 1
+    limiter.release(dropped=False, elapsed_s=2.0)
+    assert limiter.limit == pytest.approx(4.25)
+
+    for _ in range(3):
+        limiter.in_flight = 1
+        limiter.release(dropped=True, elapsed_s=0.1)
+    assert limiter.limit == 2
+    assert limiter.stats.drops == 3
+
+
+async def test_slot_counts_429_as_drop():
+    limiter = _limiter(limit=4, backoff_ratio=0.5)
+
+    with pytest.raises(HttpResponseError):
+        async with limiter.slot("/balance"):
+            raise HttpResponseError(message="throttled", context={"status_code": 429})
+
+    assert limiter.limit == 2
+    assert limiter.in_flight == 0
@@ -0,0 +1,87 @@
+"""LoggingMiddleware: X-Process-Time, error & request lambat selalu di-log."""
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from loguru import logger
+from src.core.config.settings import AccessLogSettings
+from src.custom.middlewares import LoggingMiddleware
+
+
+@pytest.fixture
+def access_logs():
+    records: list[tuple[str, int, str]] = []
+
+    def _sink(message) -> None:
+        record = message.record
+        if record["extra"].get("service") == "Access Log":
+            extra = record["extra"]
+            records.append((record["level"].name, extra["status_code"], extra["path"]))
+
+    sink = logger.add(_sink, level="DEBUG")
+    yield records
+    logger.remove(sink)
+
+
+def _client(**config) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(LoggingMiddleware, config=AccessLogSettings(**config))
+
+    @app.get("/ok")
+    async def _ok():
+        return {"ok": True}
+
+    @app.get("/slow")
+    async def _slow():
+        await asyncio.sleep(0.02)
+        return {"ok": True}
+
+    @app.get("/missing")
+    async def _missing():
+        raise HTTPException(404)
+
+    @app.get("/boom")
+    async def _boom():
+        raise RuntimeError("boom")
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+def test_every_response_has_process_time_header():
+    client = _client(sample_rate=0)
+
+    for path in ("/ok", "/missing", "/unknown"):
+        assert float(client.get(path).headers["x-process-time"]) >= 0
+
+
+def test_default_logs_every_request_once(access_logs):
+    client = _client()
+
+    client.get("/ok")
+    client.get("/missing")
+
+    assert access_logs == [("INFO", 200, "/ok"), ("WARNING", 404, "/missing")]
+
+
+def test_sampling_never_drops_errors_or_slow_requests(access_logs):
+    client = _client(sample_rate=0, slow_ms=10)
+
+    for path in ("/ok", "/slow", "/missing", "/boom"):
+        client.get(path)
+
+    assert access_logs == [
+        ("WARNING", 200, "/slow"),
+        ("WARNING", 404, "/missing"),
+        ("ERROR", 500, "/boom"),
+    ]
+
+
+def test_route_sample_rate_overrides_default(access_logs):
+    client = _client(sample_rate=1, route_sample_rate={"/ok": 0})
+
+    client.get("/ok")
+    client.get("/slow")
+
+    assert access_logs == [("INFO", 200, "/slow")]
@@ -0,0 +1,95 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.api.v1.fastlane import mount_fast_lane
+from src.core.config.cfg_api_clients import DigiposConfig
+from src.custom.exceptions import AppExceptionError
+from src.custom.negotiation import negotiator
+
+from api.v1.dgp_account import router
+from servicess.digipos.sch_digipos import DGResBalance
+
+
+class FakeCommand:
+    async def balance(self, _data):
+        return DGResBalance(ngrs={"saldo": "1000"}, linkaja="0", finpay="5")
+
+
+def _client(fast_lane: bool) -> TestClient:
+    app = FastAPI()
+    app.include_router(router)
+    app.add_exception_handler(
+        AppExceptionError,
+        lambda _request, exc: negotiator.render(exc, None, status_code=exc.status_code),
+    )
+    if fast_lane:
+        mount_fast_lane(app, ["balance"])
+    app.state.settings = SimpleNamespace(
+        digipos=DigiposConfig(
+            name="digipos",
+            base_url="http://digipos.test",
+            accounts=[{"username": "u", "password": "x", "pin": "1"}],
+        )
+    )
+    app.state.services = SimpleNamespace(digipos=SimpleNamespace(command=FakeCommand()))
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("fast_lane", [False, True])
+def test_unsupported_format_is_not_acceptable(fast_lane):
+    client = _client(fast_lane)
+
+    resp = client.get(
+        f"{router.prefix}/balance", params={"username": "u", "format": "xml"}
+    )
+    assert resp.status_code == 406
+
+    resp = client.get(
+        f"{router.prefix}/balance", params={"username": "u", "format": "JSON"}
+    )
+    assert resp.status_code == 200
+
+
+TEXT = "ngrs={saldo=1000}&linkaja=0&finpay=5"
+
+
+def _balance(fast_lane: bool, headers=None, **params):
+    client = _client(fast_lane)
+    return client.get(
+        f"{router.prefix}/balance",
+        params={"username": "u", **params},
+        headers=headers or {},
+    )
+
+
+@pytest.mark.parametrize("fast_lane", [False, True])
+@pytest.mark.parametrize(
+    "headers", [{}, {"Accept": "*/*"}, {"Accept": "application/json"}]
+)
+def test_text_balance_keeps_json_string_shape(fast_lane, headers):
+    # bentuk lama Otomax: plaintext sebagai JSON string
+    resp = _balance(fast_lane, headers)
+
+    assert resp.headers["content-type"] == "application/json"
+    assert resp.json() == TEXT
+
+
+@pytest.mark.parametrize("fast_lane", [False, True])
+@pytest.mark.parametrize(
+    ("headers", "params"),
+    [({"Accept": "text/plain"}, {}), ({}, {"format": "text"})],
+)
+def test_raw_text_balance_is_opt_in(fast_lane, headers, params):
+    resp = _balance(fast_lane, headers, **params)
+
+    assert resp.headers["content-type"].startswith("text/plain")
+    assert resp.text == TEXT
+
+
+@pytest.mark.parametrize("fast_lane", [False, True])
+def test_text_false_returns_model(fast_lane):
+    resp = _balance(fast_lane, text="false")
+
+    assert resp.json() == {"ngrs": {"saldo": "1000"}, "linkaja": "0", "finpay": "5"}
@@ -0,0 +1,106 @@
+"""OutputModelRegistry: output sama dengan validasi penuh lama, spec di-cache."""
+
+import pytest
+from pydantic import BaseModel
+from src.custom.exceptions import HttpResponseError
+
+from servicess.client.depre_cated_response_model import (
+    ApiErrorParsing,
+    ApiResponseOUT,
+    CleanAndParseStatus,
+)
+from servicess.client.model import ApiResponseIN
+from servicess.digipos.sch_digipos import DGResBalance
+from servicess.parser.parser_utils import clean_validate_raw_dict_data
+from servicess.parser.registry import OutputModelRegistry
+
+BALANCE = {"ngrs": {"saldo": "1000"}, "linkaja": "2", "finpay": "3"}
+
+
+def _raw(raw_data, meta=None) -> ApiResponseIN:
+    return ApiResponseIN(
+        status_code=200,
+        url="http://digipos.test/balance",
+        path="/balance",
+        raw_data=raw_data,
+        meta=meta or {"with_meta": False},
+        debug=False,
+    )
+
+
+def legacy_output(raw: ApiResponseIN, target: type[BaseModel] | None):
+    """Salinan `clean_validate_raw_dict_data` sebelum registry (validasi penuh)."""
+
+    def build(data, parse, description):
+        return ApiResponseOUT[target | ApiErrorParsing](
+            status_code=raw.status_code,
+            url=raw.url,
+            path=raw.path,
+            debug=raw.debug,
+            meta=raw.meta.copy() if raw.meta else None,
+            parse=parse,
+            data=data,
+            description=description,
+        )
+
+    if target is None:
+        return build(
+            ApiErrorParsing(data=raw.raw_data),
+            CleanAndParseStatus.SKIPPED,
+            "No parser model provided",
+        )
+    try:
+        data = target.model_validate(raw.raw_data)
+        return build(data, CleanAndParseStatus.SUCCESS, "Data berhasil di-parse")
+    except ValueError as e:
+        return build(
+            ApiErrorParsing(data=raw.raw_data),
+            CleanAndParseStatus.ERROR,
+            f"Validation failed {e}",
+        )
+
+
+@pytest.mark.parametrize(
+    ("raw", "target"),
+    [
+        (_raw(BALANCE), DGResBalance),
+        (_raw(BALANCE, meta={"cache": {"hit": True}, "with_meta": True}), DGResBalance),
+        (_raw({"ngrs": "bukan dict"}), DGResBalance),
+        (_raw(BALANCE), None),
+    ],
+)
+def test_output_matches_full_validation(raw, target):
+    output = clean_validate_raw_dict_data(raw, target)
+    expected = legacy_output(raw, target)
+
+    assert output.model_dump() == expected.model_dump()
+    assert output.model_dump_json() == expected.model_dump_json()
+
+
+def test_meta_is_copied_not_shared():
+    raw = _raw(BALANCE, meta={"with_meta": False})
+
+    output = clean_validate_raw_dict_data(raw, DGResBalance)
+    output.meta["cache"] = {"hit": True}
+
+    assert raw.meta == {"with_meta": False}
+
+
+def test_validation_error_can_raise():
+    with pytest.raises(HttpResponseError, match="Validation failed"):
+        clean_validate_raw_dict_data(
+            _raw({"ngrs": "x"}), DGResBalance, auto_wrap_error=False
+        )
+
+
+def test_specs_are_built_once_per_target():
+    registry = OutputModelRegistry()
+    registry.register(DGResBalance)
+
+    spec = registry.get(DGResBalance)
+    assert registry.get(DGResBalance) is spec
+    assert spec.model is ApiResponseOUT[DGResBalance | ApiErrorParsing]
+    assert registry.registered() == ["DGResBalance"]
+
+    with pytest.raises(TypeError):
+        registry.get(None).validate(BALANCE)
@@ -0,0 +1,91 @@
+"""PlaintextRenderer: output sama dengan `dict_to_plaintext(model_dump())` lama."""
+
+import pytest
+from pydantic import BaseModel, ConfigDict, Field
+
+from servicess.client.depre_cated_response_model import (
+    ApiErrorParsing,
+    ApiResponseOUT,
+    CleanAndParseStatus,
+)
+from servicess.digipos.sch_digipos import DGResBalance
+from servicess.parser.plaintext import PlaintextRenderer
+
+
+def legacy_plaintext(data: dict) -> str:
+    """Salinan `dict_to_plaintext` sebelum PlaintextRenderer."""
+    parts = []
+    for key, value in data.items():
+        if isinstance(value, dict):
+            parts.append(f"{key}={{{legacy_plaintext(value)}}}")
+        elif isinstance(value, bool):
+            parts.append(f"{key}={str(value).lower()}")
+        else:
+            parts.append(f"{key}={value!s}")
+    return "&".join(parts).replace(" ", "")
+
+
+def _balance(data: BaseModel, **meta) -> ApiResponseOUT:
+    return ApiResponseOUT[DGResBalance | ApiErrorParsing](
+        status_code=200,
+        url="http://digipos.test/balance",
+        path="/balance",
+        debug=False,
+        meta=meta or None,
+        parse=CleanAndParseStatus.SUCCESS,
+        data=data,
+        description=None,
+    )
+
+
+BALANCE = DGResBalance(ngrs={"saldo": "1 000", "bonus": "0"}, linkaja="2.5", finpay="3")
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        BALANCE,
+        _balance(BALANCE),
+        _balance(BALANCE, cache={"hit": True, "age_s": 1.25}, elapsed=0.3),
+        _balance(ApiErrorParsing(data={"error": "akun tidak aktif", "code": 7})),
+    ],
+)
+def test_render_matches_legacy_output(model):
+    assert PlaintextRenderer().render(model) == legacy_plaintext(model.model_dump())
+
+
+def test_render_dict_matches_legacy_output():
+    data = {"a b": "x y", "ok": False, "none": None, "n": {"x": 1, "f": 1.5}}
+    assert PlaintextRenderer().render(data) == legacy_plaintext(data)
+
+
+class _Visible(BaseModel):
+    value: str
+
+
+class _Hidden(BaseModel):
+    value: str
+    secret: str = Field(default="s", exclude=True)
+
+
+class _Extra(BaseModel):
+    model_config = ConfigDict(extra="allow")
+
+    value: str
+
+
+@pytest.mark.parametrize(
+    "model", [_Visible(value="v"), _Hidden(value="v"), _Extra(value="v", more=True)]
+)
+def test_excluded_and_extra_fields_match_model_dump(model):
+    assert PlaintextRenderer().render(model) == legacy_plaintext(model.model_dump())
+
+
+def test_changing_meta_is_rendered_fresh():
+    renderer = PlaintextRenderer()
+
+    first = renderer.render(_balance(BALANCE, cache={"age_s": 1.0}))
+    second = renderer.render(_balance(BALANCE, cache={"age_s": 2.0}))
+
+    assert "age_s=1.0" in first
+    assert "age_s=2.0" in second
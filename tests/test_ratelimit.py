@@ -0,0 +1,89 @@
+"""AccountRateLimiter: header reset delta/epoch dan batas blok."""
+
+from time import time
+
+import httpx
+import pytest
+from src.core.client.base_manager import HttpClientManager
+from src.core.client.ratelimit import AccountRateLimiter
+from src.core.config.cfg_api_clients import ApiBaseConfig, ClientRateLimit
+from src.custom.exceptions import RateLimitExceededError
+
+
+def _limiter(**settings) -> AccountRateLimiter:
+    return AccountRateLimiter("digipos", ClientRateLimit(**settings))
+
+
+def _observe(limiter: AccountRateLimiter, status_code: int = 200, **headers) -> None:
+    limiter.observe("u1", "balance", status_code, httpx.Headers(headers))
+
+
+def _retry_in(limiter: AccountRateLimiter) -> float:
+    bucket = limiter.bucket("u1", "balance")
+    wait = bucket.reserve()
+    bucket.refund()
+    return wait
+
+
+def _reset(seconds: float, epoch: bool) -> str:
+    return str(time() + seconds if epoch else seconds)
+
+
+@pytest.mark.parametrize("epoch", [False, True])
+def test_exhausted_quota_blocks_until_reset(epoch):
+    limiter = _limiter(default_rate_per_s=1.0)
+
+    _observe(
+        limiter,
+        **{"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": _reset(20, epoch)},
+    )
+
+    assert 18 < _retry_in(limiter) <= 21
+
+
+@pytest.mark.parametrize("epoch", [False, True])
+def test_remaining_quota_spreads_over_reset(epoch):
+    limiter = _limiter(default_rate_per_s=5.0)
+
+    _observe(
+        limiter,
+        **{"RateLimit-Remaining": "20", "RateLimit-Reset": _reset(10, epoch)},
+    )
+
+    assert limiter.bucket("u1", "balance").rate == pytest.approx(2.0, rel=0.1)
+
+
+def test_block_is_capped():
+    limiter = _limiter(default_rate_per_s=1.0, max_block_s=30)
+
+    _observe(
+        limiter,
+        **{"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": str(time() + 86400)},
+    )
+    assert _retry_in(limiter) <= 31
+
+    limiter = _limiter(default_rate_per_s=1.0, max_block_s=30)
+    _observe(limiter, status_code=429, **{"Retry-After": "3600"})
+    # blok 30s + jarak 1 token pada rate yang sudah dipotong ke 0.5/s
+    assert _retry_in(limiter) <= 32
+
+
+async def test_blocked_account_is_rejected_past_queue_timeout():
+    limiter = _limiter(default_rate_per_s=1.0, queue_timeout_s=1.0)
+    _observe(limiter, status_code=429, **{"Retry-After": "10"})
+
+    with pytest.raises(RateLimitExceededError):
+        await limiter.acquire("u1", "balance")
+
+
+def test_rate_limiter_is_opt_in():
+    config = {"name": "digipos", "base_url": "http://digipos.invalid"}
+    manager = HttpClientManager()
+
+    manager.setup_client(ApiBaseConfig(**config))
+    assert manager.get_rate_limiter("digipos") is None
+
+    manager.setup_client(
+        ApiBaseConfig(**{**config, "name": "other"}, rate_limit={"enabled": True})
+    )
+    assert isinstance(manager.get_rate_limiter("other"), AccountRateLimiter)
@@ -0,0 +1,86 @@
+"""json_dumps / FastJSONResponse: output sama dengan JSONResponse bawaan FastAPI."""
+
+import json
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from enum import StrEnum
+
+import pytest
+from fastapi import FastAPI
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from src.custom.responses import FastJSONResponse, json_dumps
+
+from servicess.digipos.sch_digipos import DGResBalance
+
+
+class _State(StrEnum):
+    OK = "ok"
+
+
+class _Nested(BaseModel):
+    when: datetime
+    state: _State
+    tags: list[str] = []
+
+
+@dataclass
+class _Point:
+    x: int
+    y: float
+
+
+NOW = datetime(2025, 1, 2, 3, 4, 5, tzinfo=UTC)
+
+
+def _baseline(content) -> bytes:
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        {"saldo": "1 000", "ok": True, "none": None, "n": [1, 2.5, "Ü€"]},
+        [],
+        "text",
+        DGResBalance(ngrs={"saldo": "1000"}, linkaja="2", finpay="3"),
+        _Nested(when=NOW, state=_State.OK, tags=["a"]),
+        {"items": [_Nested(when=NOW, state=_State.OK)], "point": _Point(1, 2.5)},
+    ],
+)
+def test_output_matches_default_json_response(content):
+    assert json.loads(json_dumps(content)) == json.loads(_baseline(content))
+
+
+def test_output_is_compact_utf8():
+    assert json_dumps({"a": "Ü", "b": [1, 2]}) == '{"a":"Ü","b":[1,2]}'.encode()
+
+
+def test_unknown_objects_fall_back_to_str():
+    class Opaque:
+        def __str__(self) -> str:
+            return "opaque"
+
+    assert json.loads(json_dumps({"context": Opaque()})) == {"context": "opaque"}
+
+
+def test_default_response_class_renders_with_json_dumps():
+    app = FastAPI(default_response_class=FastJSONResponse)
+    content = {"when": NOW, "state": _State.OK}
+    model = _Nested(when=NOW, state=_State.OK)
+
+    @app.get("/dict")
+    async def _dict():
+        return content
+
+    @app.get("/model")
+    async def _model():
+        return FastJSONResponse(model)
+
+    client = TestClient(app)
+    for path, expected in (("/dict", content), ("/model", model)):
+        resp = client.get(path)
+        assert resp.headers["content-type"] == "application/json"
+        assert resp.json() == json.loads(_baseline(expected))
@@ -0,0 +1,115 @@
+"""AdaptiveTimeout & override timeout per command."""
+
+import asyncio
+
+import httpx
+import pytest
+from src.core.client.base_manager import HttpClientManager
+from src.core.client.timeouts import AdaptiveTimeout
+from src.core.config.cfg_api_clients import ApiBaseConfig, ClientTimeout, DigiposConfig
+from src.custom.exceptions import HTTPConnectionError
+
+from servicess.client.request import HttpRequestService
+from servicess.client.response import ResponseHandlerFactory
+
+
+def _timeouts(**settings) -> AdaptiveTimeout:
+    config = {"adaptive": True, "min_samples": 10, "adaptive_min_s": 0.1, **settings}
+    return AdaptiveTimeout("digipos", ClientTimeout(**config))
+
+
+def _feed(timeouts: AdaptiveTimeout, elapsed_s: float, n: int = 10, **kw) -> None:
+    for _ in range(n):
+        timeouts.observe("/balance", elapsed_s, **kw)
+
+
+def test_configured_read_until_enough_samples():
+    timeouts = _timeouts()
+    _feed(timeouts, 0.2, n=9)
+
+    assert timeouts.read_timeout("/balance", 10.0) == 10.0
+
+
+def test_read_follows_quantile_within_bounds():
+    timeouts = _timeouts(adaptive_multiplier=2.0)
+    _feed(timeouts, 0.3)
+    assert timeouts.read_timeout("/balance", 10.0) == pytest.approx(0.6)
+    assert timeouts.read_timeout("/other", 10.0) == 10.0  # per endpoint
+
+    fast = _timeouts()
+    _feed(fast, 0.01)
+    assert fast.read_timeout("/balance", 10.0) == 0.1  # adaptive_min_s
+
+    slow = _timeouts()
+    _feed(slow, 8.0)
+    assert slow.read_timeout("/balance", 10.0) == 10.0  # tidak lewat config
+
+
+def test_apply_only_replaces_read():
+    timeouts = _timeouts()
+    _feed(timeouts, 0.3)
+    base = httpx.Timeout(10.0, connect=2.0)
+
+    applied = timeouts.apply("/balance", base)
+
+    assert applied.read == pytest.approx(0.6)
+    assert (applied.connect, applied.write, applied.pool) == (2.0, 10.0, 10.0)
+    assert timeouts.apply("/other", base) is base
+
+
+async def test_read_timeouts_are_recorded_and_lift_the_timeout():
+    seen: list[dict] = []
+    slow = False
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.extensions["timeout"])
+        if slow:
+            await asyncio.sleep(request.extensions["timeout"]["read"])
+            raise httpx.ReadTimeout("slow", request=request)
+        return httpx.Response(200, json={})
+
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(handler), base_url="http://digipos.test"
+    )
+    timeouts = _timeouts(window_size=10, adaptive_quantile=0.5)
+    service = HttpRequestService(client, ResponseHandlerFactory(), timeouts=timeouts)
+
+    for _ in range(10):
+        await service.safe_request("GET", "/balance")
+    assert seen[-1]["read"] == 5.0  # belum cukup sample saat request terakhir
+    await service.safe_request("GET", "/balance")
+    assert seen[-1]["read"] < 1.0
+
+    slow = True
+    for _ in range(10):
+        with pytest.raises(HTTPConnectionError):
+            await service.safe_request("GET", "/balance")
+    assert timeouts.timeouts == 10
+    assert timeouts.read_timeout("/balance", 5.0) > seen[10]["read"]
+
+
+def test_adaptive_timeout_is_opt_in():
+    config = {"name": "digipos", "base_url": "http://digipos.invalid"}
+    manager = HttpClientManager()
+
+    manager.setup_client(ApiBaseConfig(**config))
+    assert manager.get_timeouts("digipos") is None
+
+    manager.setup_client(
+        ApiBaseConfig(**{**config, "name": "other"}, timeout={"adaptive": True})
+    )
+    assert isinstance(manager.get_timeouts("other"), AdaptiveTimeout)
+
+
+def test_endpoint_override_merges_with_client_timeout():
+    config = DigiposConfig(
+        name="digipos",
+        base_url="http://digipos.test",
+        timeout={"connect": 4, "read": 12},
+        endpoints={"timeouts": {"balance": {"read": 3}}},
+        accounts=[{"username": "u", "password": "x", "pin": "1"}],
+    )
+
+    balance = config.timeout_for("balance")
+    assert (balance.connect, balance.read) == (4, 3)
+    assert config.timeout_for("profile") is config.timeout
@@ -0,0 +1,95 @@
+"""Pool transport: `limits.max_connections` benar-benar membatasi koneksi."""
+
+import asyncio
+
+import httpx
+from httpx_retries import Retry
+from src.config.client_config import ClientBaseConfig
+from src.core.client.transport import (
+    BudgetedRetryTransport,
+    RetryBudget,
+    build_transport_stack,
+)
+
+
+class SlowServer:
+    """HTTP/1.1 server lokal yang mencatat koneksi & request bersamaan."""
+
+    def __init__(self, delay_s: float = 0.05) -> None:
+        self.delay_s = delay_s
+        self.connections = 0
+        self.peak_requests = 0
+        self._active = 0
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def __aenter__(self) -> "SlowServer":
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer) -> None:
+        self.connections += 1
+        try:
+            while await reader.readuntil(b"\r\n\r\n"):
+                self._active += 1
+                self.peak_requests = max(self.peak_requests, self._active)
+                await asyncio.sleep(self.delay_s)
+                self._active -= 1
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\ncontent-length: 2\r\n"
+                    b"content-type: application/json\r\n\r\n{}"
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+async def test_max_connections_is_enforced():
+    max_connections = 3
+    async with SlowServer() as server:
+        config = ClientBaseConfig(
+            name="limits",
+            base_url=server.url,
+            limits={"max_connections": max_connections},
+            retry={"total": 0},
+        )
+        stack = build_transport_stack(config)
+        async with httpx.AsyncClient(
+            transport=stack, base_url=server.url, timeout=10
+        ) as client:
+            responses = await asyncio.gather(*(client.get("/") for _ in range(20)))
+            pool = stack.pool_info()
+
+    assert all(resp.status_code == 200 for resp in responses)
+    assert server.peak_requests <= max_connections
+    assert server.connections <= max_connections
+    assert pool["max_connections"] == max_connections
+    assert pool["connections"] <= max_connections
+
+
+async def test_throttled_response_does_not_refill_retry_budget():
+    budget = RetryBudget(ratio=0.5, max_tokens=5)
+    budget.tokens = 1
+    statuses = iter([429, 404, 200])
+    transport = BudgetedRetryTransport(
+        httpx.MockTransport(lambda _request: httpx.Response(next(statuses))),
+        Retry(total=2, status_forcelist=[502, 503]),
+        budget,
+    )
+    async with httpx.AsyncClient(transport=transport) as client:
+        assert (await client.get("http://upstream.test/")).status_code == 429
+        assert budget.tokens == 1
+        assert (await client.get("http://upstream.test/")).status_code == 404
+        assert budget.tokens == 1
+        assert (await client.get("http://upstream.test/")).status_code == 200
+        assert budget.tokens == 1.5
@@ -0,0 +1,45 @@
+import httpx
+from loguru import logger
+from src.core.client.cache import estimate_size
+
+from servicess.client.response import HttpResponseService
+from servicess.digipos.sch_digipos_typed import digipos_schema
+
+PROFILE = b'{"status":"ok","data":{"user":{"b":1,"a":2},"extra":1,"outlet":{}},"z":3}'
+
+
+def _parse(body: bytes, command: str):
+    resp = httpx.Response(
+        200,
+        content=body,
+        headers={"content-type": "application/json"},
+        request=httpx.Request("GET", "http://digipos.test/"),
+    )
+    return HttpResponseService(resp, schema=digipos_schema(command))
+
+
+def test_typed_model_keeps_upstream_key_order():
+    model = _parse(PROFILE, "profile")._try_parse_typed()
+
+    assert model is not None
+    assert model.__pydantic_serializer__.to_json(model) == PROFILE
+    assert list(model.model_dump()) == ["status", "data", "z"]
+
+
+def test_estimate_size_measures_model_fields():
+    model = _parse(PROFILE, "profile")._try_parse_typed()
+
+    assert estimate_size(model) == len(PROFILE)
+
+
+def test_schema_drift_is_warned_once():
+    levels: list[str] = []
+    sink = logger.add(lambda m: levels.append(m.record["level"].name), level="DEBUG")
+    try:
+        for _ in range(3):
+            assert _parse(b'{"error":"x"}', "sim_status")._try_parse_typed() is None
+    finally:
+        logger.remove(sink)
+
+    assert levels.count("WARNING") == 1
+    assert levels.count("DEBUG") == 2